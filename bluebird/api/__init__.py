@@ -11,6 +11,7 @@ from flask_cors import CORS
 from flask_restful import Api
 
 from bluebird.api import resources as res
+from bluebird.api.resources.utils.responses import MSGPACK_MIMETYPE
 from bluebird.settings import Settings
 
 
@@ -66,6 +67,15 @@ def before_req():
 def after_req(response):
     """Method called before any response is returned"""
 
+    # NOTE Accessing the data of a streamed response would consume the stream
+    if response.is_streamed:
+        LOGGER.info(f"RESP {response.status_code} <{response.mimetype} stream>")
+        return response
+
+    if response.mimetype == MSGPACK_MIMETYPE:
+        LOGGER.info(f"RESP {response.status_code} <{len(response.data)} bytes msgpack>")
+        return response
+
     json = response.get_json()
     if not json:
         json = response.data.decode()
@@ -89,11 +99,13 @@ def after_req(response):
 
 # Aircraft control
 FLASK_API.add_resource(res.Alt, "/alt")
+FLASK_API.add_resource(res.Batch, "/batch")
 FLASK_API.add_resource(res.Cre, "/cre")
 FLASK_API.add_resource(res.Direct, "/direct")
 FLASK_API.add_resource(res.Gspd, "/gspd")
 FLASK_API.add_resource(res.Hdg, "/hdg")
 FLASK_API.add_resource(res.ListRoute, "/listroute")
+FLASK_API.add_resource(res.Obs, "/obs")
 FLASK_API.add_resource(res.Pos, "/pos")
 
 # Simulation control
@@ -108,13 +120,17 @@ FLASK_API.add_resource(res.Scenario, "/scenario")
 FLASK_API.add_resource(res.Sector, "/sector")
 FLASK_API.add_resource(res.Seed, "/seed")
 FLASK_API.add_resource(res.Step, "/step")
+FLASK_API.add_resource(res.VecStep, "/vecstep")
 
 # Application control
 # FLASK_API.add_resource(res.EpInfo, '/epinfo')
 FLASK_API.add_resource(res.EpLog, "/eplog")
 FLASK_API.add_resource(res.SimInfo, "/siminfo")
+FLASK_API.add_resource(res.SimStreams, "/simstreams")
 FLASK_API.add_resource(res.Shutdown, "/shutdown")
+FLASK_API.add_resource(res.Stream, "/stream")
 
 # Metrics
 FLASK_API.add_resource(res.Metric, "/metric")
+FLASK_API.add_resource(res.MetricBulk, "/metricbulk")
 FLASK_API.add_resource(res.MetricProviders, "/metricproviders")
@@ -0,0 +1,149 @@
+"""
+Provides an ASGI adapter for serving the BlueBird API with an async server
+"""
+import asyncio
+import contextlib
+import threading
+from typing import AsyncIterable
+from typing import Callable
+from typing import Optional
+from typing import Union
+
+
+# Environ key of the function which stops the server. Equivalent to the
+# "werkzeug.server.shutdown" function provided by the Flask development server
+SHUTDOWN_KEY = "bluebird.server.shutdown"
+
+# ASGI scope key of an async iterable, which is sent as the response body from the event
+# loop. Set with set_async_body
+ASYNC_BODY_KEY = "bluebird.async_body"
+
+
+def set_async_body(environ: dict, body: AsyncIterable[Union[str, bytes]]) -> bool:
+    """
+    Sets the async response body for the request. Returns False if this isn't supported,
+    i.e. if not using the async server with a2wsgi, which adds the ASGI scope to the
+    environ
+    """
+    scope = environ.get("asgi.scope")
+    if scope is None:
+        return False
+    scope[ASYNC_BODY_KEY] = body
+    return True
+
+
+class AsgiAdapter:
+    """
+    Wraps a WSGI app (i.e. the Flask app) with uvicorn's WSGI middleware, which runs
+    each request on a bounded thread pool. Adds the SHUTDOWN_KEY function to the
+    environ, and sends any ASYNC_BODY_KEY body itself. The middleware reads a streamed
+    WSGI response on a worker thread until the response ends - even after the client
+    disconnects - so an endless response (i.e. STREAM) would hold the thread forever
+    """
+
+    def __init__(
+        self,
+        wsgi_app: Callable,
+        max_workers: int,
+        shutdown_fn: Optional[Callable[[], None]] = None,
+    ):
+        # NOTE uvicorn is only required when the async server is enabled
+        from uvicorn.middleware.wsgi import WSGIMiddleware
+
+        self._wsgi_app = wsgi_app
+        self._shutdown_fn = shutdown_fn
+        self._middleware = WSGIMiddleware(self._run_wsgi_app, workers=max_workers)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self._middleware(scope, receive, send)
+            return
+
+        async def send_wsgi(message):
+            # NOTE The WSGI body is empty if an async body is set
+            if message["type"] == "http.response.start" or ASYNC_BODY_KEY not in scope:
+                await send(message)
+
+        await self._middleware(scope, receive, send_wsgi)
+        async_body = scope.get(ASYNC_BODY_KEY)
+        if async_body is not None:
+            await _send_async_body(async_body, receive, send)
+
+    def shutdown(self):
+        """Stops the thread pool once any running requests are complete"""
+        self._middleware.executor.shutdown(wait=True)
+
+    def _run_wsgi_app(self, environ: dict, start_response: Callable):
+        if self._shutdown_fn:
+            environ[SHUTDOWN_KEY] = self._shutdown_fn
+        return self._wsgi_app(environ, start_response)
+
+
+async def _wait_for_disconnect(receive):
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def _send_async_body(
+    body: AsyncIterable[Union[str, bytes]], receive, send
+) -> None:
+    """Sends each chunk of the body until it ends or the client disconnects"""
+
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+    chunks = body.__aiter__()
+    next_chunk = None
+    try:
+        while True:
+            next_chunk = asyncio.ensure_future(chunks.__anext__())
+            await asyncio.wait(
+                {next_chunk, disconnected}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not next_chunk.done():
+                return
+            try:
+                chunk = next_chunk.result()
+            except StopAsyncIteration:
+                break
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        disconnected.cancel()
+        if next_chunk and not next_chunk.done():
+            next_chunk.cancel()
+            with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                await next_chunk
+        if hasattr(chunks, "aclose"):
+            await chunks.aclose()
+
+
+class AsgiServer:
+    """Runs the ASGI adapter with uvicorn in a background thread"""
+
+    def __init__(self, wsgi_app: Callable, host: str, port: int, max_workers: int):
+        # NOTE uvicorn is only required when the async server is enabled
+        import uvicorn
+
+        self._adapter = AsgiAdapter(wsgi_app, max_workers, self._request_exit)
+        self._server = uvicorn.Server(
+            uvicorn.Config(self._adapter, host=host, port=port, log_config=None)
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> threading.Thread:
+        """Starts the server thread"""
+        self._thread = threading.Thread(target=self._server.run, name="bluebird-asgi")
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """Signals the server to exit, and waits for it to stop"""
+        self._request_exit()
+        if self._thread:
+            self._thread.join()
+        self._adapter.shutdown()
+
+    def _request_exit(self):
+        """Signals the server to exit once any running requests are complete"""
+        self._server.should_exit = True
@@ -2,6 +2,7 @@
 Package provides logic for the simulation API endpoints
 """
 from .alt import Alt
+from .batch import Batch
 from .cre import Cre
 from .direct import Direct
 from .dtmult import DtMult
@@ -13,7 +14,9 @@ from .hold import Hold
 from .listroute import ListRoute
 from .loadlog import LoadLog
 from .metrics import Metric
+from .metrics import MetricBulk
 from .metrics import MetricProviders
+from .obs import Obs
 from .op import Op
 from .pos import Pos
 from .reset import Reset
@@ -22,17 +25,22 @@ from .sector import Sector
 from .seed import Seed
 from .shutdown import Shutdown
 from .siminfo import SimInfo
+from .simstreams import SimStreams
 from .step import Step
+from .stream import Stream
+from .vecstep import VecStep
 
 # Keep flake8 happy :)
 __all__ = [
     "AddWpt",
     "Alt",
+    "Batch",
     "Cre",
     "Direct",
     "Gspd",
     "Hdg",
     "ListRoute",
+    "Obs",
     "Pos",
     "DtMult",
     "Hold",
@@ -43,10 +51,14 @@ __all__ = [
     "Sector",
     "Seed",
     "Step",
+    "VecStep",
     "EpInfo",
     "EpLog",
     "SimInfo",
+    "SimStreams",
     "Shutdown",
+    "Stream",
     "Metric",
+    "MetricBulk",
     "MetricProviders",
 ]
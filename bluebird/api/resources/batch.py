@@ -0,0 +1,41 @@
+"""
+Provides logic for the BATCH API endpoint
+"""
+from flask_restful import reqparse
+from flask_restful import Resource
+
+import bluebird.api.resources.utils.responses as responses
+import bluebird.api.resources.utils.utils as utils
+from bluebird.utils.properties import AircraftCommand
+
+
+_PARSER = reqparse.RequestParser()
+_PARSER.add_argument(
+    "commands", type=dict, location="json", required=True, action="append"
+)
+
+
+class Batch(Resource):
+    """Contains logic for the BATCH endpoint"""
+
+    @staticmethod
+    def post():
+        """
+        Logic for POST events. Sends multiple aircraft commands to the simulator in a
+        single request. Returns the result of each command in the order they were given
+        """
+
+        req_args = utils.parse_args(_PARSER)
+
+        commands = []
+        for idx, data in enumerate(req_args["commands"]):
+            command = utils.parse_aircraft_command(data)
+            if not isinstance(command, AircraftCommand):
+                return responses.bad_request_resp(f"Command {idx}: {command}")
+            commands.append(command)
+
+        results = utils.sim_proxy().aircraft.send_commands(commands)
+        if not isinstance(results, list):
+            return responses.internal_err_resp(results)
+
+        return responses.ok_resp({"results": results})
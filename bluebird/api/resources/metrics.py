@@ -6,11 +6,13 @@ Logic for metric endpoints
 import logging
 import traceback
 
+from flask_restful import inputs
 from flask_restful import reqparse
 from flask_restful import Resource
 
 import bluebird.api.resources.utils.responses as responses
 import bluebird.api.resources.utils.utils as utils
+from bluebird.utils.types import Callsign
 
 
 _PARSER = reqparse.RequestParser()
@@ -18,6 +20,14 @@ _PARSER.add_argument("name", type=str, location="args", required=True)
 _PARSER.add_argument("args", type=str, location="args", required=False)
 _PARSER.add_argument("provider", type=str, location="args", required=False)
 
+_BULK_PARSER = reqparse.RequestParser()
+_BULK_PARSER.add_argument("name", type=str, location="args", required=True)
+_BULK_PARSER.add_argument("provider", type=str, location="args", required=False)
+_BULK_PARSER.add_argument(
+    "pairwise", type=inputs.boolean, location="args", required=False, default=False
+)
+_BULK_PARSER.add_argument("callsigns", type=str, location="args", required=False)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -60,7 +70,68 @@ class Metric(Resource):
         if isinstance(result, str):
             return responses.internal_err_resp(result)
 
-        return responses.ok_resp({metric_name: result})
+        data = {metric_name: result}
+        as_of = provider.as_of(metric_name)
+        if as_of is not None:
+            data["as_of"] = as_of
+
+        return responses.ok_resp(data)
+
+
+class MetricBulk(Resource):
+    """BlueBird bulk metrics endpoint"""
+
+    @staticmethod
+    def get():
+        """
+        Logic for GET events. Evaluates the given metric for each aircraft, or for each
+        pair of aircraft, in a single request
+        """
+
+        if not utils.sim_proxy().metrics_providers:
+            return responses.internal_err_resp("No metrics available")
+
+        req_args = utils.parse_args(_BULK_PARSER)
+        metric_name = req_args["name"]
+
+        if not metric_name:
+            return responses.bad_request_resp("Metric name must be specified")
+
+        provider_name = req_args["provider"] if req_args["provider"] else "BlueBird"
+        provider = utils.sim_proxy().metrics_providers.get(provider_name)
+        if not provider:
+            return responses.bad_request_resp(f'Provider "{provider_name}" not found')
+
+        callsigns = None
+        if req_args["callsigns"]:
+            try:
+                callsigns = [Callsign(x) for x in req_args["callsigns"].split(",")]
+            except AssertionError as exc:
+                return responses.bad_request_resp(str(exc))
+
+        try:
+            result = utils.sim_proxy().call_bulk_metric_function(
+                provider, metric_name, req_args["pairwise"], callsigns
+            )
+        except AttributeError:
+            return responses.not_found_resp(
+                f"Provider {str(provider)} (version {provider.version()}) has no "
+                f"metric named '{metric_name}'"
+            )
+        except Exception as exc:
+            return responses.bad_request_resp(
+                f"Metric function returned an error: {exc}\n{traceback.format_exc()}"
+            )
+
+        if isinstance(result, str):
+            return responses.internal_err_resp(result)
+
+        if isinstance(result, dict):
+            data = {str(callsign): value for callsign, value in result.items()}
+        else:
+            data = [[str(x), str(y), value] for x, y, value in result]
+
+        return responses.ok_resp({metric_name: data})
 
 
 class MetricProviders(Resource):
@@ -0,0 +1,108 @@
+"""
+Provides logic for the OBS (observation) API endpoint
+"""
+import numpy as np
+from flask import Response
+from flask_restful import inputs
+from flask_restful import reqparse
+from flask_restful import Resource
+
+import bluebird.api.resources.utils.responses as responses
+import bluebird.api.resources.utils.utils as utils
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from bluebird.utils.properties import SimProperties
+
+
+_PARSER = reqparse.RequestParser()
+_PARSER.add_argument("since", type=inputs.natural, location="args", required=False)
+
+# Increment if the format of the response changes
+SCHEMA_VERSION = 1
+
+# The columns of the observation tensor, as (name, AircraftArrays field, unit)
+COLUMNS = (
+    ("current_fl", "altitude", "ft"),
+    ("gs", "ground_speed", "m/s"),
+    ("hdg", "heading", "deg"),
+    ("lat", "lat", "deg"),
+    ("lon", "lon", "deg"),
+    ("vs", "vertical_speed", "ft/min"),
+)
+
+
+class Obs(Resource):
+    """OBS (observation) command"""
+
+    @staticmethod
+    def get():
+        """
+        Logic for GET events. Returns the state of all aircraft as a msgpack-encoded
+        tensor. Row i of the tensor always refers to the same aircraft until the
+        simulation is reset or a new scenario is loaded. If since is specified, then
+        only the rows which have changed since that data_version are returned
+        """
+
+        req_args = utils.parse_args(_PARSER)
+        since = req_args["since"]
+        sim_proxy = utils.sim_proxy()
+
+        sim_props = sim_proxy.simulation.properties
+        if not isinstance(sim_props, SimProperties):
+            return responses.internal_err_resp(sim_props)
+
+        if since is not None:
+            changes = utils.changes_since(sim_proxy, since)
+            if isinstance(changes, Response):
+                return changes
+            data_version, changed, removed = changes
+
+        ac_arrays = sim_proxy.aircraft.all_arrays
+        if not isinstance(ac_arrays, AircraftArrays):
+            return responses.internal_err_resp(
+                f"Couldn't get the aircraft properties: {ac_arrays}"
+            )
+
+        index = sim_proxy.aircraft.stable_index(ac_arrays)
+        row_callsigns = sorted(index, key=index.get)
+
+        if since is None:
+            data_version = sim_proxy.aircraft.data_version
+            rows = np.arange(len(index))
+        else:
+            # NOTE Removed aircraft may not be in the index if the simulation has been
+            # reset, in which case all of the current rows are included as changed
+            rows = np.array(
+                sorted({index[x] for x in [*changed, *removed] if x in index}),
+                dtype=int,
+            )
+
+        # NOTE Rows of aircraft which are no longer in the simulation are set to NaN
+        arrays_idx = {x: i for i, x in enumerate(ac_arrays.callsigns)}
+        src = np.array(
+            [arrays_idx.get(row_callsigns[x], -1) for x in rows], dtype=int
+        )
+        valid = src >= 0
+        data = np.full((len(rows), len(COLUMNS)), np.nan)
+        data[valid] = np.column_stack(
+            [getattr(ac_arrays, x).astype(float) for _, x, _ in COLUMNS]
+        ).reshape(len(ac_arrays.callsigns), len(COLUMNS))[src[valid]]
+        aircraft_type = [
+            ac_arrays.aircraft_type[x] if x >= 0 else "" for x in src.tolist()
+        ]
+
+        resp_data = {
+            "schema_version": SCHEMA_VERSION,
+            "scenario_time": sim_props.scenario_time,
+            "data_version": data_version,
+            "columns": [x for x, _, _ in COLUMNS],
+            "units": [x for _, _, x in COLUMNS],
+            "callsigns": [str(row_callsigns[x]) for x in rows],
+            "actype": aircraft_type,
+            "valid": valid,
+            "data": data,
+        }
+        if since is not None:
+            resp_data["rows"] = rows
+            resp_data["n_rows"] = len(index)
+
+        return responses.msgpack_resp(resp_data)
@@ -1,6 +1,8 @@
 """
 Provides logic for the POS (position) API endpoint
 """
+from flask import Response
+from flask_restful import inputs
 from flask_restful import reqparse
 from flask_restful import Resource
 
@@ -16,6 +18,7 @@ _PARSER = reqparse.RequestParser()
 _PARSER.add_argument(
     utils.CALLSIGN_LABEL, type=Callsign, location="args", required=False
 )
+_PARSER.add_argument("since", type=inputs.natural, location="args", required=False)
 
 
 class Pos(Resource):
@@ -27,6 +30,12 @@ class Pos(Resource):
 
         req_args = utils.parse_args(_PARSER)
         callsign = req_args[utils.CALLSIGN_LABEL]
+        since = req_args["since"]
+
+        if callsign and since is not None:
+            return responses.bad_request_resp(
+                "Can't specify both a callsign and since"
+            )
 
         sim_props = utils.sim_proxy().simulation.properties
         if not isinstance(sim_props, SimProperties):
@@ -48,6 +57,9 @@ class Pos(Resource):
 
         # else: get_all_properties
 
+        if since is not None:
+            return Pos._get_changes(since, sim_props)
+
         props = utils.sim_proxy().aircraft.all_properties
         if isinstance(props, str):
             return responses.internal_err_resp(
@@ -62,3 +74,33 @@ class Pos(Resource):
         data["scenario_time"] = sim_props.scenario_time
 
         return responses.ok_resp(data)
+
+    @staticmethod
+    def _get_changes(since: int, sim_props: SimProperties) -> Response:
+        """
+        Returns the properties of the aircraft which have changed since the given
+        data_version, and the callsigns of any which have been removed
+        """
+
+        sim_proxy = utils.sim_proxy()
+        changes = utils.changes_since(sim_proxy, since)
+        if isinstance(changes, Response):
+            return changes
+        version, changed, removed = changes
+
+        props = sim_proxy.aircraft.all_properties
+        if isinstance(props, str):
+            return responses.internal_err_resp(
+                f"Couldn't get the aircraft properties: {props}"
+            )
+
+        data = {}
+        for callsign in changed:
+            # NOTE Aircraft which have been created but have no data yet are skipped
+            if props.get(callsign):
+                data.update(utils.convert_aircraft_props(props[callsign]))
+        data["removed"] = [str(x) for x in removed]
+        data["data_version"] = version
+        data["scenario_time"] = sim_props.scenario_time
+
+        return responses.ok_resp(data)
@@ -7,6 +7,7 @@ from flask_restful import Resource
 
 import bluebird.api.resources.utils.responses as responses
 import bluebird.api.resources.utils.utils as utils
+from bluebird.api.asgi import SHUTDOWN_KEY
 
 
 _PARSER = reqparse.RequestParser()
@@ -22,17 +23,22 @@ class Shutdown(Resource):
 
         req_args = utils.parse_args(_PARSER)
 
-        sim_quit = utils.sim_proxy().shutdown(shutdown_sim=bool(req_args["stop_sim"]))
+        # NOTE The Flask development server and the async server provide different
+        # shutdown functions. Check we have one before shutting down the sim
+        shutdown_fn = request.environ.get("werkzeug.server.shutdown")
+        if not shutdown_fn:
+            shutdown_fn = request.environ.get(SHUTDOWN_KEY)
+        if not shutdown_fn:
+            return responses.internal_err_resp("No shutdown function available")
+
+        # NOTE All the simulators in the pool are shut down, not just the one selected
+        # by the request
+        sim_quit = utils.sim_pool().shutdown(shutdown_sim=bool(req_args["stop_sim"]))
         sim_quit_msg = f"(Sim shutdown ok = {sim_quit})"
 
         # TODO Check we still get a response before this executes. If not, need to set
         # this to fire on a timer
         try:
-            shutdown_fn = request.environ.get("werkzeug.server.shutdown")
-            if not shutdown_fn:
-                return responses.internal_err_resp(
-                    f"No shutdown function available. {sim_quit_msg}"
-                )
             shutdown_fn()
         except Exception as exc:
             return responses.internal_err_resp(
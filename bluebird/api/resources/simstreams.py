@@ -0,0 +1,38 @@
+"""
+Provides logic for the SIMSTREAMS (simulator stream subscriptions) API endpoint
+"""
+from flask_restful import reqparse
+from flask_restful import Resource
+
+import bluebird.api.resources.utils.responses as responses
+import bluebird.api.resources.utils.utils as utils
+from bluebird.settings import Settings
+from bluebird.utils.properties import SimType
+
+
+_PARSER = reqparse.RequestParser()
+_PARSER.add_argument(
+    "topics", type=str, location="json", required=True, action="append"
+)
+
+
+class SimStreams(Resource):
+    """SIMSTREAMS (simulator stream subscriptions) command"""
+
+    @staticmethod
+    def post():
+        """
+        Logic for POST events. Sets the data streams which BlueBird subscribes to. Any
+        other streams are unsubscribed from
+        """
+
+        if Settings.SIM_TYPE != SimType.BlueSky:
+            return responses.bad_request_resp(
+                f"Method not supported for the {Settings.SIM_TYPE.name} simulator"
+            )
+
+        req_args = utils.parse_args(_PARSER)
+        topics = [x.upper() for x in req_args["topics"]]
+
+        err = utils.sim_proxy().set_stream_topics(topics)
+        return responses.bad_request_resp(err) if err else responses.ok_resp()
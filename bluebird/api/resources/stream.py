@@ -0,0 +1,171 @@
+"""
+Provides logic for the STREAM API endpoint
+"""
+import json
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+from flask import request
+from flask import Response
+from flask_restful import inputs
+from flask_restful import reqparse
+from flask_restful import Resource
+
+import bluebird.api.resources.utils.responses as responses
+import bluebird.api.resources.utils.utils as utils
+from bluebird.api.asgi import set_async_body
+from bluebird.settings import Settings
+from bluebird.sim_proxy.frame_broadcaster import Frame
+from bluebird.sim_proxy.frame_broadcaster import FrameBroadcaster
+from bluebird.utils.types import Callsign
+
+
+_PARSER = reqparse.RequestParser()
+_PARSER.add_argument(
+    "delta", type=inputs.boolean, location="args", required=False, default=False
+)
+_PARSER.add_argument("callsigns", type=str, location="args", required=False)
+_PARSER.add_argument("bbox", type=str, location="args", required=False)
+
+# (min. lat, min. lon, max. lat, max. lon)
+_BBox = Tuple[float, float, float, float]
+
+
+def _parse_bbox(bbox_str: str) -> Optional[_BBox]:
+    """Parses a comma-separated bounding box, or returns None if it is invalid"""
+    try:
+        bbox = tuple(float(x) for x in bbox_str.split(","))
+    except ValueError:
+        return None
+    if len(bbox) != 4 or bbox[0] > bbox[2] or bbox[1] > bbox[3]:
+        return None
+    return bbox
+
+
+def _select(
+    frame: Frame, callsigns: Optional[List[str]], bbox: Optional[_BBox]
+) -> Dict[str, Dict[str, Any]]:
+    """Returns the data for the aircraft in the frame which match the filters"""
+
+    selected = frame.aircraft
+    if bbox:
+        ac_arrays = frame.ac_arrays
+        in_bbox = (
+            (ac_arrays.lat >= bbox[0])
+            & (ac_arrays.lon >= bbox[1])
+            & (ac_arrays.lat <= bbox[2])
+            & (ac_arrays.lon <= bbox[3])
+        )
+        selected = {
+            str(ac_arrays.callsigns[x]): selected[str(ac_arrays.callsigns[x])]
+            for x in np.flatnonzero(in_bbox)
+        }
+    if callsigns is not None:
+        selected = {x: selected[x] for x in callsigns if x in selected}
+    return selected
+
+
+class _FrameEvents:
+    """
+    Generates the server-sent events for a single subscriber. If delta is set, only the
+    aircraft which have changed since the previous event are sent, along with the
+    callsigns of any which are no longer selected. The events can either be iterated
+    normally, which blocks while waiting for each frame, or asynchronously
+    """
+
+    def __init__(
+        self,
+        frames: FrameBroadcaster,
+        delta: bool,
+        callsigns: Optional[List[str]],
+        bbox: Optional[_BBox],
+    ):
+        self._frames = frames
+        self._delta = delta
+        self._callsigns = callsigns
+        self._bbox = bbox
+        self._prev: Dict[str, Dict[str, Any]] = {}
+        self._last_seq: Optional[int] = None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._frames.subscribe():
+            while True:
+                yield self._event(
+                    self._frames.wait_for_frame(
+                        self._last_seq, Settings.STREAM_KEEPALIVE
+                    )
+                )
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        with self._frames.subscribe():
+            while True:
+                yield self._event(
+                    await self._frames.wait_for_frame_async(
+                        self._last_seq, Settings.STREAM_KEEPALIVE
+                    )
+                )
+
+    def _event(self, frame: Optional[Frame]) -> str:
+        """Creates the event for the frame, or a keepalive if there is no frame"""
+        if not frame:
+            return ": keepalive\n\n"
+        self._last_seq = frame.seq
+        aircraft = _select(frame, self._callsigns, self._bbox)
+        data = {"seq": frame.seq, "scenario_time": frame.scenario_time}
+        if self._delta:
+            data["aircraft"] = {
+                x: y for x, y in aircraft.items() if self._prev.get(x) != y
+            }
+            data["removed"] = [x for x in self._prev if x not in aircraft]
+            self._prev = aircraft
+        else:
+            data["aircraft"] = aircraft
+        return f"id: {frame.seq}\nevent: frame\ndata: {json.dumps(data)}\n\n"
+
+
+class Stream(Resource):
+    """STREAM command"""
+
+    @staticmethod
+    def get():
+        """
+        Logic for GET events. Opens a server-sent event stream, which sends the aircraft
+        state each time it changes
+        """
+
+        req_args = utils.parse_args(_PARSER)
+
+        callsigns = None
+        if req_args["callsigns"]:
+            try:
+                callsigns = [
+                    str(Callsign(x.strip())) for x in req_args["callsigns"].split(",")
+                ]
+            except AssertionError as exc:
+                return responses.bad_request_resp(str(exc))
+
+        bbox = None
+        if req_args["bbox"]:
+            bbox = _parse_bbox(req_args["bbox"])
+            if not bbox:
+                return responses.bad_request_resp(
+                    "Invalid bbox. Expected min_lat,min_lon,max_lat,max_lon"
+                )
+
+        events = _FrameEvents(
+            utils.sim_proxy().frames, req_args["delta"], callsigns, bbox
+        )
+        # NOTE The async server sends the events from its event loop, so an open stream
+        # doesn't use one of the API worker threads
+        body = iter(()) if set_async_body(request.environ, events) else iter(events)
+        return Response(
+            body,
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
@@ -6,10 +6,15 @@ from typing import Dict
 from typing import Optional
 from typing import Union
 
+import msgpack
 from flask import jsonify
 from flask import make_response
 
 from bluebird.settings import Settings
+from bluebird.utils.npcodec import encode_ndarray
+
+
+MSGPACK_MIMETYPE = "application/msgpack"
 
 
 def internal_err_resp(err: str):
@@ -39,6 +44,18 @@ def ok_resp(data: Optional[Union[str, Dict]] = None):
     return _make_response_from_data(data, HTTPStatus.OK)
 
 
+def msgpack_resp(data: Dict):
+    """
+    Generates a standard OK response with the data encoded as msgpack. Any numpy arrays
+    are encoded in the same format as BlueSky's npcodec
+    """
+    resp = make_response(
+        msgpack.packb(data, default=encode_ndarray, use_bin_type=True), HTTPStatus.OK
+    )
+    resp.mimetype = MSGPACK_MIMETYPE
+    return resp
+
+
 def created_resp(data: Optional[Union[str, Dict]] = None):
     """Generates a standard CREATED response"""
     return _make_response_from_data(data, HTTPStatus.CREATED)
@@ -4,17 +4,23 @@ Contains utility functions for the API resources
 import re
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
+from flask import abort
 from flask import current_app
+from flask import request
 from flask import Response
 from flask_restful import reqparse
 
 import bluebird.api.resources.utils.responses as responses
 import bluebird.utils.types as types
 from bluebird.api.resources.utils.responses import bad_request_resp
+from bluebird.sim_proxy.sim_pool import SimPool
 from bluebird.sim_proxy.sim_proxy import SimProxy
+from bluebird.utils.properties import AircraftCommand
 from bluebird.utils.properties import AircraftProperties
 
 
@@ -25,6 +31,19 @@ FLASK_CONFIG_LABEL = "bluebird_app"
 # simulator
 CALLSIGN_LABEL = "callsign"
 
+# Request header which specifies the simulator environment to use, when BlueBird is
+# running a pool of simulators. If not set, the default environment is used
+ENV_ID_HEADER = "X-BlueBird-Env"
+
+# The (required, optional) arguments for each aircraft command, and their types. These
+# match the arguments of the individual command endpoints
+_COMMAND_ARGS = {
+    "alt": ({"alt": types.Altitude}, {"vspd": types.VerticalSpeed}),
+    "hdg": ({"hdg": types.Heading}, {}),
+    "gspd": ({"gspd": types.GroundSpeed}, {}),
+    "direct": ({"waypoint": str}, {}),
+}
+
 _SCN_RE = re.compile(r"\d{2}:\d{2}:\d{2}(\.\d{1,3})?\s?>\s?.*")
 _ROUTE_RE = re.compile(r"^(\*?)(\w*):((?:-|.)*)/((?:-|\d)*)$")
 
@@ -46,13 +65,58 @@ def try_parse_lat_lon(args: dict) -> Union[types.LatLon, Response]:
         return bad_request_resp(f"Invalid LatLon: {exc}")
 
 
+def parse_aircraft_command(data: Dict[str, Any]) -> Union[AircraftCommand, str]:
+    """
+    Parses a single aircraft command (as used by the BATCH endpoint) from the request
+    data, or returns a string on error
+    """
+
+    name = data.get("cmd")
+    if name not in _COMMAND_ARGS:
+        return f"Invalid cmd '{name}'. Options are - {', '.join(_COMMAND_ARGS)}"
+
+    required, optional = _COMMAND_ARGS[name]
+    try:
+        callsign = types.Callsign(data[CALLSIGN_LABEL])
+        args = {x: arg_type(data[x]) for x, arg_type in required.items()}
+        args.update(
+            {
+                x: arg_type(data[x])
+                for x, arg_type in optional.items()
+                if data.get(x) is not None
+            }
+        )
+    except KeyError as exc:
+        return f"Missing argument {exc} for cmd '{name}'"
+    except (AssertionError, TypeError, ValueError) as exc:
+        return f"Invalid argument for cmd '{name}': {exc}"
+
+    if name == "direct" and not args["waypoint"]:
+        return "Waypoint name must be specified"
+
+    return AircraftCommand(name, callsign, args)
+
+
 def sim_proxy() -> SimProxy:
     """
-    Utility function to return the sim_proxy instance. This is the single point of
-    entry from the API layer to the rest of the app
+    Utility function to return the sim_proxy instance for the requested environment.
+    This is the single point of entry from the API layer to the rest of the app
     """
 
-    return current_app.config.get(FLASK_CONFIG_LABEL).sim_proxy
+    bluebird_app = current_app.config.get(FLASK_CONFIG_LABEL)
+    env_id = request.headers.get(ENV_ID_HEADER)
+    if env_id is None:
+        return bluebird_app.sim_proxy
+    env_sim_proxy = bluebird_app.sim_pool.get(env_id)
+    if not env_sim_proxy:
+        abort(bad_request_resp(f'Unknown environment "{env_id}"'))
+    return env_sim_proxy
+
+
+def sim_pool() -> SimPool:
+    """Utility function to return the pool of all the simulator environments"""
+
+    return current_app.config.get(FLASK_CONFIG_LABEL).sim_pool
 
 
 def check_exists(
@@ -72,6 +136,39 @@ def check_exists(
     return None
 
 
+def changes_since(
+    sim_proxy: SimProxy, since: int
+) -> Union[Tuple[int, List[types.Callsign], List[types.Callsign]], Response]:
+    """
+    Returns the current data_version, and the callsigns of the aircraft which have
+    changed and been removed since the given data_version. Returns an appropriate
+    response on error
+    """
+
+    # NOTE The version is read first so that any changes which happen while the
+    # response is created are also returned to the next request
+    version = sim_proxy.aircraft.data_version
+    if since > version:
+        return responses.bad_request_resp(
+            f"Invalid since ({since}). Must not be greater than the current "
+            f"data_version ({version})"
+        )
+    oldest_since = sim_proxy.aircraft.oldest_since
+    if since < oldest_since:
+        return responses.bad_request_resp(
+            f"Invalid since ({since}). The changes are only available since "
+            f"data_version {oldest_since}. Request the full state instead"
+        )
+
+    changes = sim_proxy.aircraft.changed_since(since)
+    if isinstance(changes, str):
+        return responses.internal_err_resp(
+            f"Couldn't get the changed aircraft: {changes}"
+        )
+
+    return (version, *changes)
+
+
 def convert_aircraft_props(props: AircraftProperties) -> Dict[str, Any]:
     """
     Parses an AircraftProperties object into a dict suitable for returning via Flask
@@ -0,0 +1,167 @@
+"""
+Provides logic for the VECSTEP (vectorised step) API endpoint
+"""
+import traceback
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from flask_restful import reqparse
+from flask_restful import Resource
+
+import bluebird.api.resources.utils.responses as responses
+import bluebird.api.resources.utils.utils as utils
+from bluebird.settings import Settings
+from bluebird.sim_proxy.sim_proxy import SimProxy
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from bluebird.utils.properties import AircraftCommand
+from bluebird.utils.properties import SimMode
+
+
+_PARSER = reqparse.RequestParser()
+_PARSER.add_argument("envs", type=dict, location="json", required=True, action="append")
+_PARSER.add_argument(
+    "metrics", type=dict, location="json", required=False, action="append"
+)
+
+# (provider name, metric name, args)
+_MetricSpec = Tuple[str, str, List[Any]]
+
+
+def _parse_metric(data: Dict[str, Any]) -> Union[_MetricSpec, str]:
+    """Parses a single metric from the request, or returns a string on error"""
+
+    name = data.get("name")
+    if not name or not isinstance(name, str):
+        return "Metric name must be specified"
+
+    args = data.get("args") or []
+    if not isinstance(args, list):
+        return f"Invalid args for metric '{name}'. Expected a list"
+
+    # Use the default metrics if not otherwise specified
+    return (data.get("provider") or "BlueBird", name, args)
+
+
+def _arrays_to_json(ac_arrays: AircraftArrays) -> Dict[str, list]:
+    """Converts the aircraft arrays to lists, using the same keys as the POS endpoint"""
+
+    return {
+        utils.CALLSIGN_LABEL: [str(x) for x in ac_arrays.callsigns],
+        "actype": list(ac_arrays.aircraft_type),
+        "current_fl": ac_arrays.altitude.tolist(),
+        "gs": ac_arrays.ground_speed.tolist(),
+        "hdg": ac_arrays.heading.tolist(),
+        "lat": ac_arrays.lat.tolist(),
+        "lon": ac_arrays.lon.tolist(),
+        "vs": ac_arrays.vertical_speed.tolist(),
+    }
+
+
+def _step_env(
+    sim_proxy: SimProxy, commands: List[AircraftCommand], metrics: List[_MetricSpec]
+) -> Dict[str, Any]:
+    """
+    Sends the commands to a single environment and steps it, then collects the new
+    aircraft state and the requested metrics. The metric results are returned in the
+    same order as the metrics were requested. Any error is stored in the result
+    """
+
+    data: Dict[str, Any] = {"error": None}
+    try:
+        if commands:
+            results = sim_proxy.aircraft.send_commands(commands)
+            if not isinstance(results, list):
+                data["error"] = f"Could not send commands: {results}"
+                return data
+            data["results"] = results
+
+        err = sim_proxy.simulation.step()
+        if err:
+            data["error"] = f"Could not step the simulation: {err}"
+            return data
+
+        sim_props = sim_proxy.simulation.properties
+        if isinstance(sim_props, str):
+            data["error"] = f"Could not get the sim properties: {sim_props}"
+            return data
+        data["scenario_time"] = sim_props.scenario_time
+
+        ac_arrays = sim_proxy.aircraft.all_arrays
+        if not isinstance(ac_arrays, AircraftArrays):
+            data["error"] = f"Could not get the aircraft data: {ac_arrays}"
+            return data
+        data["aircraft"] = _arrays_to_json(ac_arrays)
+
+        data["metrics"] = []
+        for provider_name, metric_name, args in metrics:
+            provider = sim_proxy.metrics_providers.get(provider_name)
+            if not provider:
+                data["error"] = f'Provider "{provider_name}" not found'
+                return data
+            result = sim_proxy.call_metric_function(provider, metric_name, args)
+            if isinstance(result, str):
+                data["error"] = f"Metric '{metric_name}' returned an error: {result}"
+                return data
+            data["metrics"].append(result)
+    except Exception:
+        data["error"] = f"Error stepping environment: {traceback.format_exc()}"
+
+    return data
+
+
+class VecStep(Resource):
+    """Contains logic for the VECSTEP endpoint"""
+
+    @staticmethod
+    def post():
+        """
+        Logic for POST events. Sends the commands to each of the given environments and
+        steps them concurrently. Once all the environments have been stepped, returns
+        their new aircraft states and the requested metrics
+        """
+
+        if Settings.SIM_MODE != SimMode.Agent:
+            return responses.bad_request_resp("Must be in agent mode to use vecstep")
+
+        req_args = utils.parse_args(_PARSER)
+        sim_pool = utils.sim_pool()
+
+        env_commands: Dict[str, List[AircraftCommand]] = {}
+        for idx, env_data in enumerate(req_args["envs"]):
+            env_id = str(env_data.get("env_id", ""))
+            if not sim_pool.get(env_id):
+                return responses.bad_request_resp(
+                    f'Env {idx}: Unknown environment "{env_id}"'
+                )
+            if env_id in env_commands:
+                return responses.bad_request_resp(
+                    f'Env {idx}: Environment "{env_id}" specified more than once'
+                )
+            commands = []
+            for cmd_idx, cmd_data in enumerate(env_data.get("commands") or []):
+                command = utils.parse_aircraft_command(cmd_data)
+                if not isinstance(command, AircraftCommand):
+                    return responses.bad_request_resp(
+                        f"Env {idx}: Command {cmd_idx}: {command}"
+                    )
+                commands.append(command)
+            env_commands[env_id] = commands
+
+        metrics = []
+        for idx, metric_data in enumerate(req_args["metrics"] or []):
+            metric = _parse_metric(metric_data)
+            if isinstance(metric, str):
+                return responses.bad_request_resp(f"Metric {idx}: {metric}")
+            metrics.append(metric)
+
+        results = sim_pool.map(
+            lambda env_id, x: _step_env(x, env_commands[env_id], metrics),
+            list(env_commands),
+        )
+
+        return responses.ok_resp(
+            {"envs": [{"env_id": x, **results[x]} for x in env_commands]}
+        )
@@ -11,14 +11,18 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from semver import VersionInfo
 
 from bluebird.api import FLASK_APP
+from bluebird.api.asgi import AsgiServer
 from bluebird.api.resources.utils.utils import FLASK_CONFIG_LABEL
 from bluebird.metrics import setup_metrics
 from bluebird.settings import Settings
 from bluebird.sim_client import setup_sim_client
+from bluebird.sim_proxy.data_cache import DataCache
+from bluebird.sim_proxy.sim_pool import SimPool
 from bluebird.sim_proxy.sim_proxy import SimProxy
 from bluebird.utils.abstract_sim_client import AbstractSimClient
 from bluebird.utils.timer import Timer
@@ -39,9 +43,12 @@ class BlueBird:
         )
 
         self._cli_args = args
-        self._min_sim_version: Optional[VersionInfo] = None
+        # The minimum simulator version supported by the client for each environment
+        self._min_sim_versions: Dict[str, VersionInfo] = {}
         self._timers: List[Timer] = []
 
+        # NOTE sim_proxy and sim_client refer to the default simulator in the pool
+        self.sim_pool: Optional[SimPool] = None
         self.sim_proxy: Optional[SimProxy] = None
         self.sim_client: Optional[AbstractSimClient] = None
 
@@ -58,70 +65,93 @@ class BlueBird:
         for timer in self._timers:
             timer.stop()
 
-        if self.sim_proxy:
-            self.sim_proxy.shutdown()
+        if self.sim_pool:
+            self.sim_pool.shutdown()
 
         BlueBird.exit_flag = True
 
     def pre_connection_setup(self):
-        """Performs any actions required before connecting to the simulator"""
-
-        self.metrics_providers = setup_metrics()
+        """
+        Performs any actions required before connecting to the simulator(s). A sim
+        client is created for each address in Settings.SIM_POOL, or a single client if
+        no pool is specified. All clients share the same sector and scenario cache
+        """
 
-        # NOTE(RKM 2019-12-12) The sim clients get a reference to the metrics providers
-        # so they can store any results there if needed (i.e. storing the result of all
-        # metrics after a call to step)
-        self.sim_client, self._min_sim_version = setup_sim_client(
-            self.metrics_providers
-        )
+        data_cache = DataCache()
+        sim_proxies = {}
+        for env_id, address in enumerate(Settings.SIM_POOL or [None]):
+            metrics_providers = setup_metrics()
+            host, port = _parse_sim_address(address) if address else (None, None)
+            # NOTE(RKM 2019-12-12) The sim clients get a reference to the metrics
+            # providers so they can store any results there if needed (i.e. storing the
+            # result of all metrics after a call to step)
+            sim_client, self._min_sim_versions[str(env_id)] = setup_sim_client(
+                metrics_providers, host=host, port=port
+            )
+            sim_proxies[str(env_id)] = SimProxy(
+                sim_client, metrics_providers, data_cache
+            )
+            if not env_id:
+                self.sim_client = sim_client
+                self.metrics_providers = metrics_providers
 
-        self.sim_proxy = SimProxy(self.sim_client, self.metrics_providers)
+        self.sim_pool = SimPool(sim_proxies)
+        self.sim_proxy = self.sim_pool.default
 
     def connect_to_sim(self) -> bool:
         """
-        Connect to the simulation server
-        :param args: Parsed CLI arguments
-        :return: True if a connection was established with the server, otherwise False
+        Connect to each simulation server in the pool
+        :return: True if a connection was established with all servers, otherwise False
         """
 
+        for env_id, sim_proxy in self.sim_pool.items():
+            if not self._connect(env_id, sim_proxy):
+                return False
+
+        return True
+
+    def _connect(self, env_id: str, sim_proxy: SimProxy) -> bool:
+        """Connect to a single simulation server"""
+
         sim_name = Settings.SIM_TYPE.name
-        self._logger.info(f"Attempting to connect to {sim_name} at {Settings.SIM_HOST}")
+        self._logger.info(f"Attempting to connect to {sim_name} (env {env_id})")
 
         try:
-            self.sim_proxy.connect()
+            sim_proxy.connect()
         except (TimeoutError, KeyboardInterrupt):
             self._logger.error(
                 f"Failed to connect to {sim_name}, exiting ({traceback.format_exc()})"
             )
             return False
 
-        self._logger.info("Client connected")
+        self._logger.info(f"Client connected (env {env_id})")
 
-        if self.sim_proxy.sim_version < self._min_sim_version:
+        min_sim_version = self._min_sim_versions[env_id]
+        if sim_proxy.sim_version < min_sim_version:
             self._logger.error(
-                f"Server of version {self.sim_proxy.sim_version} does not meet the "
-                f"minimum requirement ({self._min_sim_version})"
+                f"Server of version {sim_proxy.sim_version} does not meet the "
+                f"minimum requirement ({min_sim_version}) (env {env_id})"
             )
             return False
 
-        if self.sim_proxy.sim_version.major > self._min_sim_version.major:
+        if sim_proxy.sim_version.major > min_sim_version.major:
             self._logger.error(
-                f"{sim_name} server of version {self.sim_proxy.sim_version} has major"
+                f"{sim_name} server of version {sim_proxy.sim_version} has major"
                 f"version greater than supported in this version of the client"
-                f"({self._min_sim_version})"
+                f"({min_sim_version}) (env {env_id})"
             )
             return False
 
-        self._timers.extend(self.sim_proxy.start_timers())
+        self._timers.extend(sim_proxy.start_timers())
 
         # NOTE(rkm 2020-01-09) This has to be done after we start the timers since,
         # for BlueSky at least, we need to actively poll for the reset confirmation
         if self._cli_args["reset_sim"]:
-            err = self.sim_proxy.simulation.reset()
+            err = sim_proxy.simulation.reset()
             if err:
                 raise RuntimeError(f"Could not reset sim on startup: {err}")
 
-        self.sim_proxy.pre_fetch_data()
+        sim_proxy.pre_fetch_data()
 
         return True
 
@@ -139,6 +169,10 @@ class BlueBird:
         # Register the BlueBird app with Flask so the API thread can use it
         FLASK_APP.config[FLASK_CONFIG_LABEL] = self
 
+        if Settings.ASYNC_SERVER:
+            self._run_async_server()
+            return
+
         flask_thread = threading.Thread(
             target=FLASK_APP.run,
             kwargs={
@@ -165,6 +199,29 @@ class BlueBird:
             _proc_killer()
             raise exc_value.with_traceback(exc_traceback)
 
+    def _run_async_server(self):
+        """
+        Serves the API with an ASGI server. Blocks until the server exits, or until any
+        timer raises an exception
+        """
+
+        self._logger.info(f"Using async server with {Settings.API_WORKERS} workers")
+        server = AsgiServer(FLASK_APP, "0.0.0.0", Settings.PORT, Settings.API_WORKERS)
+        server_thread = server.start()
+
+        try:
+            while server_thread.is_alive() and not self._check_timers():
+                time.sleep(0.1)
+        except KeyboardInterrupt:
+            self._logger.info("Ctrl+C - exiting")
+        finally:
+            server.stop()
+
+        err = self._check_timers()
+        if err:
+            _, exc_value, exc_traceback = err
+            raise exc_value.with_traceback(exc_traceback)
+
     def _check_timers(self):
         """
         Checks if any threads have raised an exception. Returns the first found
@@ -173,6 +230,12 @@ class BlueBird:
         return next((x.exc_info for x in self._timers if x.exc_info), None)
 
 
+def _parse_sim_address(address: str) -> Tuple[str, Optional[int]]:
+    """Parses a simulator address of the form host[:port]"""
+    host, _, port = address.partition(":")
+    return host, int(port) if port else None
+
+
 def _proc_killer():
     r"""
     Starts another thread which waits for BlueBird.exit_flag to be set, then sends
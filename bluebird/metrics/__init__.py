@@ -35,11 +35,14 @@ def setup_metrics() -> List[AbstractMetricsProvider]:
     Loads the metrics providers defined in the global settings. Returns them as a list
     """
 
+    # NOTE This is called once for each simulator in the pool, so don't modify the
+    # global list
+    provider_names = list(METRICS_PROVIDERS)
     if Settings.SIM_TYPE == SimType.MachColl:
-        METRICS_PROVIDERS.append("machcoll")
+        provider_names.append("machcoll")
 
     providers = []
-    for provider in METRICS_PROVIDERS:
+    for provider in provider_names:
         mod_path = f"{__package__}.{provider}.provider"
         try:
             spec = importlib.util.find_spec(mod_path)
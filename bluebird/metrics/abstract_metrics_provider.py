@@ -1,11 +1,27 @@
 """
 Contains the AbstractMetricsProvider abstract base class
 """
+import itertools
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
 from semver import VersionInfo
 
+import bluebird.utils.types as types
+
+
+# The result of a bulk metric evaluation. Either a value for each aircraft, or a list of
+# (callsign1, callsign2, value) for each pair
+BulkResult = Union[
+    Dict[types.Callsign, Any], List[Tuple[types.Callsign, types.Callsign, Any]]
+]
+
 
 class AbstractMetricsProvider(ABC):
     """ABC for classes which provide metrics to BlueBird"""
@@ -24,3 +40,30 @@ class AbstractMetricsProvider(ABC):
         Return the version of the metrics module
         :return:
         """
+
+    def as_of(self, metric) -> Optional[float]:
+        """
+        Returns the scenario time at which the current result of the metric was
+        calculated, or None if the metric is always evaluated on the current data.
+        Providers which store their results should override this
+        :return:
+        """
+        return None
+
+    def bulk(
+        self, metric, callsigns: List[types.Callsign], pairwise: bool, **kwargs
+    ) -> BulkResult:
+        """
+        Evaluates the metric for each of the given aircraft, or for each pair of them if
+        pairwise is set. Pairwise results are only returned for pairs where the metric
+        is non-zero. Providers can override this with a more efficient implementation
+        :return:
+        """
+        if not pairwise:
+            return {x: self(metric, str(x), **kwargs) for x in callsigns}
+        results = []
+        for callsign1, callsign2 in itertools.combinations(callsigns, 2):
+            result = self(metric, str(callsign1), str(callsign2), **kwargs)
+            if result:
+                results.append((callsign1, callsign2, result))
+        return results
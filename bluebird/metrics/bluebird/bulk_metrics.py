@@ -0,0 +1,93 @@
+"""
+Vectorised implementations of BlueBird's built-in metrics, for evaluating a metric over
+all aircraft at once
+"""
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+import bluebird.utils.types as types
+from bluebird.sim_proxy.proxy_aircraft_controls import ProxyAircraftControls
+from bluebird.utils.spatial_index import horizontal_distance
+from bluebird.utils.spatial_index import SpatialIndex
+from bluebird.utils.units import METERS_PER_FOOT
+
+
+# NOTE These are the default distances of aviary.metrics.pairwise_separation_metric,
+# which is the source of truth for the metric. The results here are checked against it
+# in test_pairwise_separation_metric. Pairs of aircraft which are further apart than
+# either warning distance always have a score of 0
+HOR_MIN_DIST_M = 5 * 1852
+HOR_WARN_DIST_M = 10 * 1852
+VERT_MIN_DIST_FT = 1000
+VERT_WARN_DIST_FT = 2000
+
+
+def _separation_score(
+    dist: np.ndarray, min_dist: float, warn_dist: float
+) -> np.ndarray:
+    """
+    Returns the score for each distance - -1 below the minimum separation, rising
+    linearly to 0 at the warning distance
+    """
+    return np.clip((dist - warn_dist) / (warn_dist - min_dist), -1, 0)
+
+
+def pairwise_separation_metric(
+    callsigns: Optional[List[types.Callsign]], **kwargs
+) -> List[Tuple[types.Callsign, types.Callsign, float]]:
+    """
+    Evaluates the Aviary separation metric for all pairs of the given aircraft, or of
+    all aircraft if callsigns is None. Only non-zero results are returned
+    """
+
+    aircraft_controls: ProxyAircraftControls = kwargs["aircraft_controls"]
+
+    index = aircraft_controls.spatial_index(HOR_WARN_DIST_M, VERT_WARN_DIST_FT)
+    if not isinstance(index, SpatialIndex):
+        raise ValueError(f"Could not get aircraft data: {index}")
+
+    ac_arrays = index.ac_arrays
+    i, j = index.pairs()
+
+    if callsigns is not None:
+        missing = [x for x in callsigns if x not in ac_arrays]
+        if missing:
+            raise ValueError(
+                f"Could not get properties for {', '.join(map(str, missing))}"
+            )
+        selected = np.zeros(len(ac_arrays), dtype=bool)
+        selected[[ac_arrays.index[x] for x in callsigns]] = True
+        keep = selected[i] & selected[j]
+        i, j = i[keep], j[keep]
+
+    # NOTE Same conversion as types.Altitude.meters
+    alt_m = (ac_arrays.altitude * METERS_PER_FOOT).astype(int)
+
+    hor_score = _separation_score(
+        horizontal_distance(
+            ac_arrays.lat[i], ac_arrays.lon[i], ac_arrays.lat[j], ac_arrays.lon[j]
+        ),
+        HOR_MIN_DIST_M,
+        HOR_WARN_DIST_M,
+    )
+    vert_score = _separation_score(
+        np.abs(alt_m[i] - alt_m[j]),
+        VERT_MIN_DIST_FT * METERS_PER_FOOT,
+        VERT_WARN_DIST_FT * METERS_PER_FOOT,
+    )
+    # NOTE Separation is only lost if the aircraft are too close both horizontally and
+    # vertically
+    scores = np.maximum(hor_score, vert_score)
+
+    nonzero = np.flatnonzero(scores)
+    return [
+        (ac_arrays.callsigns[i[x]], ac_arrays.callsigns[j[x]], scores[x].item())
+        for x in nonzero
+    ]
+
+
+# The metrics which have a vectorised pairwise implementation
+PAIRWISE_METRICS = {"pairwise_separation_metric": pairwise_separation_metric}
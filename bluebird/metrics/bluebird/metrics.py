@@ -7,6 +7,7 @@ import aviary.metrics as aviary_metrics
 
 import bluebird.utils.properties as props
 import bluebird.utils.types as types
+from bluebird.metrics.bluebird import bulk_metrics
 from bluebird.sim_proxy.proxy_aircraft_controls import ProxyAircraftControls
 from bluebird.sim_proxy.proxy_simulator_controls import ProxySimulatorControls
 
@@ -46,6 +47,24 @@ def pairwise_separation_metric(*args, **kwargs):
     )
 
 
+def all_conflicts_metric(*args, **kwargs):
+    """
+    Evaluates the Aviary aircraft separation metric for all pairs of aircraft, and
+    returns the pairs with a non-zero score as a list of [callsign1, callsign2, score].
+    Uses a spatial index so only the aircraft within the warning distances are compared.
+    Expects no *args
+    """
+
+    assert not args, "Expected no arguments"
+
+    return [
+        [str(callsign1), str(callsign2), score]
+        for callsign1, callsign2, score in bulk_metrics.pairwise_separation_metric(
+            None, **kwargs
+        )
+    ]
+
+
 def sector_exit_metric(*args, **kwargs):
     """
     The Aviary sector exit metric function. Expected *args are:
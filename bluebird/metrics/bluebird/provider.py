@@ -4,6 +4,8 @@ BlueBird metrics provider class
 import logging
 
 from bluebird.metrics.abstract_metrics_provider import AbstractMetricsProvider
+from bluebird.metrics.abstract_metrics_provider import BulkResult
+from bluebird.metrics.bluebird import bulk_metrics
 from bluebird.metrics.bluebird import metrics
 from bluebird.settings import Settings
 
@@ -21,6 +23,11 @@ class Provider(AbstractMetricsProvider):
     def __str__(self):
         return "BlueBird"
 
+    def bulk(self, metric, callsigns, pairwise, **kwargs) -> BulkResult:
+        if pairwise and metric in bulk_metrics.PAIRWISE_METRICS:
+            return bulk_metrics.PAIRWISE_METRICS[metric](callsigns, **kwargs)
+        return super().bulk(metric, callsigns, pairwise, **kwargs)
+
     def version(self):
         # Just track these metrics along with BlueBird release versions
         return str(Settings.VERSION)
@@ -24,6 +24,8 @@ class Provider(AbstractMetricsProvider):
         self._logger = logging.getLogger(__name__)
         self._version: VersionInfo = None
         self.metrics: Dict[str, float] = {}
+        # The scenario time at which each of the metric results was calculated
+        self.sim_times: Dict[str, Optional[float]] = {}
         self._load_metrics_from_file()
 
     def __call__(self, metric, *args, **kwargs):
@@ -38,6 +40,9 @@ class Provider(AbstractMetricsProvider):
     def version(self):
         return str(self._version)
 
+    def as_of(self, metric) -> Optional[float]:
+        return self.sim_times.get(metric)
+
     def set_version(self, version: VersionInfo):
         """Allows the version to be set after connection to the simulation server"""
         self._version = version
@@ -54,7 +59,13 @@ class Provider(AbstractMetricsProvider):
             self.metrics[line.rstrip()] = None
         self._logger.debug(f"Loaded metrics: {', '.join(self.metrics.keys())}")
 
-    def update(self, metric: str, result: Optional[Union[str, float]]):
+    def update(
+        self,
+        metric: str,
+        result: Optional[Union[str, float]],
+        sim_time: Optional[float] = None,
+    ):
+        self.sim_times[metric] = sim_time
         if not isinstance(result, (float, int)):
             self._logger.error(f"Metric {metric} returned result {result}")
             self.metrics[metric] = str(result)
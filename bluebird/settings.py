@@ -5,6 +5,8 @@ Default settings for the BlueBird app
 import logging
 import os
 from pathlib import Path
+from typing import List
+from typing import Optional
 
 from semver import VersionInfo
 
@@ -31,22 +33,75 @@ class Settings:
         API_VERSION:        BlueBird API version
         FLASK_DEBUG:        FLASK_DEBUG flag for `Flask.run(debug=FLASK_DEBUG)`
         PORT:               BlueBird (Flask) server port
+        ASYNC_SERVER:       Serve the API with an async (ASGI) server instead of the
+                            Flask development server
+        API_WORKERS:        Max. number of API requests which are handled concurrently
+                            when using the async server
+        STREAM_RATE:        Max. rate (in Hz) at which frames are sent to the STREAM
+                            endpoint subscribers
+        STREAM_KEEPALIVE:   Time (in seconds) after which a keep-alive message is sent
+                            to STREAM subscribers if there is no new data
         SIM_LOG_RATE:       Rate (in sim-seconds) at which aircraft data is logged to
                             the episode file
         LOGS_ROOT:          Root directory for log files. Defaults to ./logs
         CONSOLE_LOG_LEVEL:  The min. log level for console messages
         SIM_HOST:           Hostname of the simulation server
+        SIM_POOL:           Addresses ("host" or "host:port") of each simulator when
+                            running a pool of simulators. If empty, a single simulator
+                            at SIM_HOST is used. For BlueSky, the port is the event
+                            port, and port+1 is used as the stream port
         SIM_MODE:           Mode for interacting with the simulator
         SIM_TYPE:           The simulator type
+        STATE_HISTORY:      Number of previous steps for which the aircraft properties
+                            are stored
+        REMOVED_HISTORY:    Number of removed aircraft which are remembered for
+                            requests for the changes since a data_version
+        BS_TRANSPORT:       ZMQ transport used to connect to BlueSky. Either "tcp", or
+                            "ipc" when BlueSky is on the same host. For IPC, the
+                            sockets are "ipc://<SIM_HOST>:<port>". This is a path
+                            relative to the working directory unless SIM_HOST is an
+                            absolute path (e.g. "/tmp/bluesky"), and BlueSky must be
+                            bound to the same paths
         BS_EVENT_PORT:      BlueSky event port
         BS_STREAM_PORT:     BlueSky stream port
+        BS_STREAM_TIMEOUT:  Max. time (in seconds) between BlueSky stream messages
+                            before the connection is considered lost
+        BS_ZMQ_HWM:         ZMQ high-water mark (max. queued messages) for the BlueSky
+                            sockets. If None, the ZMQ default is used
+        BS_ZMQ_RCVBUF:      OS receive buffer size (in bytes) for the BlueSky sockets.
+                            If None, the OS default is used
+        BS_TCP_KEEPALIVE:   If set, TCP keepalive is enabled for the BlueSky sockets.
+                            If None, the OS default is used
+        BS_KEEPALIVE_IDLE:  Time (in seconds) before the first TCP keepalive probe is
+                            sent. If None, the OS default is used
+        BS_STEP_TIMEOUT:    Max. time (in seconds) to wait for BlueSky to confirm a
+                            STEP command
+        BS_CMD_TIMEOUT:     Max. time (in seconds) to wait for further responses to a
+                            BlueSky stack command before it is considered complete
+        BS_LOAD_TIMEOUT:    Max. time (in seconds) to wait for BlueSky to confirm a
+                            RESET, scenario upload, or scenario load (IC)
+        BS_STREAM_TOPICS:   The BlueSky streams to subscribe to. 'ROUTEDATA' is also
+                            available. Can be changed at runtime with the SIMSTREAMS
+                            endpoint
         MC_PORT:            MachineCollege port
+        MC_FETCH_WORKERS:   Number of connections used to fetch the MachColl aircraft
+                            data in parallel
+        MC_POLL_RATE:       Rate (in Hz) at which the MachColl sim state, speed, and
+                            time are refreshed in the background
+        MC_METRICS_WAIT:    If set, MachColl STEP commands wait for the metric results
+                            before returning. Otherwise they are collected while the
+                            client prepares the next step. Errors collecting the
+                            results are logged, and don't fail the step
     """
 
     VERSION: VersionInfo = _VERSION
     API_VERSION: int = _VERSION.major
     FLASK_DEBUG: bool = True
     PORT: int = 5001
+    ASYNC_SERVER: bool = False
+    API_WORKERS: int = 32
+    STREAM_RATE: float = 5
+    STREAM_KEEPALIVE: float = 15
 
     DATA_DIR = Path("data")
 
@@ -55,13 +110,28 @@ class Settings:
     CONSOLE_LOG_LEVEL: int = logging.DEBUG
 
     SIM_HOST: str = "localhost"
+    SIM_POOL: List[str] = []
     SIM_MODE: SimMode = SimMode.Agent
     SIM_TYPE: SimType = SimType.BlueSky
+    STATE_HISTORY: int = 10
+    REMOVED_HISTORY: int = 1000
 
     # BlueSky settings
+    BS_TRANSPORT: str = "tcp"
     BS_EVENT_PORT: int = 9000
     BS_STREAM_PORT: int = 9001
     BS_STREAM_TIMEOUT: int = 5
+    BS_ZMQ_HWM: Optional[int] = None
+    BS_ZMQ_RCVBUF: Optional[int] = None
+    BS_TCP_KEEPALIVE: Optional[bool] = None
+    BS_KEEPALIVE_IDLE: Optional[int] = None
+    BS_STEP_TIMEOUT: float = 5
+    BS_CMD_TIMEOUT: float = 0.5
+    BS_LOAD_TIMEOUT: float = 5
+    BS_STREAM_TOPICS: List[str] = ["ACDATA", "SIMINFO"]
 
     # MachColl settings
     MC_PORT: int = 5321
+    MC_FETCH_WORKERS: int = 8
+    MC_POLL_RATE: float = 2
+    MC_METRICS_WAIT: bool = True
@@ -3,6 +3,8 @@ Package for simulator clients and their associated logic
 """
 import importlib.util
 import logging
+from functools import lru_cache
+from types import ModuleType
 from typing import Tuple
 
 from semver import VersionInfo
@@ -33,15 +35,13 @@ assert isinstance(
 """
 
 
-def setup_sim_client(
-    metrics_providers: MetricsProviders,
-) -> Tuple[AbstractSimClient, VersionInfo]:
+@lru_cache(maxsize=None)
+def _load_client_module(mod_name: str) -> ModuleType:
     """
-    Imports and returns an instance of the AbstractSimClient class as specified by
-    Settings.SIM_TYPE, and the minimum version of simulator that the client supports
+    Imports the sim client module. This is cached so the module is only loaded once when
+    creating a client for each simulator in a pool
     """
 
-    mod_name = Settings.SIM_TYPE.name
     mod_path = f"{__package__}.{mod_name.lower()}"
 
     _LOGGER.info(f'Loading the "{mod_name}" simulator client')
@@ -64,8 +64,23 @@ def setup_sim_client(
             f"Module for {mod_name} does not contain a valid SimClient class"
         )
 
+    return module
+
+
+def setup_sim_client(
+    metrics_providers: MetricsProviders, **kwargs
+) -> Tuple[AbstractSimClient, VersionInfo]:
+    """
+    Imports and returns an instance of the AbstractSimClient class as specified by
+    Settings.SIM_TYPE, and the minimum version of simulator that the client supports.
+    Any kwargs (i.e. the simulator host and port) are passed to the SimClient
+    """
+
+    mod_name = Settings.SIM_TYPE.name
+    module = _load_client_module(mod_name)
+
     try:
-        sim_client = module.SimClient(metrics_providers=metrics_providers)
+        sim_client = module.SimClient(metrics_providers=metrics_providers, **kwargs)
     except TypeError as exc:
         raise TypeError(
             f"Client class for {mod_name} does not properly implement the"
@@ -7,11 +7,15 @@ import traceback
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
+import numpy as np
+
 import bluebird.utils.properties as props
 import bluebird.utils.types as types
 from bluebird.utils.abstract_aircraft_controls import AbstractAircraftControls
+from bluebird.utils.aircraft_arrays import AircraftArrays
 from bluebird.utils.units import KTS_PER_MS
 from bluebird.utils.units import METERS_PER_FOOT
 
@@ -19,6 +23,31 @@ from bluebird.utils.units import METERS_PER_FOOT
 _ROUTE_RE = re.compile(r"^(\*?)(\w*):((?:-|.)*)/((?:-|\d)*)$")
 
 
+def _alt_cmd_str(callsign, flight_level, vspd=None) -> str:
+    return f"ALT {callsign} {flight_level} {'' if vspd is None else vspd}".strip()
+
+
+def _hdg_cmd_str(callsign, heading) -> str:
+    return f"HDG {callsign} {heading}"
+
+
+def _spd_cmd_str(callsign, ground_speed) -> str:
+    return f"SPD {callsign} {ground_speed}"
+
+
+def _direct_cmd_str(callsign, waypoint) -> str:
+    return f"DIRECT {callsign} {waypoint}"
+
+
+# Functions to convert each type of AircraftCommand into a BlueSky stack command
+_STACK_CMD_STRS = {
+    "alt": lambda x: _alt_cmd_str(x.callsign, x.args["alt"], x.args.get("vspd")),
+    "hdg": lambda x: _hdg_cmd_str(x.callsign, x.args["hdg"]),
+    "gspd": lambda x: _spd_cmd_str(x.callsign, x.args["gspd"]),
+    "direct": lambda x: _direct_cmd_str(x.callsign, x.args["waypoint"]),
+}
+
+
 class BlueSkyAircraftControls(AbstractAircraftControls):
     """AbstractAircraftControls implementation for BlueSky"""
 
@@ -26,17 +55,46 @@ class BlueSkyAircraftControls(AbstractAircraftControls):
     def all_properties(
         self,
     ) -> Union[Dict[types.Callsign, props.AircraftProperties], str]:
-        data = self._bluesky_client.aircraft_stream_data
-        return self._convert_to_ac_props(data)
+        ac_arrays = self.all_arrays
+        if not isinstance(ac_arrays, AircraftArrays):
+            return ac_arrays
+        try:
+            return ac_arrays.all_properties()
+        except Exception:
+            return f"Error parsing ac data from stream: {traceback.format_exc()}"
+
+    @property
+    def data_version(self) -> Optional[int]:
+        return self._bluesky_client.aircraft_stream_seq
 
     @property
     def callsigns(self) -> Union[List[types.Callsign], str]:
-        all_props = self.all_properties
-        return all_props if isinstance(all_props, str) else all_props.keys()
+        ac_arrays = self.all_arrays
+        if not isinstance(ac_arrays, AircraftArrays):
+            return ac_arrays
+        return ac_arrays.callsigns
+
+    @property
+    def all_arrays(self) -> Union[AircraftArrays, str]:
+        # NOTE Each ACDATA frame is an immutable snapshot, so we only need to convert it
+        # once
+        seq = self._bluesky_client.aircraft_stream_seq
+        if self._arrays_cache and self._arrays_cache[0] == seq:
+            return self._arrays_cache[1]
+        # NOTE The stream data is decoded when it is first read, which can also fail
+        try:
+            data = self._bluesky_client.aircraft_stream_data
+        except Exception:
+            return f"Error parsing ac data from stream: {traceback.format_exc()}"
+        ac_arrays = self._convert_to_arrays(data)
+        if isinstance(ac_arrays, AircraftArrays):
+            self._arrays_cache = (seq, ac_arrays)
+        return ac_arrays
 
     def __init__(self, bluesky_client):
         self._bluesky_client = bluesky_client
         self._logger = logging.getLogger(__name__)
+        self._arrays_cache: Optional[Tuple[int, AircraftArrays]] = None
         # TODO(RKM 2019-11-21) Make private and refactor tests
         # self.ac_props: Dict[types.Callsign, Optional[props.AircraftProperties]] = {}
         self.ac_routes: Dict[types.Callsign, props.AircraftRoute] = {}
@@ -47,23 +105,20 @@ class BlueSkyAircraftControls(AbstractAircraftControls):
         self, callsign: types.Callsign, flight_level: types.Altitude, **kwargs
     ) -> Optional[str]:
 
-        vspd = kwargs.get("vspd")
-        if kwargs.get("vspd") is None:
-            vspd = ""
-        cmd_str = f"ALT {callsign} {flight_level} {vspd}".strip()
+        cmd_str = _alt_cmd_str(callsign, flight_level, kwargs.get("vspd"))
         # TODO This can also return list (multiple errors?)
         return self._tmp_stack_cmd_handle_list(cmd_str)
 
     def set_heading(
         self, callsign: types.Callsign, heading: types.Heading
     ) -> Optional[str]:
-        cmd_str = f"HDG {callsign} {heading}"
+        cmd_str = _hdg_cmd_str(callsign, heading)
         return self._tmp_stack_cmd_handle_list(cmd_str)
 
     def set_ground_speed(
         self, callsign: types.Callsign, ground_speed: types.GroundSpeed
     ):
-        cmd_str = f"SPD {callsign} {ground_speed}"
+        cmd_str = _spd_cmd_str(callsign, ground_speed)
         return self._tmp_stack_cmd_handle_list(cmd_str)
 
     def set_vertical_speed(
@@ -76,7 +131,7 @@ class BlueSkyAircraftControls(AbstractAircraftControls):
     def direct_to_waypoint(
         self, callsign: types.Callsign, waypoint: str
     ) -> Optional[str]:
-        cmd_str = f"DIRECT {callsign} {waypoint}"
+        cmd_str = _direct_cmd_str(callsign, waypoint)
         return self._tmp_stack_cmd_handle_list(cmd_str)
 
     def create(
@@ -99,13 +154,22 @@ class BlueSkyAircraftControls(AbstractAircraftControls):
         # checking against it during any CRE request
         return None
 
+    def send_commands(
+        self, commands: List[props.AircraftCommand]
+    ) -> Union[List[Optional[str]], str]:
+        cmd_strs = [_STACK_CMD_STRS[x.name](x) for x in commands]
+        return self._bluesky_client.send_stack_cmds(cmd_strs)
+
     def properties(
         self, callsign: types.Callsign
     ) -> Optional[Union[props.AircraftProperties, str]]:
-        all_props = self.all_properties
-        if not isinstance(all_props, dict):
-            return all_props
-        return all_props[callsign]
+        ac_arrays = self.all_arrays
+        if not isinstance(ac_arrays, AircraftArrays):
+            return ac_arrays
+        try:
+            return ac_arrays.properties(callsign)
+        except Exception:
+            return f"Error parsing ac data from stream: {traceback.format_exc()}"
 
     def exists(self, callsign: types.Callsign) -> Union[bool, str]:
         all_callsings = self.callsigns
@@ -115,29 +179,25 @@ class BlueSkyAircraftControls(AbstractAircraftControls):
             else all_callsings
         )
 
-    def _convert_to_ac_props(
-        self, data: dict,
-    ) -> Union[Dict[types.Callsign, props.AircraftProperties], str]:
-        ac_props = {}
+    @staticmethod
+    def _convert_to_arrays(data: dict) -> Union[AircraftArrays, str]:
+        """
+        Converts the ACDATA stream data into an AircraftArrays. The unit conversions are
+        applied to each whole array at once
+        """
         try:
-            for i in range(len(data["id"])):
-                callsign = types.Callsign(data["id"][i])
-                ac_props[callsign] = props.AircraftProperties(
-                    aircraft_type=data["actype"][i],
-                    altitude=types.Altitude(data["alt"][i] / METERS_PER_FOOT),
-                    callsign=callsign,
-                    cleared_flight_level=None,
-                    ground_speed=types.GroundSpeed(int(data["gs"][i])),
-                    heading=types.Heading(int(data["trk"][i])),
-                    initial_flight_level=None,
-                    position=types.LatLon(data["lat"][i], data["lon"][i]),
-                    requested_flight_level=None,
-                    route_name=None,
-                    vertical_speed=types.VerticalSpeed(
-                        int(data["vs"][i] * 60 / METERS_PER_FOOT)
-                    ),
-                )
-            return ac_props
+            return AircraftArrays(
+                callsigns=[types.Callsign(x) for x in data["id"]],
+                aircraft_type=list(data["actype"]),
+                altitude=np.asarray(data["alt"], dtype=float) / METERS_PER_FOOT,
+                ground_speed=np.asarray(data["gs"], dtype=float).astype(int),
+                heading=np.asarray(data["trk"], dtype=float).astype(int),
+                lat=np.asarray(data["lat"], dtype=float),
+                lon=np.asarray(data["lon"], dtype=float),
+                vertical_speed=(
+                    np.asarray(data["vs"], dtype=float) * 60 / METERS_PER_FOOT
+                ).astype(int),
+            )
         except Exception:
             return f"Error parsing ac data from stream: {traceback.format_exc()}"
 
@@ -2,17 +2,25 @@
 Contains the BlueSky client class
 """
 # TODO(RKM 2019-11-21) Check all the proxy layer comments
+import itertools
 import json
 import logging
 import os
+import re
 import sys
 import time
-from copy import deepcopy
 from pathlib import Path
+from threading import Condition
+from threading import Lock
+from types import MappingProxyType
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 import msgpack
 import zmq
@@ -39,11 +47,21 @@ from bluesky.network.npcodec import decode_ndarray  # noqa: E402
 
 CMD_LOG_PREFIX = "C"
 
-# The BlueSky streams we subscribe to. 'ROUTEDATA' is also available
-ACTIVE_NODE_TOPICS = [b"ACDATA", b"SIMINFO", b"ROUTEDATA"]
+# Max. time (in milliseconds) that the receive thread blocks while waiting for data.
+# Also sets how quickly the thread exits once it has been stopped
+RECV_TIMEOUT = 100
 
-# Same rate as GuiClient polls for its data
-POLL_RATE = 50  # Hz
+# Max. number of messages handled from each socket per wakeup, so that a burst of stream
+# data can't hold up the event messages
+_MAX_DRAIN = 100
+
+# Streams for which only the latest frame is used. Any older frames which are still
+# queued when a newer one arrives are dropped without being decoded
+CONFLATED_TOPICS = {b"ACDATA", b"SIMINFO"}
+
+# Streams which BlueBird needs for the aircraft data and to confirm each step, so can't
+# be unsubscribed from
+REQUIRED_TOPICS = ["ACDATA", "SIMINFO"]
 
 # Events which should be ignored
 IGNORED_EVENTS = [b"DEFWPT", b"DISPLAYFLAG", b"PANZOOM", b"SHAPE"]
@@ -51,50 +69,171 @@ IGNORED_EVENTS = [b"DEFWPT", b"DISPLAYFLAG", b"PANZOOM", b"SHAPE"]
 # Tuple of strings which should not be considered error responses from BlueSky
 IGNORED_RESPONSES = ("TIME", "DEFWPT", "AREA", "BlueSky Console Window")
 
+# Token which is echoed back by BlueSky once it has processed a stack command. Sent as
+# "ECHO BBACK<id>" after each command, so the response can be matched to the request
+_ACK_PREFIX = "BBACK"
+_ACK_RE = re.compile(rf"\b{_ACK_PREFIX}(\d+)\b")
+
+
+class StreamSnapshot:
+    """
+    Immutable snapshot of the latest data received on a stream. A new snapshot is
+    created for each frame, so readers can hold on to one without copying it. If
+    created from a raw frame, the frame is only decoded when the data is first read
+    """
+
+    def __init__(self, seq: int, data: Any = None, raw: Optional[bytes] = None):
+        self.seq = seq
+        self._raw = raw
+        self._data = None if raw is not None else _freeze(data)
+        self._lock = Lock()
+
+    @property
+    def data(self) -> Union[MappingProxyType, Tuple]:
+        with self._lock:
+            if self._raw is not None:
+                self._data = _freeze(
+                    msgpack.unpackb(self._raw, object_hook=decode_ndarray, raw=False)
+                )
+                self._raw = None
+            return self._data
+
+
+def _freeze(data: Any) -> Union[MappingProxyType, Tuple]:
+    """Creates a read-only view of the stream data without copying any arrays"""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if isinstance(value, list):
+                data[key] = tuple(value)
+            elif hasattr(value, "flags"):
+                value.flags.writeable = False
+        return MappingProxyType(data)
+    return tuple(data) if data else ()
+
+
+def _conflate(msgs: Iterator[List[bytes]]) -> List[Tuple[bytes, bytes, bytes]]:
+    """
+    Splits the stream messages into (name, sender_id, data), keeping only the latest
+    frame for each of the CONFLATED_TOPICS. The order of the remaining frames is kept
+    """
+    frames: List[Optional[Tuple[bytes, bytes, bytes]]] = []
+    latest: Dict[bytes, int] = {}
+    for msg in msgs:
+        name, sender_id = msg[0][:-5], msg[0][-5:]
+        if name in CONFLATED_TOPICS:
+            if name in latest:
+                frames[latest[name]] = None
+            latest[name] = len(frames)
+        frames.append((name, sender_id, msg[1]))
+    return [x for x in frames if x]
+
+
+class _PendingCmd:
+    """A stack command which is waiting for its response from BlueSky"""
+
+    def __init__(self, cmd_id: int):
+        self.cmd_id = cmd_id
+        self.echo_data: List[str] = []
+        self.acked = False
+
 
 class BlueSkyClient(Client):
     """Client class for the BlueSky simulator"""
 
     @property
-    def aircraft_stream_data(self):
-        return deepcopy(self._aircraft_stream_data)
+    def aircraft_stream_data(self) -> MappingProxyType:
+        return self._aircraft_stream.data
+
+    @property
+    def aircraft_stream_seq(self) -> int:
+        return self._aircraft_stream.seq
 
     @property
-    def sim_info_stream_data(self):
-        return deepcopy(self._sim_info_data)
+    def sim_info_stream_data(self) -> Tuple:
+        return self._sim_info_stream.data
 
     def __init__(self):
-        super().__init__(ACTIVE_NODE_TOPICS)
+        super().__init__([x.encode() for x in Settings.BS_STREAM_TOPICS])
         self._logger = logging.getLogger(__name__)
-        self._aircraft_stream_data = {}
-        self._sim_info_data: List = []
-        self._route_data: Dict[str, Any] = {}
-
-        # Continually poll for the sim state
-        self.timer = Timer(self.receive, POLL_RATE)
+        # NOTE The stream data is only ever replaced, never modified, so the snapshots
+        # can be shared with readers on other threads
+        self._stream_seq = itertools.count(1)
+        self._aircraft_stream = StreamSnapshot(0, {})
+        self._sim_info_stream = StreamSnapshot(0, ())
+        self._route_data = StreamSnapshot(0, {})
+
+        # Continually receive data from BlueSky. NOTE The receive method blocks until
+        # there is data available, so the timer doesn't need to sleep between calls
+        self.timer = Timer(self.receive, None, timeout=RECV_TIMEOUT)
+        self._event_handlers: Dict[bytes, Callable[[Any], None]] = {
+            b"NODESCHANGED": self._handle_nodes_changed,
+            b"ECHO": self._handle_echo_event,
+            b"STEP": lambda _: self._handle_step(),
+            b"RESET": lambda _: self._handle_reset(),
+            b"QUIT": lambda _: self._handle_quit(),
+            b"SCENARIO": self._handle_scenario,
+        }
+        self._stream_handlers: Dict[bytes, Callable[[StreamSnapshot], None]] = {
+            b"ACDATA": self._handle_acdata,
+            b"SIMINFO": self._handle_siminfo,
+            b"ROUTEDATA": self._handle_routedata,
+        }
 
         # self.seed = None
         # self.step_dt = 1
 
         self._have_connection = False
         self._reset_flag = False
+        # Notified whenever a RESET event is received
+        self._reset_cond = Condition()
         self._step_flag = False
-        self._echo_data = []
+        # Notified whenever a STEP event or new SIMINFO data is received
+        self._step_cond = Condition()
+        # Stack commands are sent one message at a time, and any ECHO text received is
+        # attributed to the pending command until its acknowledgement arrives
+        self._stack_lock = Lock()
+        self._echo_cond = Condition()
+        self._cmd_ids = itertools.count()
+        self._pending_cmds: List[_PendingCmd] = []
         self._scn_response = None
+        # Notified whenever a SCENARIO response is received
+        self._scn_cond = Condition()
         self._awaiting_exit_resp = False
         self._last_stream_time = None
+        # Stream topics to subscribe to once the receive thread next wakes. NOTE The ZMQ
+        # sockets must only be used from the receive thread
+        self._topics_lock = Lock()
+        self._pending_topics: Optional[List[bytes]] = None
 
     def connect(self, *args, **kwargs):
+        self._set_socket_options()
         super().connect(*args, **kwargs)
         timeout = time.time() + 5
         while True:
-            self.receive()
+            self.receive(timeout=RECV_TIMEOUT)
             if self._have_connection:
                 break
-            time.sleep(0.1)
             if time.time() >= timeout:
                 raise TimeoutError("No data received from BlueSky")
 
+    def _set_socket_options(self) -> None:
+        """Applies the ZMQ socket settings. Must be called before connecting"""
+        opts = {
+            zmq.SNDHWM: Settings.BS_ZMQ_HWM,
+            zmq.RCVHWM: Settings.BS_ZMQ_HWM,
+            zmq.RCVBUF: Settings.BS_ZMQ_RCVBUF,
+            zmq.TCP_KEEPALIVE: (
+                None
+                if Settings.BS_TCP_KEEPALIVE is None
+                else int(Settings.BS_TCP_KEEPALIVE)
+            ),
+            zmq.TCP_KEEPALIVE_IDLE: Settings.BS_KEEPALIVE_IDLE,
+        }
+        for sock in (self.event_io, self.stream_in):
+            for opt, value in opts.items():
+                if value is not None:
+                    sock.setsockopt(opt, value)
+
     def start_timers(self) -> List[Timer]:
         """Start the client timer"""
         self.timer.start()
@@ -106,19 +245,60 @@ class BlueSkyClient(Client):
         # TODO(RKM 2019-11-21) Proxy layer should handle this
         # bluebird.logging.close_episode_log("client was stopped")
 
+    def set_stream_topics(self, topics: List[str]) -> Optional[str]:
+        """
+        Sets the BlueSky streams to subscribe to. Any other streams are unsubscribed
+        from. The change is applied the next time the receive thread wakes
+        """
+        unknown = [x for x in topics if x.encode() not in self._stream_handlers]
+        if unknown:
+            return f"Unknown stream topic(s): {unknown}"
+        missing = [x for x in REQUIRED_TOPICS if x not in topics]
+        if missing:
+            return f"Stream topic(s) {missing} are required"
+        with self._topics_lock:
+            self._pending_topics = [x.encode() for x in topics]
+        return None
+
+    def _apply_stream_topics(self) -> None:
+        with self._topics_lock:
+            topics, self._pending_topics = self._pending_topics, None
+        if topics is None:
+            return
+        if self.act:
+            for topic in set(self.acttopics) - set(topics):
+                self.unsubscribe(topic, self.act)
+            for topic in set(topics) - set(self.acttopics):
+                self.subscribe(topic, self.act)
+        self.acttopics = topics
+        self._logger.info(f"Subscribed to streams {topics}")
+
     def stream(self, name, data, sender_id):
         """Method called to process data received on a stream"""
-        if name == b"ACDATA":
-            self._aircraft_stream_data = data
-        elif name == b"SIMINFO":
-            self._sim_info_data = data
-        # TODO(RKM 2019-11-22) BlueSky is not currently set-up to send route data for
-        # all flights - only the ones that are "enabled" from the GUI...
-        elif name == b"ROUTEDATA":
-            self._route_data = data
+        self._handle_stream(name, data=data)
+
+    def _handle_stream(
+        self, name: bytes, data: Any = None, raw: Optional[bytes] = None
+    ) -> None:
+        handler = self._stream_handlers.get(name)
+        if handler:
+            handler(StreamSnapshot(next(self._stream_seq), data, raw))
         else:
             self._logger.warning(f'Unhandled data from stream "{name}"')
 
+    def _handle_acdata(self, snapshot: StreamSnapshot) -> None:
+        self._aircraft_stream = snapshot
+
+    def _handle_siminfo(self, snapshot: StreamSnapshot) -> None:
+        with self._step_cond:
+            self._sim_info_stream = snapshot
+            self._step_cond.notify_all()
+
+    def _handle_routedata(self, snapshot: StreamSnapshot) -> None:
+        # TODO(RKM 2019-11-22) BlueSky is not currently set-up to send route data for
+        # all flights - only the ones that are "enabled" from the GUI...
+        self._route_data = snapshot
+
     def send_stack_cmd(self, data=None, response_expected=False, target=b"*"):
         """Send a command to the BlueSky simulation command stack"""
 
@@ -127,20 +307,36 @@ class BlueSkyClient(Client):
         #     f"[{self._sim_state.sim_t}] {data}", extra={"PREFIX": CMD_LOG_PREFIX}
         # )
 
-        self._echo_data = []
-        self._logger.debug(f"STACKCMD: {data}")
-        self.send_event(b"STACKCMD", data, target)
+        with self._stack_lock:
+            echo_data = self._send_and_await_echo([data], target)[0]
+
+        return self._parse_echo_data(data, echo_data, response_expected)
+
+    def send_stack_cmds(self, cmds: List[str], target=b"*") -> List[Optional[str]]:
+        """
+        Send multiple commands to the BlueSky simulation command stack in a single
+        message. Returns the result for each command
+        """
+
+        with self._stack_lock:
+            all_echo_data = self._send_and_await_echo(cmds, target)
+
+        return [
+            self._parse_echo_data(cmd, echo_data, False)
+            for cmd, echo_data in zip(cmds, all_echo_data)
+        ]
 
-        time.sleep(25 / POLL_RATE)
+    def _parse_echo_data(self, data, echo_data: List[str], response_expected: bool):
+        """Converts the ECHO data received for a stack command into its result"""
 
-        if response_expected and self._echo_data:
-            return list(self._echo_data)
+        if response_expected and echo_data:
+            return echo_data
 
-        if self._echo_data:
-            if self._echo_data[0].startswith(IGNORED_RESPONSES):
+        if echo_data:
+            if echo_data[0].startswith(IGNORED_RESPONSES):
                 return None
-            self._logger.error(f"Command '{data}' resulted in error: {self._echo_data}")
-            errs = "\n".join(str(x) for x in self._echo_data)
+            self._logger.error(f"Command '{data}' resulted in error: {echo_data}")
+            errs = "\n".join(str(x) for x in echo_data)
             return str(f"Error(s): {errs}")
 
         if response_expected:
@@ -148,88 +344,84 @@ class BlueSkyClient(Client):
 
         return None
 
-    def receive(self, timeout=0):
-        try:
-            socks = dict(self.poller.poll(timeout))
-            if socks.get(self.event_io) == zmq.POLLIN:
-
-                self._have_connection = True
-
-                msg = self.event_io.recv_multipart()
+    def _send_and_await_echo(self, cmds: List[str], target) -> List[List[str]]:
+        """
+        Sends the stack commands, each followed by an ECHO of its acknowledgement token,
+        then waits until all the acknowledgements are received. If BlueSky never
+        acknowledges a command, we stop waiting once no new ECHO data has been received
+        for Settings.BS_CMD_TIMEOUT seconds. Returns the ECHO data for each command
+        """
+
+        pending_cmds = [_PendingCmd(next(self._cmd_ids)) for _ in cmds]
+        with self._echo_cond:
+            self._pending_cmds = pending_cmds
+
+        self._logger.debug(f"STACKCMD: {';'.join(cmds)}")
+        data = ";".join(
+            f"{cmd};ECHO {_ACK_PREFIX}{pending.cmd_id}"
+            for cmd, pending in zip(cmds, pending_cmds)
+        )
+        self.send_event(b"STACKCMD", data, target)
 
-                # Remove send-to-all flag if present
-                if msg[0] == b"*":
-                    msg.pop(0)
+        def _all_acked():
+            return all(x.acked for x in pending_cmds)
 
-                route, eventname, data = msg[:-2], msg[-2], msg[-1]
+        def _echo_count():
+            return sum(len(x.echo_data) for x in pending_cmds)
 
-                self.sender_id = route[0]
-                route.reverse()
-                pydata = (
-                    msgpack.unpackb(data, object_hook=decode_ndarray, raw=False)
-                    if data
-                    else None
+        with self._echo_cond:
+            n_echo = -1
+            while not _all_acked() and _echo_count() != n_echo:
+                n_echo = _echo_count()
+                self._echo_cond.wait_for(
+                    lambda: _all_acked() or _echo_count() > n_echo,
+                    timeout=Settings.BS_CMD_TIMEOUT,
                 )
-
-                self._logger.debug(f"EVT :: {eventname} :: {pydata}")
-
-                if eventname in IGNORED_EVENTS:
-                    self._logger.debug(f"Ignored event {eventname}")
-
-                # TODO Is this case relevant here?
-                elif eventname == b"NODESCHANGED":
-                    self.servers.update(pydata)
-                    self.nodes_changed.emit(pydata)
-
-                    # If this is the first known node, select it as active node
-                    nodes_myserver = next(iter(pydata.values())).get("nodes")
-                    if not self.act and nodes_myserver:
-                        self.actnode(nodes_myserver[0])
-
-                # TODO Also check the pydata contains 'syntax error' etc.
-                elif eventname == b"ECHO":
-                    text = pydata["text"]
-                    if text.startswith("Unknown command: METRICS"):
-                        self._logger.warning(
-                            'Ignored warning about invalid "METRICS" command'
-                        )
-                    elif not text.startswith("IC: Opened"):
-                        self._echo_data.append(text)
-
-                elif eventname == b"STEP":
-                    self._step_flag = True
-
-                elif eventname == b"RESET":
-                    self._reset_flag = True
-
-                elif eventname == b"QUIT":
-                    if self._awaiting_exit_resp:
-                        self._awaiting_exit_resp = False
-                    else:
-                        self._logger.error("Unhandled quit event from simulation")
-
-                elif eventname == b"SCENARIO":
-                    self._scn_response = pydata
-
+            self._pending_cmds = []
+
+        return [list(x.echo_data) for x in pending_cmds]
+
+    def _handle_echo(self, text: str) -> None:
+        """
+        Attributes ECHO text to the first pending stack command which has not yet been
+        acknowledged
+        """
+        with self._echo_cond:
+            ack = _ACK_RE.search(text)
+            if ack:
+                # NOTE Commands are processed in order, so this also acknowledges any
+                # earlier commands in the same batch
+                acked = [x for x in self._pending_cmds if x.cmd_id <= int(ack.group(1))]
+                if not acked:
+                    self._logger.debug(f"Ignored stale acknowledgement {text}")
+                for pending in acked:
+                    pending.acked = True
+            else:
+                pending = next((x for x in self._pending_cmds if not x.acked), None)
+                if pending:
+                    pending.echo_data.append(text)
                 else:
-                    self._logger.warning(
-                        'Unhandled eventname "{} with data {}"'.format(
-                            eventname, pydata
-                        )
-                    )
-                    self.event(eventname, pydata, self.sender_id)
+                    self._logger.debug(f"Ignored ECHO with no pending command: {text}")
+            self._echo_cond.notify_all()
 
-            if socks.get(self.stream_in) == zmq.POLLIN:
+    def receive(self, timeout=0):
+        """
+        Waits for up to timeout milliseconds for data from BlueSky, then handles all of
+        the messages which have been received
+        """
+        try:
+            self._apply_stream_topics()
+            socks = dict(self.poller.poll(timeout))
+            if socks.get(self.event_io) == zmq.POLLIN:
+                self._have_connection = True
+                for msg in self._drain(self.event_io):
+                    self._handle_event_msg(msg)
 
+            if socks.get(self.stream_in) == zmq.POLLIN:
                 self._last_stream_time = time.time()
-
-                msg = self.stream_in.recv_multipart()
-
-                strmname = msg[0][:-5]
-                sender_id = msg[0][-5:]
-                pydata = msgpack.unpackb(msg[1], object_hook=decode_ndarray, raw=False)
-
-                self.stream(strmname, pydata, sender_id)
+                # NOTE The frames are only decoded once their data is read
+                for strmname, _, data in _conflate(self._drain(self.stream_in)):
+                    self._handle_stream(strmname, raw=data)
 
             # TODO(RKM 2019-11-26) This should probably be based on the stream frequency
             if self._last_stream_time:
@@ -245,18 +437,97 @@ class BlueSkyClient(Client):
             self._logger.error(exc)
             return False
 
+    @staticmethod
+    def _drain(socket) -> Iterator[List[bytes]]:
+        """Receives the messages waiting on the socket without blocking"""
+        for _ in range(_MAX_DRAIN):
+            try:
+                yield socket.recv_multipart(zmq.NOBLOCK)
+            except zmq.Again:
+                return
+
+    def _handle_event_msg(self, msg: List[bytes]) -> None:
+        """Decodes an event message and passes it to the handler for its name"""
+
+        # Remove send-to-all flag if present
+        if msg[0] == b"*":
+            msg.pop(0)
+
+        route, eventname, data = msg[:-2], msg[-2], msg[-1]
+
+        self.sender_id = route[0]
+        route.reverse()
+
+        if eventname in IGNORED_EVENTS:
+            self._logger.debug("Ignored event %s", eventname)
+            return
+
+        pydata = (
+            msgpack.unpackb(data, object_hook=decode_ndarray, raw=False)
+            if data
+            else None
+        )
+
+        # NOTE Only format the payload if it will be logged
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"EVT :: {eventname} :: {pydata}")
+
+        handler = self._event_handlers.get(eventname)
+        if handler:
+            handler(pydata)
+            return
+
+        self._logger.warning(
+            'Unhandled eventname "{} with data {}"'.format(eventname, pydata)
+        )
+        self.event(eventname, pydata, self.sender_id)
+
+    # TODO Is this case relevant here?
+    def _handle_nodes_changed(self, pydata) -> None:
+        self.servers.update(pydata)
+        self.nodes_changed.emit(pydata)
+
+        # If this is the first known node, select it as active node
+        nodes_myserver = next(iter(pydata.values())).get("nodes")
+        if not self.act and nodes_myserver:
+            self.actnode(nodes_myserver[0])
+
+    # TODO Also check the pydata contains 'syntax error' etc.
+    def _handle_echo_event(self, pydata) -> None:
+        text = pydata["text"]
+        if text.startswith("Unknown command: METRICS"):
+            self._logger.warning('Ignored warning about invalid "METRICS" command')
+        elif not text.startswith("IC: Opened"):
+            self._handle_echo(text)
+
+    def _handle_step(self) -> None:
+        with self._step_cond:
+            self._step_flag = True
+            self._step_cond.notify_all()
+
+    def _handle_quit(self) -> None:
+        if self._awaiting_exit_resp:
+            self._awaiting_exit_resp = False
+        else:
+            self._logger.error("Unhandled quit event from simulation")
+
     @timeit("BlueSkyClient")
     def upload_new_scenario(self, name: str, lines: List[str]):
         """Uploads a new scenario file to the BlueSky simulation"""
 
-        self._scn_response = None
+        with self._scn_cond:
+            self._scn_response = None
 
         data = json.dumps({"name": name, "lines": lines})
         self.send_event(b"SCENARIO", data)
 
-        time.sleep(25 / POLL_RATE)
+        with self._scn_cond:
+            self._scn_cond.wait_for(
+                lambda: self._scn_response is not None,
+                timeout=Settings.BS_LOAD_TIMEOUT,
+            )
+            resp = self._scn_response
 
-        resp = self._scn_response
         if resp == "Ok":
             return None
         return resp if resp else "No response received"
@@ -269,7 +540,8 @@ class BlueSkyClient(Client):
         # self._logger.info(f"Episode {episode_id} started. Speed {speed}")
         # self._ac_data.set_log_rate(speed, new_log=True)
 
-        self._reset_flag = False
+        with self._reset_cond:
+            self._reset_flag = False
 
         err = self.send_stack_cmd("IC " + filename)
         if err:
@@ -300,25 +572,24 @@ class BlueSkyClient(Client):
         # )
         # TODO(RKM 2019-11-21) Validate this
 
-        init_t = self._sim_info_data[2]
+        init_t = self.sim_info_stream_data[2]
 
-        self._step_flag = False
-        self.send_event(b"STEP")
-
-        # Wait for the STEP response, and for the sim_t to have advanced
-        wait_t = 1 / POLL_RATE
-        total_t = 0
-        while not self._step_flag:
-            new_t = self._sim_info_data[2]
-            if new_t > init_t:
+        def _stepped():
+            return self._step_flag or self.sim_info_stream_data[2] > init_t
+
+        # NOTE The lock is held until we start waiting, so the receive thread
+        # can't signal the condition before we are ready for it
+        with self._step_cond:
+            self._step_flag = False
+            self.send_event(b"STEP")
+            # Wait for the STEP response, or for the sim_t to have advanced
+            if self._step_cond.wait_for(_stepped, timeout=Settings.BS_STEP_TIMEOUT):
                 return None
-            time.sleep(wait_t)
-            total_t += wait_t
-            if total_t >= 5:
-                return (
-                    f"Error: Step command failed (step_flag={self._step_flag} "
-                    f"init_t={init_t} new_t={new_t})"
-                )
+
+        return (
+            f"Error: Step command failed (step_flag={self._step_flag} "
+            f"init_t={init_t} new_t={self.sim_info_stream_data[2]})"
+        )
 
     def reset_sim(self) -> Optional[str]:
         """Resets the BlueSky sim and handles the response"""
@@ -327,18 +598,36 @@ class BlueSkyClient(Client):
         # self._ac_data.timer.disabled = True
         # bluebird.logging.close_episode_log("sim reset")
 
-        self._reset_flag = False
+        with self._reset_cond:
+            self._reset_flag = False
         err = self.send_stack_cmd("RESET")
         return err if err else self._await_reset_confirmation()
 
     def _await_reset_confirmation(self):
-        """Checks if a reset confirmation is received before the timeout"""
-        time.sleep(1)
-        return (
-            "Did not receive reset confirmation in time"
-            if not self._reset_flag
-            else None
-        )
+        """
+        Waits for a reset confirmation. Returns an error if it isn't received before the
+        timeout
+        """
+        # NOTE The flag is cleared before the command is sent, so the RESET event can't
+        # be missed if it arrives before we start waiting
+        with self._reset_cond:
+            if self._reset_cond.wait_for(
+                lambda: self._reset_flag, timeout=Settings.BS_LOAD_TIMEOUT
+            ):
+                return None
+        return "Did not receive reset confirmation in time"
+
+    def _handle_reset(self) -> None:
+        """Signals that a RESET event has been received"""
+        with self._reset_cond:
+            self._reset_flag = True
+            self._reset_cond.notify_all()
+
+    def _handle_scenario(self, resp) -> None:
+        """Stores the response to a scenario upload"""
+        with self._scn_cond:
+            self._scn_response = resp
+            self._scn_cond.notify_all()
 
     def quit(self):
         """Sends a shutdown message to the simulation server"""
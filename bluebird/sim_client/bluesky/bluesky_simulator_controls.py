@@ -1,14 +1,17 @@
 """
 Contains the AbstractSimulatorControls implementation for BlueSky
 """
+import hashlib
 import json
 import logging
 import traceback
+from collections import OrderedDict
 from datetime import datetime
 from io import StringIO
 from typing import Any
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import geojson
@@ -29,6 +32,9 @@ _BS_STATE_MAP = [
     props.SimState.END,
 ]
 
+# Max. number of uploaded scenarios which are cached
+_SCENARIO_CACHE_SIZE = 32
+
 
 class BlueSkySimulatorControls(AbstractSimulatorControls):
     """AbstractSimulatorControls implementation for BlueSky"""
@@ -45,32 +51,50 @@ class BlueSkySimulatorControls(AbstractSimulatorControls):
         self._logger = logging.getLogger(__name__)
         self._dt_mult: float = 1.0
         self._sector: Optional[props.Sector] = None
+        self._sector_json: Optional[str] = None
+        # The file name and parsed lines of each uploaded scenario, keyed by the hash of
+        # the sector and scenario content
+        self._scenario_cache: "OrderedDict[str, Tuple[str, List[str]]]" = OrderedDict()
 
     def load_sector(self, sector: props.Sector) -> Optional[str]:
         # NOTE(rkm 2020-01-03) This function is a no-op for BlueSky, since it doesn't
         # have separate concepts of sectors and scenarios. We only store the sector so
         # we can use it in load_scenario
         self._sector = sector
+        self._sector_json = None
         return None
 
     def load_scenario(self, scenario: Scenario) -> Optional[str]:
         assert self._sector
-        file_name = f"{scenario.name}.scn".lower()
         try:
-            # TODO(rkm 2020-01-03) What exceptions can this raise?
-            # NOTE(rkm 2020-01-03) Errors here (aviary parsing) may be caused by error
-            # in the previously stored sector definition
-            parser = BlueskyParser(
-                StringIO(geojson.dumps(self._sector.element)),
-                StringIO(json.dumps(scenario.content)),
-            )
-            scenario_lines = parser.all_lines()
-            # Write the parsed scenario to file to help with debugging
-            scn_file = Settings.DATA_DIR / "last_bluesky_scenario.scn"
-            with open(scn_file, "w+") as f:
-                f.write("\n".join(scenario_lines) + "\n")
+            if self._sector_json is None:
+                self._sector_json = geojson.dumps(self._sector.element)
+            scenario_json = json.dumps(scenario.content)
         except Exception as e:
             return f"Could not parse a BlueSky scenario: {e}"
+
+        key = hashlib.sha256(
+            f"{self._sector_json}\n{scenario_json}".encode()
+        ).hexdigest()
+
+        # NOTE If the same scenario has already been uploaded, then we only need to
+        # load it again. The file name includes the hash, so a cached name always
+        # refers to the same content
+        cached = self._scenario_cache.pop(key, None)
+        if cached:
+            file_name, scenario_lines = cached
+            err = self._bluesky_client.load_scenario(file_name)
+            if not err:
+                self._scenario_cache[key] = cached
+                return None
+            # The file may no longer exist, e.g. if BlueSky has been restarted
+            self._logger.warning(f"Could not load cached scenario {file_name}: {err}")
+        else:
+            file_name = f"{scenario.name}-{key[:8]}.scn".lower()
+            scenario_lines = self._parse_scenario(scenario_json)
+            if isinstance(scenario_lines, str):
+                return scenario_lines
+
         err = self._bluesky_client.upload_new_scenario(file_name, scenario_lines)
         if err:
             self._logger.debug(f"Scenario content was:{scenario_lines}")
@@ -79,6 +103,10 @@ class BlueSkySimulatorControls(AbstractSimulatorControls):
         if err:
             self._logger.debug(f"Scenario content was:{scenario_lines}")
             return err
+
+        self._scenario_cache[key] = (file_name, scenario_lines)
+        if len(self._scenario_cache) > _SCENARIO_CACHE_SIZE:
+            self._scenario_cache.popitem(last=False)
         return None
 
     def start(self) -> Optional[str]:
@@ -119,6 +147,22 @@ class BlueSkySimulatorControls(AbstractSimulatorControls):
             return err
         return None
 
+    def _parse_scenario(self, scenario_json: str) -> Union[List[str], str]:
+        """Converts the sector and scenario to BlueSky scenario lines"""
+        try:
+            # TODO(rkm 2020-01-03) What exceptions can this raise?
+            # NOTE(rkm 2020-01-03) Errors here (aviary parsing) may be caused by error
+            # in the previously stored sector definition
+            parser = BlueskyParser(StringIO(self._sector_json), StringIO(scenario_json))
+            scenario_lines = parser.all_lines()
+            # Write the parsed scenario to file to help with debugging
+            scn_file = Settings.DATA_DIR / "last_bluesky_scenario.scn"
+            with open(scn_file, "w+") as f:
+                f.write("\n".join(scenario_lines) + "\n")
+        except Exception as e:
+            return f"Could not parse a BlueSky scenario: {e}"
+        return scenario_lines
+
     @staticmethod
     def _parse_sim_state(val: int) -> props.SimState:
         assert 0 <= val < len(_BS_STATE_MAP)
@@ -4,6 +4,7 @@ BlueSky simulation client class
 # TODO: Need to re-add the tests for string parsing/units from the old API tests
 import os
 from typing import List
+from typing import Optional
 
 from semver import VersionInfo
 
@@ -15,6 +16,9 @@ from bluebird.utils.abstract_sim_client import AbstractSimClient
 from bluebird.utils.timer import Timer
 
 
+# ZMQ transports which BlueSky can be connected with
+_TRANSPORTS = ("tcp", "ipc")
+
 _BS_MIN_VERSION = os.getenv("BS_MIN_VERSION")
 if not _BS_MIN_VERSION:
     raise ValueError("The BS_MIN_VERSION environment variable must be set")
@@ -50,7 +54,13 @@ class SimClient(AbstractSimClient):
     def sim_version(self) -> VersionInfo:
         return self._client.host_version
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self, host: Optional[str] = None, port: Optional[int] = None, **kwargs
+    ):
+        # NOTE The stream port is assumed to be the next port after the event port, as
+        # is the default for BlueSky
+        self._host = host
+        self._port = port
         self._client = BlueSkyClient()
         self._aircraft_controls = BlueSkyAircraftControls(self._client)
         self._sim_controls = BlueSkySimulatorControls(self._client)
@@ -59,13 +69,25 @@ class SimClient(AbstractSimClient):
         return self._client.start_timers()
 
     def connect(self, timeout=1) -> None:
+        if Settings.BS_TRANSPORT not in _TRANSPORTS:
+            raise ValueError(
+                f'Invalid BlueSky transport "{Settings.BS_TRANSPORT}". Expected one '
+                f"of {_TRANSPORTS}"
+            )
+        # NOTE For IPC the endpoints are "ipc://<host>:<port>", so BlueSky must be
+        # bound to the same paths
         self._client.connect(
-            Settings.SIM_HOST,
-            event_port=Settings.BS_EVENT_PORT,
-            stream_port=Settings.BS_STREAM_PORT,
+            self._host or Settings.SIM_HOST,
+            event_port=self._port or Settings.BS_EVENT_PORT,
+            stream_port=self._port + 1 if self._port else Settings.BS_STREAM_PORT,
+            protocol=Settings.BS_TRANSPORT,
             timeout=timeout,
         )
 
     def shutdown(self, shutdown_sim: bool = False) -> bool:
         self._client.stop()
         return True
+
+    def set_stream_topics(self, topics: List[str]) -> Optional[str]:
+        """Sets the BlueSky streams which the client subscribes to"""
+        return self._client.set_stream_topics(topics)
@@ -14,6 +14,13 @@ from nats.mc_client.mc_client_metrics import MCClientMetrics
 import bluebird.utils.properties as props
 import bluebird.utils.types as types
 from bluebird.utils.abstract_aircraft_controls import AbstractAircraftControls
+from bluebird.utils.aircraft_arrays import AircraftArrays
+
+
+_FLIGHT_FILTER = [
+    MCClient.FlightPropertiesFilterOption.POS,
+    MCClient.FlightPropertiesFilterOption.FLIGHT_DATA,
+]
 
 
 class MachCollAircraftControls(AbstractAircraftControls):
@@ -28,21 +35,16 @@ class MachCollAircraftControls(AbstractAircraftControls):
         self,
     ) -> Union[Dict[types.Callsign, props.AircraftProperties], str]:
         # NOTE (rkm 2020-02-02) Would like to use get_active_flight_states_and_time
-        # here, but this returns data keyed by the internal identifiers
+        # here, but this returns data keyed by the internal identifiers. Instead, each
+        # aircraft is fetched individually, in parallel
         callsigns = self._mc_client().get_active_callsigns()
         # NOTE (rkm 2020-02-02) None response form get_active_callsigns may hide
         # connection loss
         if callsigns is None:
             callsigns = []
+        all_flight_props = self._map_fetch(self._fetch_flight, callsigns)
         all_props = {}
-        for callsign_str in callsigns:
-            flight_props = self._mc_client().get_active_flight_by_callsign(
-                callsign_str,
-                [
-                    MCClient.FlightPropertiesFilterOption.POS,
-                    MCClient.FlightPropertiesFilterOption.FLIGHT_DATA,
-                ],
-            )
+        for flight_props in all_flight_props:
             self._raise_for_no_data(flight_props)
             ac_props = self._parse_aircraft_properties(flight_props)
             if not isinstance(ac_props, props.AircraftProperties):
@@ -50,6 +52,21 @@ class MachCollAircraftControls(AbstractAircraftControls):
             all_props[ac_props.callsign] = ac_props
         return all_props
 
+    @property
+    def all_arrays(self) -> Union[AircraftArrays, str]:
+        # NOTE MCClient returns the data for each aircraft separately, so we have to go
+        # via the AircraftProperties here
+        all_props = self.all_properties
+        if not isinstance(all_props, dict):
+            return all_props
+        return AircraftArrays.from_properties(all_props)
+
+    @property
+    def data_version(self) -> Optional[int]:
+        # NOTE MCClient doesn't stream data, so we can't tell when the aircraft data
+        # changes
+        return None
+
     @property
     def callsigns(self) -> Union[List[types.Callsign], str]:
         callsigns = self._mc_client().get_active_callsigns()
@@ -99,6 +116,13 @@ class MachCollAircraftControls(AbstractAircraftControls):
     ) -> Optional[str]:
         return self._not_implemented_response("create")
 
+    def send_commands(
+        self, commands: List[props.AircraftCommand]
+    ) -> Union[List[Optional[str]], str]:
+        # NOTE MCClient has no way of sending multiple commands in one request, so we
+        # send each in turn
+        return [x.send_to(self) for x in commands]
+
     def properties(
         self, callsign: types.Callsign
     ) -> Optional[Union[props.AircraftProperties, str]]:
@@ -115,6 +139,16 @@ class MachCollAircraftControls(AbstractAircraftControls):
     def _mc_client(self) -> MCClientMetrics:
         return self._sim_client.mc_client
 
+    def _fetch_flight(self, callsign: str) -> dict:
+        return self._mc_client().get_active_flight_by_callsign(callsign, _FLIGHT_FILTER)
+
+    def _map_fetch(self, func, items: List) -> List:
+        """Calls func for each item, in parallel if the fetch threads are available"""
+        executor = self._sim_client.fetch_executor
+        if not executor or len(items) < 2:
+            return [func(x) for x in items]
+        return list(executor.map(func, items))
+
     @staticmethod
     def _parse_aircraft_properties(
         ac_props: dict,
@@ -3,9 +3,13 @@ Contains the AbstractSimulatorControls implementation for MachColl
 """
 import logging
 import re
+import traceback
 import uuid
 from datetime import datetime
 from datetime import timedelta
+from threading import Event
+from threading import Lock
+from threading import Thread
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -38,6 +42,20 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
         self._registered_metrics: List[str] = list(self._mc_metrics_provider.metrics)
         self._logger = logging.getLogger(__name__)
         self._scenario_start_time = 0
+        # NOTE The sim state, speed, and time are cached. They are refreshed in the
+        # background, and updated from the responses to any control commands. A value
+        # of None means the value is not known, and has to be requested from MachColl
+        self._props_lock = Lock()
+        self._sim_state: Optional[props.SimState] = None
+        self._sim_speed: Optional[Union[float, int]] = None
+        self._sim_time: Optional[Union[float, int]] = None
+        # Incremented each time the cache is modified
+        self._props_gen = 0
+        # Collects the sim state and time, and the metric results, for the previous step
+        self._metrics_thread: Optional[Thread] = None
+        # Cleared while the sim state and time for the previous step are being requested
+        self._step_props = Event()
+        self._step_props.set()
 
     @property
     def properties(self) -> Union[props.SimProperties, str]:
@@ -46,8 +64,7 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
         if not isinstance(sim_state, props.SimState):
             return sim_state
 
-        sim_speed = self._mc_client().get_speed()
-        self._raise_for_no_data(sim_speed)
+        sim_speed = self._get_sim_speed()
         if not isinstance(sim_speed, (float, int)):
             return sim_speed
 
@@ -128,6 +145,7 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
         if not isinstance(loaded_scenario, str):
             return f'Unsuccessful call to set_scenario_filename: "{loaded_scenario}"'
         self._scenario_start_time = self._parse_start_time(scenario.content)
+        self._set_cached(state=None, speed=None, time=None)
         return None
 
     # TODO Assert state is as expected after all of these methods (should be in the
@@ -141,7 +159,7 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
             return
         resp = self._mc_client().sim_start()
         self._raise_for_no_data(resp)
-        return None if self._is_success(resp) else str(resp)
+        return self._handle_control_resp(resp, props.SimState.RUN)
 
     def reset(self) -> Optional[str]:
         state = self._get_sim_state()
@@ -151,7 +169,7 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
             return
         resp = self._mc_client().sim_stop()
         self._raise_for_no_data(resp)
-        return None if self._is_success(resp) else str(resp)
+        return self._handle_control_resp(resp, props.SimState.INIT)
 
     def pause(self) -> Optional[str]:
         state = self._get_sim_state()
@@ -165,7 +183,7 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
             return None
         resp = self._mc_client().sim_pause()
         self._raise_for_no_data(resp)
-        return None if self._is_success(resp) else str(resp)
+        return self._handle_control_resp(resp, props.SimState.HOLD)
 
     def resume(self) -> Optional[str]:
         state = self._get_sim_state()
@@ -177,7 +195,7 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
             return "Can't resume sim from 'END' state"
         resp = self._mc_client().sim_resume()
         self._raise_for_no_data(resp)
-        return None if self._is_success(resp) else str(resp)
+        return self._handle_control_resp(resp, props.SimState.RUN)
 
     def stop(self) -> Optional[str]:
         state = self._get_sim_state()
@@ -187,16 +205,36 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
             return
         resp = self._mc_client().sim_stop()
         self._raise_for_no_data(resp)
-        return None if self._is_success(resp) else str(resp)
+        return self._handle_control_resp(resp, props.SimState.END)
 
     def step(self) -> Optional[str]:
-        self._mc_client().queue_metrics_query(*self._registered_metrics)
+        # NOTE The results for the previous step have to be collected before the next
+        # query is queued, otherwise they could be mixed up
+        self._wait_for_metrics()
+        # NOTE The metrics are queued and collected with their own client, since the
+        # results may still be being collected while the other clients are in use
+        metrics_client = self._sim_client.metrics_client
+        if self._registered_metrics:
+            metrics_client.queue_metrics_query(*self._registered_metrics)
         resp = self._mc_client().set_increment()
         self._raise_for_no_data(resp)
-        for metric in self._registered_metrics:
-            self._mc_metrics_provider.update(
-                metric, self._mc_client().get_metrics_result(metric)
-            )
+        # NOTE The new state and time aren't included in the response, so are requested
+        # along with the metric results. Reading the properties waits for them
+        props_gen = self._set_cached(state=None, time=None)
+        self._step_props.clear()
+        metrics_thread = Thread(
+            target=self._collect_metrics,
+            args=(metrics_client, props_gen),
+            name="bluebird-mc-metrics",
+            daemon=True,
+        )
+        metrics_thread.start()
+        with self._props_lock:
+            self._metrics_thread = metrics_thread
+        # NOTE Any errors collecting the metrics are logged, since the step itself has
+        # succeeded
+        if self._registered_metrics and Settings.MC_METRICS_WAIT:
+            self._wait_for_metrics()
         return None if self._is_success(resp) else str(resp)
 
     def set_speed(self, speed: float) -> Optional[str]:
@@ -207,6 +245,7 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
         )
         self._raise_for_no_data(resp)
         self._logger.warning(f"Unhandled data: {resp}")
+        self._set_cached(speed=None)
         return None if (resp == speed) else f"Unknown response: {resp}"
 
     def set_seed(self, seed: int) -> Optional[str]:
@@ -216,8 +255,42 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
         return self._sim_client.mc_client
 
     def _get_sim_state(self) -> Union[props.SimState, str]:
+        cached = self._get_cached("state")
+        if cached is not None:
+            return cached
+        sim_state = self._request_sim_state(self._mc_client())
+        if isinstance(sim_state, props.SimState):
+            self._set_cached(state=sim_state)
+        return sim_state
+
+    def _get_sim_speed(self) -> Union[float, int, str]:
+        cached = self._get_cached("speed")
+        if cached is not None:
+            return cached
+        sim_speed = self._mc_client().get_speed()
+        self._raise_for_no_data(sim_speed)
+        if isinstance(sim_speed, (float, int)):
+            self._set_cached(speed=sim_speed)
+        return sim_speed
+
+    def _get_sim_times(self) -> Union[Tuple[Union[float, int], datetime], str]:
+        resp = self._get_cached("time")
+        if resp is None:
+            resp = self._mc_client().get_time()
+            if not isinstance(resp, (float, int)):
+                return resp
+            self._set_cached(time=resp)
+        utc_datetime = (
+            datetime.combine(datetime.today(), datetime.min.time())
+            + timedelta(seconds=resp)
+        ).strftime("%Y-%m-%d %H:%M:%S")
+        scenario_time = resp - self._scenario_start_time
+        return (scenario_time, utc_datetime)
+
+    @staticmethod
+    def _request_sim_state(mc_client: MCClientMetrics) -> Union[props.SimState, str]:
         # TODO There is also a possible "stepping" mode (?)
-        resp = self._mc_client().get_state()
+        resp = mc_client.get_state()
         if not resp:
             return "Could not get state - no response received"
         if resp.upper() == "INIT":
@@ -230,16 +303,113 @@ class MachCollSimulatorControls(AbstractSimulatorControls):
             return props.SimState.HOLD
         return f"Could not parse a valid sim state value from {resp}"
 
-    def _get_sim_times(self) -> Union[Tuple[Union[float, int], datetime], str]:
-        resp = self._mc_client().get_time()
-        if not isinstance(resp, (float, int)):
-            return resp
-        utc_datetime = (
-            datetime.combine(datetime.today(), datetime.min.time())
-            + timedelta(seconds=resp)
-        ).strftime("%Y-%m-%d %H:%M:%S")
-        scenario_time = resp - self._scenario_start_time
-        return (scenario_time, utc_datetime)
+    def refresh_properties(self, mc_client: MCClientMetrics) -> None:
+        """
+        Requests the current sim state, speed, and time, and updates the cache. Must be
+        given a client which is only used by the calling thread
+        """
+        with self._props_lock:
+            props_gen = self._props_gen
+        try:
+            sim_state = self._request_sim_state(mc_client)
+            sim_speed = mc_client.get_speed()
+            sim_time = mc_client.get_time()
+        except Exception:
+            self._logger.warning(
+                f"Could not refresh the sim properties: {traceback.format_exc()}"
+            )
+            self._set_cached(state=None, speed=None, time=None)
+            return
+        with self._props_lock:
+            # NOTE The data is discarded if the cache was modified while it was
+            # requested, e.g. by a control command
+            if self._props_gen != props_gen:
+                return
+            is_state = isinstance(sim_state, props.SimState)
+            self._sim_state = sim_state if is_state else None
+            self._sim_speed = sim_speed if isinstance(sim_speed, (float, int)) else None
+            self._sim_time = sim_time if isinstance(sim_time, (float, int)) else None
+
+    def _get_cached(self, name: str):
+        """
+        Returns the cached property (one of state, speed, and time), or None if it isn't
+        known. Waits for any requested after a step
+        """
+        self._step_props.wait()
+        with self._props_lock:
+            return getattr(self, f"_sim_{name}")
+
+    def _set_cached(self, **kwargs) -> int:
+        """
+        Sets the given cached properties (any of state, speed, and time). Returns the
+        new generation of the cache
+        """
+        with self._props_lock:
+            for name, value in kwargs.items():
+                assert name in ("state", "speed", "time"), f"Unknown property {name}"
+                setattr(self, f"_sim_{name}", value)
+            self._props_gen += 1
+            return self._props_gen
+
+    def _collect_metrics(self, mc_client: MCClientMetrics, props_gen: int) -> None:
+        """
+        Requests the sim state and time, and caches them if nothing else has modified
+        the cache since the step. Then gets the result of each of the queued metrics,
+        and publishes them to the metrics provider as they arrive
+        """
+        sim_state = sim_time = None
+        try:
+            sim_state = self._request_sim_state(mc_client)
+            sim_time = mc_client.get_time()
+        except Exception:
+            self._logger.warning(
+                "Could not get the sim properties after the step: "
+                f"{traceback.format_exc()}"
+            )
+        finally:
+            with self._props_lock:
+                if self._props_gen == props_gen:
+                    if isinstance(sim_state, props.SimState):
+                        self._sim_state = sim_state
+                    if isinstance(sim_time, (float, int)):
+                        self._sim_time = sim_time
+            self._step_props.set()
+
+        if not self._registered_metrics:
+            return
+        if isinstance(sim_time, (float, int)):
+            sim_time = sim_time - self._scenario_start_time
+        else:
+            sim_time = None
+        try:
+            for metric in self._registered_metrics:
+                self._mc_metrics_provider.update(
+                    metric, mc_client.get_metrics_result(metric), sim_time
+                )
+        except Exception:
+            self._logger.error(f"Error collecting metrics: {traceback.format_exc()}")
+
+    def _wait_for_metrics(self) -> None:
+        """Waits for the results of the previous step to be collected"""
+        with self._props_lock:
+            metrics_thread = self._metrics_thread
+        if not metrics_thread:
+            return
+        metrics_thread.join()
+        with self._props_lock:
+            if self._metrics_thread is metrics_thread:
+                self._metrics_thread = None
+
+    def _handle_control_resp(self, resp, new_state: props.SimState) -> Optional[str]:
+        """
+        Checks the response to a control command, and updates the cached state. The
+        time is also cleared, since it may have been changed by the command
+        """
+        if not self._is_success(resp):
+            self._set_cached(state=None)
+            return str(resp)
+        self._set_cached(state=new_state, time=None)
+        return None
 
     @staticmethod
     def _is_success(data) -> bool:
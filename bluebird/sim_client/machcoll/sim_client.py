@@ -11,9 +11,13 @@ Stepping    -> Paused, Stopped
 # TODO(RKM 2019-11-27) Add logic to handle MachColl becoming unavailable
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from threading import current_thread
+from threading import local
+from threading import Lock
 from threading import main_thread
 from typing import List
+from typing import Optional
 
 from nats.mc_client.mc_client_metrics import MCClientMetrics
 from semver import VersionInfo
@@ -56,13 +60,44 @@ class SimClient(AbstractSimClient):
 
     @property
     def mc_client(self):
+        # NOTE Each of the fetch threads has its own client, since they can't be shared
+        # between threads
+        fetch_client = getattr(self._thread_local, "mc_client", None)
+        if fetch_client:
+            return fetch_client
         return (
             self._mc_client if current_thread() == main_thread() else self._mc_bg_client
         )
 
-    def __init__(self, metrics_providers: MetricsProviders):
+    @property
+    def metrics_client(self):
+        """
+        Client used to queue and collect the metric results for each step. Only used by
+        one thread at a time
+        """
+        return self._mc_metrics_client
+
+    @property
+    def fetch_executor(self) -> Optional[ThreadPoolExecutor]:
+        """Thread pool for making parallel requests to MachColl. None until connected"""
+        return self._fetch_executor
+
+    def __init__(
+        self,
+        metrics_providers: MetricsProviders,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+    ):
+        self._host = host
+        self._port = port
         self._mc_client = None
         self._mc_bg_client = None
+        self._mc_poll_client = None
+        self._mc_metrics_client = None
+        self._thread_local = local()
+        self._fetch_clients: List[MCClientMetrics] = []
+        self._fetch_clients_lock = Lock()
+        self._fetch_executor: Optional[ThreadPoolExecutor] = None
         self._server_version: VersionInfo = None
         self._logger = logging.getLogger(__name__)
         self._aircraft_controls = MachCollAircraftControls(self)
@@ -72,14 +107,18 @@ class SimClient(AbstractSimClient):
         )
 
     def connect(self, timeout: int = 1) -> None:
+        host = self._host or Settings.SIM_HOST
+        port = self._port or Settings.MC_PORT
         self._logger.info(
-            f"Creating MCClientMetrics. host={Settings.SIM_HOST} "
-            f"port={Settings.MC_PORT} MQ_URL={os.environ['MQ_URL']}"
-        )
-        self._mc_client = MCClientMetrics(host=Settings.SIM_HOST, port=Settings.MC_PORT)
-        self._mc_bg_client = MCClientMetrics(
-            host=Settings.SIM_HOST, port=Settings.MC_PORT
+            f"Creating MCClientMetrics. host={host} "
+            f"port={port} MQ_URL={os.environ['MQ_URL']}"
         )
+        self._mc_client = MCClientMetrics(host=host, port=port)
+        self._mc_bg_client = MCClientMetrics(host=host, port=port)
+        # NOTE The background refresh of the sim properties has its own client, since
+        # they can't be shared between threads
+        self._mc_poll_client = MCClientMetrics(host=host, port=port)
+        self._mc_metrics_client = MCClientMetrics(host=host, port=port)
 
         # Perform a request to initialise the connection
         if not self._mc_client.get_state():
@@ -90,18 +129,40 @@ class SimClient(AbstractSimClient):
         self._mc_metrics_provider.set_version(self._server_version)
         self._logger.info(f"MCClientMetrics connected. Version: {self._server_version}")
 
+        self._fetch_executor = ThreadPoolExecutor(
+            max_workers=Settings.MC_FETCH_WORKERS,
+            thread_name_prefix="bluebird-mc-fetch",
+            initializer=self._init_fetch_client,
+            initargs=(host, port),
+        )
+
     def start_timers(self) -> List[Timer]:
         # NOTE(RKM 2019-11-18) MCClientMetrics is passive for now - we don't have any
-        # stream data
-        return []
+        # stream data. Instead, the sim properties are polled in the background
+        timer = Timer(
+            self._sim_controls.refresh_properties,
+            Settings.MC_POLL_RATE,
+            self._mc_poll_client,
+        )
+        timer.start()
+        return [timer]
 
     def shutdown(self, shutdown_sim: bool = False) -> bool:
 
         # TODO(rkm 2020-02-02) Investigate OSError here, related to:
         # https://docs.python.org/3.7/reference/datamodel.html#object.__del__
+        if self._fetch_executor:
+            self._fetch_executor.shutdown(wait=True)
+        with self._fetch_clients_lock:
+            for fetch_client in self._fetch_clients:
+                fetch_client.close_mq()
+            self._fetch_clients.clear()
+
         if self.mc_client:
             self._mc_client.close_mq()
             self._mc_bg_client.close_mq()
+            self._mc_poll_client.close_mq()
+            self._mc_metrics_client.close_mq()
 
         # NOTE: Using the presence of _server_version to infer that we have a connection
         if not self._server_version:
@@ -126,3 +187,10 @@ class SimClient(AbstractSimClient):
         self._logger.warning("No sim shutdown method implemented")
         # return shutdown_ok
         return True
+
+    def _init_fetch_client(self, host: str, port: int) -> None:
+        """Creates the MCClientMetrics for the current fetch thread"""
+        fetch_client = MCClientMetrics(host=host, port=port)
+        self._thread_local.mc_client = fetch_client
+        with self._fetch_clients_lock:
+            self._fetch_clients.append(fetch_client)
@@ -0,0 +1,46 @@
+"""
+Contains the DataCache class
+"""
+from pathlib import Path
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+
+
+class DataCache:
+    """
+    Thread-safe cache of the (validated) sector and scenario data loaded from disk.
+    Entries are keyed by the file path, and are re-loaded if the file has been modified
+    since it was cached. One instance is shared by all the simulators in a SimPool, so
+    each file is only parsed once
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._entries: Dict[Path, Tuple[int, Any]] = {}
+
+    def get(self, path: Path, loader: Callable[[Path], Any]) -> Any:
+        """
+        Returns the cached data for the given file, or calls loader to load it. Results
+        of type str are treated as errors and are not cached. The returned data is
+        shared, so must not be modified
+        """
+
+        mtime = path.stat().st_mtime_ns
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry and entry[0] == mtime:
+            return entry[1]
+
+        data = loader(path)
+        if not isinstance(data, str):
+            with self._lock:
+                self._entries[path] = (mtime, data)
+        return data
+
+    def clear(self):
+        """Removes all cached data"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,184 @@
+"""
+Contains the FrameBroadcaster class
+"""
+import asyncio
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Condition
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from bluebird.settings import Settings
+from bluebird.sim_proxy.proxy_aircraft_controls import ProxyAircraftControls
+from bluebird.sim_proxy.proxy_simulator_controls import ProxySimulatorControls
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from bluebird.utils.properties import SimProperties
+from bluebird.utils.timer import Timer
+
+
+# The event loop and event of a waiting async subscriber
+_AsyncWaiter = Tuple[asyncio.AbstractEventLoop, asyncio.Event]
+
+
+@dataclass(frozen=True)
+class Frame:
+    """
+    Snapshot of the aircraft state which is shared by all subscribers. Must not be
+    modified
+
+    Attributes:
+        seq:                The proxy data_version the frame was created from
+        scenario_time:      The scenario time [s]
+        ac_arrays:          The aircraft state arrays
+        aircraft:           The aircraft data for each callsign, in the same format as
+                            the POS endpoint except that cleared_fl and requested_fl
+                            are not included, since they aren't in the arrays
+    """
+
+    seq: int
+    scenario_time: float
+    ac_arrays: AircraftArrays
+    aircraft: Dict[str, Dict[str, Any]]
+
+
+def _aircraft_data(ac_arrays: AircraftArrays) -> Dict[str, Dict[str, Any]]:
+    """Converts the aircraft arrays to a dict of the properties for each callsign"""
+    columns = zip(
+        ac_arrays.aircraft_type,
+        ac_arrays.altitude.tolist(),
+        ac_arrays.ground_speed.tolist(),
+        ac_arrays.heading.tolist(),
+        ac_arrays.lat.tolist(),
+        ac_arrays.lon.tolist(),
+        ac_arrays.vertical_speed.tolist(),
+    )
+    return {
+        str(callsign): {
+            "actype": actype,
+            "current_fl": alt,
+            "gs": gs,
+            "hdg": hdg,
+            "lat": lat,
+            "lon": lon,
+            "vs": vs,
+        }
+        for callsign, (actype, alt, gs, hdg, lat, lon, vs) in zip(
+            ac_arrays.callsigns, columns
+        )
+    }
+
+
+class FrameBroadcaster:
+    """
+    Publishes the latest aircraft state to any number of subscribers. The proxy is only
+    read once per tick (and only while there are subscribers), and a new Frame is only
+    created when the data has changed. Subscribers which are slower than the frame rate
+    skip straight to the latest frame. Subscribers can either block a thread while
+    waiting for a frame, or wait on an asyncio event loop
+    """
+
+    def __init__(
+        self,
+        aircraft_controls: ProxyAircraftControls,
+        simulator_controls: ProxySimulatorControls,
+    ):
+        self._logger = logging.getLogger(__name__)
+        self._aircraft_controls = aircraft_controls
+        self._simulator_controls = simulator_controls
+        self._cond = Condition()
+        self._frame: Optional[Frame] = None
+        self._subscribers = 0
+        self._async_waiters: Set[_AsyncWaiter] = set()
+        self._timer = Timer(self._publish, Settings.STREAM_RATE)
+
+    def start_timers(self) -> List[Timer]:
+        """Start any timed functions, and return all the Timer instances"""
+        self._timer.start()
+        return [self._timer]
+
+    @contextmanager
+    def subscribe(self) -> Iterator[None]:
+        """Registers a subscriber for the duration of the context"""
+        with self._cond:
+            self._subscribers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._subscribers -= 1
+
+    def wait_for_frame(
+        self, last_seq: Optional[int], timeout: float
+    ) -> Optional[Frame]:
+        """
+        Waits for a frame which is newer than last_seq. Returns None if no new frame is
+        available before the timeout
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._frame and self._frame.seq != last_seq, timeout
+            )
+            if self._frame and self._frame.seq != last_seq:
+                return self._frame
+        return None
+
+    async def wait_for_frame_async(
+        self, last_seq: Optional[int], timeout: float
+    ) -> Optional[Frame]:
+        """Same as wait_for_frame, but waits on the current event loop"""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cond:
+            if self._frame and self._frame.seq != last_seq:
+                return self._frame
+            self._async_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._cond:
+                self._async_waiters.discard(waiter)
+        with self._cond:
+            if self._frame and self._frame.seq != last_seq:
+                return self._frame
+        return None
+
+    def _publish(self):
+        """Creates a new frame if there are subscribers and the data has changed"""
+
+        with self._cond:
+            if not self._subscribers:
+                return
+
+        ac_arrays = self._aircraft_controls.all_arrays
+        if not isinstance(ac_arrays, AircraftArrays):
+            self._logger.warning(f"Could not get aircraft data: {ac_arrays}")
+            return
+        seq = self._aircraft_controls.data_version
+        if self._frame and self._frame.seq == seq:
+            return
+
+        sim_props = self._simulator_controls.properties
+        if not isinstance(sim_props, SimProperties):
+            self._logger.warning(f"Could not get sim properties: {sim_props}")
+            return
+
+        frame = Frame(
+            seq, sim_props.scenario_time, ac_arrays, _aircraft_data(ac_arrays)
+        )
+        with self._cond:
+            self._frame = frame
+            self._cond.notify_all()
+            async_waiters = list(self._async_waiters)
+        for loop, event in async_waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # NOTE The loop has been closed
+                pass
@@ -1,63 +1,225 @@
 """
 Contains the ProxyAircraftControls class
 """
-import copy
+import dataclasses
 import logging
+from collections import deque
+from threading import Lock
+from threading import RLock
+from types import MappingProxyType
+from typing import Deque
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Tuple
 from typing import Union
 
+import numpy as np
 from aviary.sector.route import Route
 from aviary.sector.sector_element import SectorElement
 
 import bluebird.utils.types as types
+from bluebird.settings import Settings
 from bluebird.utils.abstract_aircraft_controls import AbstractAircraftControls
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from bluebird.utils.properties import AircraftCommand
 from bluebird.utils.properties import AircraftProperties
+from bluebird.utils.spatial_index import SpatialIndex
+
+
+# The AircraftProperties fields which are updated with data from the simulator
+_SIM_FIELDS = ("altitude", "ground_speed", "heading", "position", "vertical_speed")
+
+# The AircraftArrays fields which are compared to find the aircraft which have changed
+_ARRAY_FIELDS = ("altitude", "ground_speed", "heading", "lat", "lon", "vertical_speed")
+
+
+class _PropsView(Mapping[types.Callsign, Optional[AircraftProperties]]):
+    """
+    Read-only view of the aircraft properties at a single data_version. The
+    AircraftProperties for each aircraft are only created when first accessed
+    """
+
+    def __init__(
+        self,
+        ac_arrays: Optional[AircraftArrays],
+        base_props: Dict[types.Callsign, Optional[AircraftProperties]],
+    ):
+        # NOTE Neither of these may be modified after the view is created
+        self._ac_arrays = ac_arrays
+        self._base_props = base_props
+        self._props: Dict[types.Callsign, Optional[AircraftProperties]] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, callsign: types.Callsign) -> Optional[AircraftProperties]:
+        with self._lock:
+            if callsign not in self._props:
+                self._props[callsign] = self._create(callsign)
+            return self._props[callsign]
+
+    def __contains__(self, callsign) -> bool:
+        return callsign in self._base_props
+
+    def __iter__(self) -> Iterator[types.Callsign]:
+        return iter(self._base_props)
+
+    def __len__(self) -> int:
+        return len(self._base_props)
+
+    def _create(self, callsign: types.Callsign) -> Optional[AircraftProperties]:
+        """
+        Merges the simulator data for the specified aircraft with the properties which
+        are only tracked by the proxy
+        """
+        base_props = self._base_props[callsign]
+        if self._ac_arrays is None or callsign not in self._ac_arrays:
+            return base_props
+        sim_props = self._ac_arrays.properties(callsign)
+        # NOTE(rkm 2020-01-12) If we don't have any existing properties, then that means
+        # this is an aircraft that has been created after the scenario has been started.
+        # We therefore (currently) don't have any route or req. flight level information
+        if not base_props:
+            return sim_props
+        return dataclasses.replace(
+            base_props, **{x: getattr(sim_props, x) for x in _SIM_FIELDS}
+        )
+
+
+def _changed_callsigns(
+    prev_arrays: Optional[AircraftArrays], ac_arrays: AircraftArrays
+) -> List[types.Callsign]:
+    """
+    Returns the callsigns of the aircraft in ac_arrays which are new or have changed
+    since prev_arrays
+    """
+    if prev_arrays is None:
+        return list(ac_arrays.callsigns)
+    prev_idx = np.array(
+        [prev_arrays.index.get(x, -1) for x in ac_arrays.callsigns], dtype=int
+    )
+    known = prev_idx >= 0
+    changed = ~known
+    prev_idx = prev_idx[known]
+    for name in _ARRAY_FIELDS:
+        values = getattr(ac_arrays, name)[known]
+        changed[known] |= values != getattr(prev_arrays, name)[prev_idx]
+    return [ac_arrays.callsigns[x] for x in np.flatnonzero(changed)]
 
 
 class ProxyAircraftControls(AbstractAircraftControls):
     """Proxy implementation of AbstractAircraftControls"""
 
     @property
-    def all_properties(self) -> Union[Dict[types.Callsign, AircraftProperties], str]:
+    def all_properties(
+        self,
+    ) -> Union[Mapping[types.Callsign, Optional[AircraftProperties]], str]:
+        """
+        A read-only view of the current aircraft properties. The AircraftProperties are
+        only created for the aircraft which are accessed
+        """
         self._logger.debug("all_properties: Accessed")
-        if self._data_valid:
-            self._logger.debug("all_properties: Using cache")
-            return self._ac_props
-        all_props = self._aircraft_controls.all_properties
-        if not isinstance(all_props, dict):
-            return all_props
-        for callsign in list(self._ac_props):
-            if callsign not in all_props:
-                self._logger.warning(
-                    f"all_properties: Aircraft {callsign} has "
-                    "been removed from the simulation"
-                )
-                self._ac_props.pop(callsign, None)
-                continue
-            self._update_ac_properties(callsign, all_props[callsign])
-        self._logger.debug("all_properties: Data now valid")
-        self._data_valid = True
-        return self._ac_props
+        with self._lock:
+            err = self._refresh()
+            if err:
+                return err
+            return self._current_props()
+
+    @property
+    def data_version(self) -> Optional[int]:
+        """
+        Incremented each time the cached aircraft data is refreshed or modified. Can be
+        passed to changed_since to find which aircraft have changed
+        """
+        return self._data_version
+
+    @property
+    def all_arrays(self) -> Union[AircraftArrays, str]:
+        """
+        The current aircraft data as an AircraftArrays. This is the data received from
+        the simulator, and doesn't include any of the properties tracked by the proxy
+        """
+        with self._lock:
+            err = self._refresh()
+            if err:
+                return err
+            return self._arrays
+
+    def spatial_index(
+        self, hor_dist_m: float, vert_dist_ft: float
+    ) -> Union[SpatialIndex, str]:
+        """
+        Returns a SpatialIndex of the current aircraft positions, for finding the pairs
+        of aircraft within the given distances. Only re-created when the cached data or
+        the distances change
+        """
+        with self._lock:
+            ac_arrays = self.all_arrays
+            if not isinstance(ac_arrays, AircraftArrays):
+                return ac_arrays
+            key = (self._data_version, hor_dist_m, vert_dist_ft)
+            if not self._spatial_index or self._spatial_index[0] != key:
+                index = SpatialIndex(ac_arrays, hor_dist_m, vert_dist_ft)
+                self._spatial_index = (key, index)
+            return self._spatial_index[1]
+
+    def stable_index(self, ac_arrays: AircraftArrays) -> Dict[types.Callsign, int]:
+        """
+        Returns a map of each callsign to a fixed index, which is kept until the
+        simulation is reset or a new scenario is loaded. Any aircraft in ac_arrays which
+        have not been seen before are assigned the next free index
+        """
+        with self._lock:
+            for callsign in ac_arrays.callsigns:
+                if callsign not in self._stable_index:
+                    self._stable_index[callsign] = len(self._stable_index)
+            return dict(self._stable_index)
+
+    @property
+    def oldest_since(self) -> int:
+        """
+        The oldest data_version which can be passed to changed_since. Increases as the
+        records of removed aircraft are pruned
+        """
+        return self._oldest_since
 
     @property
     def callsigns(self) -> Union[List[types.Callsign], str]:
-        if not self._data_valid:
-            err = self.all_properties
-            if isinstance(err, str):
+        with self._lock:
+            err = self._refresh()
+            if err:
                 return err
-        return list(self._ac_props.keys())
+            return list(self._base_props)
 
     def __init__(self, aircraft_controls: AbstractAircraftControls):
         self._logger = logging.getLogger(__name__)
         self._aircraft_controls = aircraft_controls
 
-        self._ac_props: Dict[types.Callsign, Optional[AircraftProperties]] = {}
-        self._prev_ac_props: Dict[types.Callsign, Optional[AircraftProperties]] = {}
+        # The properties which aren't tracked by the simulator for each known aircraft,
+        # or None for aircraft which were created after the scenario was loaded
+        self._base_props: Dict[types.Callsign, Optional[AircraftProperties]] = {}
+        # The simulator data for the known aircraft
+        self._arrays: Optional[AircraftArrays] = None
+        # The view of the current properties. Re-created when the data_version changes
+        self._props_view: Optional[_PropsView] = None
+        # The aircraft properties stored at each of the previous steps, newest last
+        self._history: Deque[
+            Mapping[types.Callsign, Optional[AircraftProperties]]
+        ] = deque(maxlen=Settings.STATE_HISTORY)
         self._routes: Dict[str, Route] = {}
+        # NOTE The cached data is re-used until it is invalidated, or until the
+        # simulator reports that newer data is available
+        self._lock = RLock()
         self._data_valid: bool = False
+        self._data_version: int = 0
+        self._sim_data_version: Optional[int] = None
+        # The data_version at which each aircraft was last changed or removed
+        self._changed: Dict[types.Callsign, int] = {}
+        self._removed: Dict[types.Callsign, int] = {}
+        self._oldest_since: int = 0
+        self._spatial_index: Optional[Tuple[Tuple, SpatialIndex]] = None
+        self._stable_index: Dict[types.Callsign, int] = {}
 
     def set_cleared_fl(
         self, callsign: types.Callsign, flight_level: types.Altitude, **kwargs
@@ -65,7 +227,7 @@ class ProxyAircraftControls(AbstractAircraftControls):
         err = self._aircraft_controls.set_cleared_fl(callsign, flight_level, **kwargs)
         if err:
             return err
-        self._ac_props[callsign].cleared_flight_level = flight_level
+        self._set_cleared_fl(callsign, flight_level)
         return None
 
     def set_heading(
@@ -86,14 +248,9 @@ class ProxyAircraftControls(AbstractAircraftControls):
     def direct_to_waypoint(
         self, callsign: types.Callsign, waypoint: str
     ) -> Optional[str]:
-        props = self.properties(callsign)
-        if not isinstance(props, AircraftProperties):
-            return props
-        if not props.route_name:
-            return "Aircraft has no route"
-        route_waypoints = [x[0] for x in self._routes[props.route_name].fix_list]
-        if waypoint not in route_waypoints:
-            return f'Waypoint "{waypoint}" is not in the route {route_waypoints}'
+        err = self._check_waypoint_on_route(callsign, waypoint)
+        if err:
+            return err
         return self._aircraft_controls.direct_to_waypoint(callsign, waypoint)
 
     def create(
@@ -118,15 +275,58 @@ class ProxyAircraftControls(AbstractAircraftControls):
         if err:
             return err
         # Create an empty entry for the new aircraft and ensure we get new data back
-        self._ac_props[callsign] = None
-        self._data_valid = False
+        with self._lock:
+            self._base_props[callsign] = None
+            self._props_view = None
+            self._data_valid = False
         all_properties = self.all_properties
-        if not isinstance(all_properties, dict):
+        if isinstance(all_properties, str):
             return all_properties
         return (
             None if callsign in all_properties else "New callsign missing from sim data"
         )
 
+    def send_commands(
+        self, commands: List[AircraftCommand]
+    ) -> Union[List[Optional[str]], str]:
+        """
+        Validates all the commands against the current aircraft data, then forwards the
+        valid ones to the simulator as a single batch. Commands which fail validation
+        are not sent
+        """
+        callsigns = self.callsigns
+        if not isinstance(callsigns, list):
+            return callsigns
+        callsigns = set(callsigns)
+
+        results: List[Optional[str]] = [None] * len(commands)
+        to_send: List[int] = []
+        for idx, command in enumerate(commands):
+            if command.callsign not in callsigns:
+                results[idx] = f'Aircraft "{command.callsign}" does not exist'
+            elif command.name == "direct":
+                results[idx] = self._check_waypoint_on_route(
+                    command.callsign, command.args["waypoint"]
+                )
+            if not results[idx]:
+                to_send.append(idx)
+
+        if not to_send:
+            return results
+
+        sim_results = self._aircraft_controls.send_commands(
+            [commands[idx] for idx in to_send]
+        )
+        if not isinstance(sim_results, list):
+            return sim_results
+
+        for idx, err in zip(to_send, sim_results):
+            results[idx] = err
+            command = commands[idx]
+            if not err and command.name == "alt":
+                self._set_cleared_fl(command.callsign, command.args["alt"])
+        return results
+
     def exists(self, callsign: types.Callsign) -> Union[bool, str]:
         all_callsings = self.callsigns
         return (
@@ -138,7 +338,7 @@ class ProxyAircraftControls(AbstractAircraftControls):
     def properties(self, callsign: types.Callsign) -> Union[AircraftProperties, str]:
         """Utility function to return only the properties for the specified aircraft"""
         all_props = self.all_properties
-        if not isinstance(all_props, dict):
+        if isinstance(all_props, str):
             return all_props
         return all_props.get(callsign, None) or f"Unknown callsign {callsign}"
 
@@ -156,21 +356,58 @@ class ProxyAircraftControls(AbstractAircraftControls):
         )
         return (props.route_name, next_waypoint, [x[0] for x in route.fix_list])
 
+    def changed_since(
+        self, version: int
+    ) -> Union[Tuple[List[types.Callsign], List[types.Callsign]], str]:
+        """
+        Returns the callsigns of the aircraft which have changed, and of those which
+        have been removed, since the specified data_version
+        """
+        err = self.all_properties
+        if isinstance(err, str):
+            return err
+        with self._lock:
+            if version < self._oldest_since:
+                return (
+                    f"Invalid version ({version}). The removed aircraft are only "
+                    f"stored since data_version {self._oldest_since}"
+                )
+            changed = [x for x, v in self._changed.items() if v > version]
+            removed = [x for x, v in self._removed.items() if v > version]
+        return changed, removed
+
     def invalidate_data(self, clear: bool = False) -> None:
         """Clears the data_valid flag"""
-        if clear:
-            self._ac_props = {}
-            self._prev_ac_props = {}
-        self._data_valid = False
+        with self._lock:
+            if clear:
+                self._data_version += 1
+                for callsign in list(self._base_props):
+                    self._remove(callsign, self._data_version)
+                self._arrays = None
+                self._history.clear()
+                self._stable_index.clear()
+            self._data_valid = False
 
     def store_current_props(self):
         # TODO(rkm 2020-01-12) In sandbox mode, this needs to be hooked-up to a timer
         # which stores the current state every n seconds
-        self._prev_ac_props = copy.deepcopy(self._ac_props)
+        # NOTE The views are never modified, so we only need to keep a reference to each
+        with self._lock:
+            self._history.append(self._current_props())
 
-    def prev_ac_props(self) -> Dict[types.Callsign, Optional[AircraftProperties]]:
-        # NOTE(rkm 2020-01-29) Defensive copy
-        return copy.deepcopy(self._prev_ac_props)
+    def prev_ac_props(
+        self, steps: int = 1
+    ) -> Mapping[types.Callsign, Optional[AircraftProperties]]:
+        """
+        Returns a read-only view of the aircraft properties from the specified number
+        of steps ago, or an empty mapping if they are not stored. The returned
+        properties must not be modified
+        """
+        assert steps > 0, "Steps must be positive"
+        with self._lock:
+            if steps > len(self._history):
+                return MappingProxyType({})
+            return self._history[-steps]
 
     def set_initial_properties(
         self, sector_element: SectorElement, scenario_content: dict
@@ -198,22 +435,105 @@ class ProxyAircraftControls(AbstractAircraftControls):
                 if self._routes[x].fix_names() == aircraft_route_waypoints
             )
 
-        self._ac_props = new_props
-        self._data_valid = False
+        with self._lock:
+            self._data_version += 1
+            for callsign in set(self._base_props) - set(new_props):
+                self._remove(callsign, self._data_version)
+            for callsign in new_props:
+                self._changed[callsign] = self._data_version
+                self._removed.pop(callsign, None)
+            self._base_props = new_props
+            self._arrays = None
+            self._props_view = None
+            self._stable_index.clear()
+            self._data_valid = False
 
-    def _update_ac_properties(
-        self, callsign: types.Callsign, new_props: AircraftProperties
-    ):
-        """Updates the stored AircraftProperties with new data from the simulator"""
-        # NOTE(rkm 2020-01-12) If we don't have any existing properties, then that means
-        # this is an aircraft that has been created after the scenario has been started.
-        # We therefore (currently) don't have any route or req. flight level information
-        if not self._ac_props[callsign]:
-            self._ac_props[callsign] = new_props
-        else:
-            props = self._ac_props[callsign]
-            props.altitude = new_props.altitude
-            props.ground_speed = new_props.ground_speed
-            props.heading = new_props.heading
-            props.position = new_props.position
-            props.vertical_speed = new_props.vertical_speed
+    def _check_waypoint_on_route(
+        self, callsign: types.Callsign, waypoint: str
+    ) -> Optional[str]:
+        """Checks that the waypoint is on the route of the specified aircraft"""
+        props = self.properties(callsign)
+        if not isinstance(props, AircraftProperties):
+            return props
+        if not props.route_name:
+            return "Aircraft has no route"
+        route_waypoints = [x[0] for x in self._routes[props.route_name].fix_list]
+        if waypoint not in route_waypoints:
+            return f'Waypoint "{waypoint}" is not in the route {route_waypoints}'
+        return None
+
+    def _refresh(self) -> Optional[str]:
+        """
+        Fetches new data from the simulator if the cached data is invalid or out of
+        date, and records which aircraft have changed. Returns any error
+        """
+        sim_version = self._aircraft_controls.data_version
+        if self._data_valid and (
+            sim_version is None or sim_version == self._sim_data_version
+        ):
+            self._logger.debug("_refresh: Using cache")
+            return None
+        sim_arrays = self._aircraft_controls.all_arrays
+        if not isinstance(sim_arrays, AircraftArrays):
+            return sim_arrays
+        version = self._data_version + 1
+        for callsign in [x for x in self._base_props if x not in sim_arrays]:
+            self._logger.warning(
+                f"_refresh: Aircraft {callsign} has been removed from the simulation"
+            )
+            self._remove(callsign, version)
+        # NOTE Any aircraft in the simulation which we don't know about are ignored
+        callsigns = list(self._base_props)
+        ac_arrays = (
+            sim_arrays
+            if callsigns == sim_arrays.callsigns
+            else sim_arrays.select(callsigns)
+        )
+        for callsign in _changed_callsigns(self._arrays, ac_arrays):
+            self._changed[callsign] = version
+            self._removed.pop(callsign, None)
+        self._logger.debug(f"_refresh: Data now valid (v{sim_version})")
+        self._arrays = ac_arrays
+        self._props_view = None
+        self._sim_data_version = sim_version
+        self._data_version = version
+        self._data_valid = True
+        return None
+
+    def _current_props(self) -> _PropsView:
+        """Returns the view of the current aircraft properties"""
+        if self._props_view is None:
+            self._props_view = _PropsView(self._arrays, dict(self._base_props))
+        return self._props_view
+
+    def _set_cleared_fl(
+        self, callsign: types.Callsign, flight_level: types.Altitude
+    ) -> None:
+        """Records a new cleared flight level for the specified aircraft"""
+        with self._lock:
+            if callsign not in self._base_props:
+                return
+            props = self._base_props[callsign]
+            if not props:
+                # Aircraft created after the scenario was loaded
+                if self._arrays is None or callsign not in self._arrays:
+                    return
+                props = self._arrays.properties(callsign)
+            self._data_version += 1
+            self._base_props[callsign] = dataclasses.replace(
+                props, cleared_flight_level=flight_level
+            )
+            self._props_view = None
+            self._changed[callsign] = self._data_version
+
+    def _remove(self, callsign: types.Callsign, version: int) -> None:
+        """Removes the specified aircraft from the cache"""
+        self._base_props.pop(callsign, None)
+        self._props_view = None
+        self._changed.pop(callsign, None)
+        # NOTE The entry is re-inserted so that _removed stays ordered by version
+        self._removed.pop(callsign, None)
+        self._removed[callsign] = version
+        while len(self._removed) > Settings.REMOVED_HISTORY:
+            oldest = next(iter(self._removed))
+            self._oldest_since = max(self._oldest_since, self._removed.pop(oldest))
@@ -17,6 +17,7 @@ from typing import Union
 from aviary.sector.sector_element import SectorElement
 
 from bluebird.settings import Settings
+from bluebird.sim_proxy.data_cache import DataCache
 from bluebird.sim_proxy.proxy_aircraft_controls import ProxyAircraftControls
 from bluebird.utils.abstract_simulator_controls import AbstractSimulatorControls
 from bluebird.utils.properties import Scenario
@@ -33,6 +34,18 @@ from bluebird.utils.timeutils import timeit
 SIM_LOG_RATE = 0.2
 
 
+def _read_sector_file(sector_file: Path) -> Union[SectorElement, str]:
+    with open(sector_file) as f:
+        sector_json = json.load(f)
+    return validate_geojson_sector(sector_json)
+
+
+def _read_scenario_file(scenario_file: Path) -> Union[dict, str]:
+    with open(scenario_file) as f:
+        scenario = json.load(f)
+    return validate_json_scenario(scenario) or scenario
+
+
 class ProxySimulatorControls(AbstractSimulatorControls):
     """Proxy implementation of AbstractSimulatorControls"""
 
@@ -40,11 +53,14 @@ class ProxySimulatorControls(AbstractSimulatorControls):
         self,
         sim_controls: AbstractSimulatorControls,
         proxy_aircraft_controls: ProxyAircraftControls,
+        data_cache: Optional[DataCache] = None,
     ):
         self._logger = logging.getLogger(__name__)
         self._timer = Timer(self._log_sim_props, SIM_LOG_RATE)
         self._sim_controls = sim_controls
         self._proxy_aircraft_controls = proxy_aircraft_controls
+        # NOTE The data cache may be shared with other ProxySimulatorControls instances
+        self._data_cache = data_cache or DataCache()
         # NOTE(rkm 2020-01-22) We assume here that the seed is persistent for the
         # current simulation instance, even through calls to load_sector/reset etc.
         self._seed: Optional[int] = None
@@ -56,7 +72,9 @@ class ProxySimulatorControls(AbstractSimulatorControls):
     @property
     def properties(self) -> Union[SimProperties, str]:
         if not self._sim_props or not self._data_valid:
-            sim_props = copy.deepcopy(self._sim_controls.properties)
+            # NOTE SimProperties only contains immutable values, so a shallow copy is
+            # enough to avoid modifying the simulator's instance
+            sim_props = copy.copy(self._sim_controls.properties)
             if not isinstance(sim_props, SimProperties):
                 return sim_props
             self._update_sim_props(sim_props)
@@ -248,9 +266,7 @@ class ProxySimulatorControls(AbstractSimulatorControls):
         self._logger.debug(f"Loading sector from {sector_file}")
         if not sector_file.exists():
             return f"No sector file at {sector_file}"
-        with open(sector_file) as f:
-            sector_json = json.load(f)
-        return validate_geojson_sector(sector_json)
+        return self._data_cache.get(sector_file, _read_sector_file)
 
     def _save_sector_to_file(self, sector: Sector):
         sector_file = self._sector_filename(sector.name)
@@ -269,9 +285,7 @@ class ProxySimulatorControls(AbstractSimulatorControls):
         self._logger.debug(f"Loading scenario from {scenario_file}")
         if not scenario_file.exists():
             return f"No scenario file at {scenario_file}"
-        with open(scenario_file) as f:
-            scenario = json.load(f)
-        return validate_json_scenario(scenario) or scenario
+        return self._data_cache.get(scenario_file, _read_scenario_file)
 
     def _save_scenario_to_file(self, scenario: Scenario):
         scenario_file = self._scenario_filename(scenario.name)
@@ -0,0 +1,85 @@
+"""
+Contains the SimPool class
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import ItemsView
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from bluebird.sim_proxy.sim_proxy import SimProxy
+from bluebird.utils.timer import Timer
+
+
+class SimPool:
+    """
+    Pool of SimProxy instances, one for each simulator environment managed by this
+    BlueBird instance. Environments are identified by a string ID, and the first one is
+    used as the default
+    """
+
+    @property
+    def default(self) -> SimProxy:
+        return self._sim_proxies[self._default_id]
+
+    @property
+    def env_ids(self) -> List[str]:
+        return list(self._sim_proxies)
+
+    def __init__(self, sim_proxies: Dict[str, SimProxy]):
+        assert sim_proxies, "Expected at least one SimProxy"
+        self._logger = logging.getLogger(__name__)
+        self._sim_proxies = dict(sim_proxies)
+        self._default_id = next(iter(self._sim_proxies))
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self._sim_proxies), thread_name_prefix="sim-pool"
+        )
+
+    def __len__(self):
+        return len(self._sim_proxies)
+
+    def __iter__(self) -> Iterator[SimProxy]:
+        yield from self._sim_proxies.values()
+
+    def get(self, env_id: str) -> Optional[SimProxy]:
+        """Returns the SimProxy for the given environment, or None if not found"""
+        return self._sim_proxies.get(env_id)
+
+    def items(self) -> ItemsView[str, SimProxy]:
+        return self._sim_proxies.items()
+
+    def map(
+        self, func: Callable[[str, SimProxy], Any], env_ids: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Calls func with the ID and SimProxy of each of the given environments
+        concurrently, and waits for all of them to complete. Returns the results for
+        each environment. Any exception raised by func is re-raised here
+        """
+        futures = {
+            x: self._executor.submit(func, x, self._sim_proxies[x]) for x in env_ids
+        }
+        return {x: y.result() for x, y in futures.items()}
+
+    def start_timers(self) -> List[Timer]:
+        """Starts the timers for each simulator, and returns all the Timer instances"""
+        return [timer for x in self for timer in x.start_timers()]
+
+    def shutdown(self, shutdown_sim: bool = False) -> bool:
+        """
+        Shuts down each simulator client. Returns True only if all were shut down
+        successfully
+        """
+        all_ok = True
+        for env_id, sim_proxy in self.items():
+            try:
+                all_ok &= sim_proxy.shutdown(shutdown_sim)
+            except Exception as exc:
+                self._logger.error(f"Error shutting down env {env_id}: {exc}")
+                all_ok = False
+        self._executor.shutdown(wait=False)
+        return all_ok
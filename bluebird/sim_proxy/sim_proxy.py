@@ -10,11 +10,17 @@ Contains the SimProxy class
 # aware that some properties may change without their knowledge
 import logging
 from typing import List
+from typing import Optional
+from typing import Union
 
 from semver import VersionInfo
 
+import bluebird.utils.types as types
 from bluebird.metrics import MetricsProviders
 from bluebird.metrics.abstract_metrics_provider import AbstractMetricsProvider
+from bluebird.metrics.abstract_metrics_provider import BulkResult
+from bluebird.sim_proxy.data_cache import DataCache
+from bluebird.sim_proxy.frame_broadcaster import FrameBroadcaster
 from bluebird.sim_proxy.proxy_aircraft_controls import ProxyAircraftControls
 from bluebird.sim_proxy.proxy_simulator_controls import ProxySimulatorControls
 from bluebird.utils.abstract_sim_client import AbstractSimClient
@@ -40,7 +46,10 @@ class SimProxy(AbstractSimClient):
         return self._sim_client.sim_version
 
     def __init__(
-        self, sim_client: AbstractSimClient, metrics_providers: MetricsProviders
+        self,
+        sim_client: AbstractSimClient,
+        metrics_providers: MetricsProviders,
+        data_cache: Optional[DataCache] = None,
     ):
         self._logger = logging.getLogger(__name__)
 
@@ -50,11 +59,16 @@ class SimProxy(AbstractSimClient):
         # The proxy implementations
         self._proxy_aircraft_controls = ProxyAircraftControls(self._sim_client.aircraft)
         self._proxy_simulator_controls = ProxySimulatorControls(
-            self._sim_client.simulation, self._proxy_aircraft_controls
+            self._sim_client.simulation, self._proxy_aircraft_controls, data_cache
         )
 
         self.metrics_providers = metrics_providers
 
+        # Publishes the aircraft state to any stream subscribers
+        self.frames = FrameBroadcaster(
+            self._proxy_aircraft_controls, self._proxy_simulator_controls
+        )
+
     def connect(self, timeout: int = 1) -> None:
         self._sim_client.connect(timeout)
 
@@ -62,11 +76,12 @@ class SimProxy(AbstractSimClient):
         return [
             *self._sim_client.start_timers(),
             *self._proxy_simulator_controls.start_timers(),
+            *self.frames.start_timers(),
         ]
 
     def pre_fetch_data(self):
         """Called on startup to fetch the initial state"""
-        _ = self._sim_client.aircraft.all_properties
+        _ = self._sim_client.aircraft.all_arrays
         _ = self._sim_client.simulation.properties
 
     def shutdown(self, shutdown_sim: bool = False) -> bool:
@@ -83,6 +98,13 @@ class SimProxy(AbstractSimClient):
             self._logger.error(err)
         return self._sim_client.shutdown(shutdown_sim)
 
+    def set_stream_topics(self, topics: List[str]) -> Optional[str]:
+        """
+        Sets the simulator data streams to subscribe to. Only supported for BlueSky
+        """
+        # NOTE The API checks the simulator type before this is called
+        return self._sim_client.set_stream_topics(topics)
+
     def call_metric_function(
         self, provider: AbstractMetricsProvider, metric_name: str, args: list
     ):
@@ -95,3 +117,26 @@ class SimProxy(AbstractSimClient):
             aircraft_controls=self._proxy_aircraft_controls,
             simulator_controls=self._proxy_simulator_controls
         )
+
+    def call_bulk_metric_function(
+        self,
+        provider: AbstractMetricsProvider,
+        metric_name: str,
+        pairwise: bool,
+        callsigns: Optional[List[types.Callsign]] = None,
+    ) -> Union[BulkResult, str]:
+        """
+        Calls the metric specified for each of the given aircraft (or each pair of
+        aircraft). Defaults to all aircraft in the simulation
+        """
+        if callsigns is None:
+            callsigns = self._proxy_aircraft_controls.callsigns
+            if not isinstance(callsigns, list):
+                return callsigns
+        return provider.bulk(
+            metric_name,
+            callsigns,
+            pairwise,
+            aircraft_controls=self._proxy_aircraft_controls,
+            simulator_controls=self._proxy_simulator_controls
+        )
@@ -10,6 +10,7 @@ from typing import Union
 
 import bluebird.utils.properties as props
 import bluebird.utils.types as types
+from bluebird.utils.aircraft_arrays import AircraftArrays
 
 # TODO(rkm 2020-01-12) Refactor the properties here into normal functions, since they
 # don't really have a trivial implementation
@@ -27,6 +28,23 @@ class AbstractAircraftControls(ABC):
         Properties of all aircraft in the scenario, or a string to indicate an error
         """
 
+    @property
+    @abstractmethod
+    def all_arrays(self) -> Union[AircraftArrays, str]:
+        """
+        The state of all aircraft in the scenario as an AircraftArrays, or a string to
+        indicate an error
+        """
+
+    @property
+    @abstractmethod
+    def data_version(self) -> Optional[int]:
+        """
+        A number which increases whenever new aircraft data is available from the
+        simulator, or None if this is not known. Used to decide when cached aircraft
+        data can be re-used
+        """
+
     @property
     @abstractmethod
     def callsigns(self) -> Union[List[types.Callsign], str]:
@@ -108,6 +126,19 @@ class AbstractAircraftControls(ABC):
         indicate an error
         """
 
+    @abstractmethod
+    def send_commands(
+        self, commands: List[props.AircraftCommand]
+    ) -> Union[List[Optional[str]], str]:
+        """
+        Send a batch of aircraft commands to the simulator. Where supported, the whole
+        batch is sent in a single request
+        :param commands: The commands to send, in order
+        :returns List: A result for each command - None if it was accepted, or a string
+        to indicate an error
+        :returns str: To indicate an error with the batch as a whole
+        """
+
     @abstractmethod
     def properties(
         self, callsign: types.Callsign
@@ -0,0 +1,129 @@
+"""
+Contains the AircraftArrays class
+"""
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import List
+
+import numpy as np
+
+import bluebird.utils.properties as props
+import bluebird.utils.types as types
+
+
+@dataclass
+class AircraftArrays:
+    """
+    Columnar (struct-of-arrays) representation of the state of all aircraft in the
+    simulation. Element i of each array refers to callsigns[i]. Units are the same as
+    for the equivalent AircraftProperties fields:
+
+    Attributes:
+        callsigns:          Aircraft callsigns
+        aircraft_type:      Aircraft types
+        altitude:           Altitudes [ft]
+        ground_speed:       Ground speeds [m/s]
+        heading:            Headings [°] (int)
+        lat:                Latitudes [°]
+        lon:                Longitudes [°]
+        vertical_speed:     Vertical speeds [ft/min] (int)
+        index:              Map of callsign to array index
+    """
+
+    callsigns: List[types.Callsign]
+    aircraft_type: List[str]
+    altitude: np.ndarray
+    ground_speed: np.ndarray
+    heading: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    vertical_speed: np.ndarray
+    index: Dict[types.Callsign, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.index = {x: i for i, x in enumerate(self.callsigns)}
+        assert len(self.index) == len(self.callsigns), "Callsigns must be unique"
+        assert all(
+            len(getattr(self, x)) == len(self.callsigns)
+            for x in (
+                "aircraft_type",
+                "altitude",
+                "ground_speed",
+                "heading",
+                "lat",
+                "lon",
+                "vertical_speed",
+            )
+        ), "Expected all arrays to have the same length"
+        # NOTE The AircraftProperties are only created when accessed, so the values are
+        # checked here instead. These are the same checks as in the types module
+        assert np.all(self.altitude >= 0), "Altitude must be positive"
+        assert np.all(self.ground_speed >= 0), "Ground speed must be positive"
+        assert np.all(np.abs(self.lat) <= 90), "Latitude must satisfy abs(x) <= 90"
+        assert np.all(np.abs(self.lon) <= 180), "Longitude must satisfy abs(x) <= 180"
+
+    def __len__(self):
+        return len(self.callsigns)
+
+    def __contains__(self, callsign: types.Callsign):
+        return callsign in self.index
+
+    def properties(self, callsign: types.Callsign) -> props.AircraftProperties:
+        """
+        Creates the AircraftProperties for the specified aircraft. Properties which
+        aren't tracked by the simulator (i.e. flight levels and routes) are not set
+        """
+        i = self.index[callsign]
+        return props.AircraftProperties(
+            aircraft_type=self.aircraft_type[i],
+            altitude=types.Altitude(self.altitude[i].item()),
+            callsign=callsign,
+            cleared_flight_level=None,
+            ground_speed=types.GroundSpeed(self.ground_speed[i].item()),
+            heading=types.Heading(self.heading[i].item()),
+            initial_flight_level=None,
+            position=types.LatLon(self.lat[i].item(), self.lon[i].item()),
+            requested_flight_level=None,
+            route_name=None,
+            vertical_speed=types.VerticalSpeed(self.vertical_speed[i].item()),
+        )
+
+    def all_properties(self) -> Dict[types.Callsign, props.AircraftProperties]:
+        """Creates the AircraftProperties for all aircraft"""
+        return {x: self.properties(x) for x in self.callsigns}
+
+    def select(self, callsigns: List[types.Callsign]) -> "AircraftArrays":
+        """Creates a new AircraftArrays containing only the specified aircraft"""
+        idx = np.array([self.index[x] for x in callsigns], dtype=int)
+        return AircraftArrays(
+            callsigns=list(callsigns),
+            aircraft_type=[self.aircraft_type[x] for x in idx],
+            altitude=self.altitude[idx],
+            ground_speed=self.ground_speed[idx],
+            heading=self.heading[idx],
+            lat=self.lat[idx],
+            lon=self.lon[idx],
+            vertical_speed=self.vertical_speed[idx],
+        )
+
+    @classmethod
+    def from_properties(
+        cls, all_props: Dict[types.Callsign, props.AircraftProperties]
+    ) -> "AircraftArrays":
+        """Creates an AircraftArrays from a dict of AircraftProperties"""
+        values = list(all_props.values())
+        return cls(
+            callsigns=list(all_props),
+            aircraft_type=[x.aircraft_type for x in values],
+            altitude=np.array([x.altitude.feet for x in values], dtype=float),
+            ground_speed=np.array(
+                [x.ground_speed.meters_per_sec for x in values], dtype=float
+            ),
+            heading=np.array([x.heading.degrees for x in values], dtype=int),
+            lat=np.array([x.position.lat_degrees for x in values], dtype=float),
+            lon=np.array([x.position.lon_degrees for x in values], dtype=float),
+            vertical_speed=np.array(
+                [x.vertical_speed.feet_per_min for x in values], dtype=int
+            ),
+        )
@@ -0,0 +1,30 @@
+"""
+Msgpack encoding for numpy arrays. Uses the same format as BlueSky's npcodec module, so
+data can be decoded by either
+"""
+from typing import Any
+
+import numpy as np
+
+
+def encode_ndarray(obj: Any) -> Any:
+    """Msgpack encoder for numpy arrays. Use as the default argument of packb"""
+    if isinstance(obj, np.ndarray):
+        return {
+            b"numpy": True,
+            b"type": obj.dtype.str,
+            b"shape": obj.shape,
+            b"data": obj.tobytes(),
+        }
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+
+def decode_ndarray(obj: dict) -> Any:
+    """Msgpack decoder for numpy arrays. Use as the object_hook argument of unpackb"""
+    if obj.get(b"numpy") is not None:
+        return np.frombuffer(obj[b"data"], dtype=np.dtype(obj[b"type"])).reshape(
+            obj[b"shape"]
+        )
+    return obj
@@ -5,8 +5,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import IntEnum
 from typing import Any
+from typing import ClassVar
 from typing import Dict
 from typing import Optional
+from typing import Tuple
 
 from aviary.sector.sector_element import SectorElement
 
@@ -142,3 +144,42 @@ class AircraftProperties:
             route_name=None,
             vertical_speed=None,
         )
+
+
+@dataclass
+class AircraftCommand:
+    """
+    A single aircraft command, as sent in a batch via
+    AbstractAircraftControls.send_commands
+
+    Attributes:
+        name:       The command name. One of AircraftCommand.NAMES
+        callsign:   The aircraft to send the command to
+        args:       The parsed arguments for the command, keyed by their API names
+    """
+
+    NAMES: ClassVar[Tuple[str, ...]] = ("alt", "hdg", "gspd", "direct")
+
+    name: str
+    callsign: types.Callsign
+    args: Dict[str, Any]
+
+    def __post_init__(self):
+        assert self.name in self.NAMES, f"Unsupported command '{self.name}'"
+
+    def send_to(self, aircraft_controls) -> Optional[str]:
+        """
+        Sends the command individually using the given AbstractAircraftControls
+        instance. Returns None if the command was sent, or a string to indicate an error
+        """
+        if self.name == "alt":
+            return aircraft_controls.set_cleared_fl(
+                self.callsign, self.args["alt"], vspd=self.args.get("vspd")
+            )
+        if self.name == "hdg":
+            return aircraft_controls.set_heading(self.callsign, self.args["hdg"])
+        if self.name == "gspd":
+            return aircraft_controls.set_ground_speed(self.callsign, self.args["gspd"])
+        return aircraft_controls.direct_to_waypoint(
+            self.callsign, self.args["waypoint"]
+        )
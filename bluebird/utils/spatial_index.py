@@ -0,0 +1,98 @@
+"""
+Contains the SpatialIndex class
+"""
+import itertools
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from bluebird.utils.aircraft_arrays import AircraftArrays
+
+
+EARTH_RADIUS_M = 6_371_008.8
+
+# Offsets to each of the neighbouring grid cells (including the cell itself)
+_NEIGHBOURS = list(itertools.product((-1, 0, 1), repeat=3))
+
+# Max. latitude used when sizing the longitude cells, to avoid very large cells near the
+# poles
+_MAX_LAT = 89.0
+
+
+def horizontal_distance(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """Returns the great-circle distance [m] between each pair of points [°]"""
+    lat1, lon1, lat2, lon2 = (np.radians(x) for x in (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+class SpatialIndex:
+    """
+    Grid index of aircraft positions, for finding the pairs of aircraft which are within
+    a given horizontal and vertical distance of each other. The cells are sized so that
+    only the aircraft in neighbouring cells need to be compared. Note that the grid does
+    not wrap at ±180° longitude
+    """
+
+    def __init__(
+        self, ac_arrays: AircraftArrays, hor_dist_m: float, vert_dist_ft: float
+    ):
+        assert hor_dist_m > 0 and vert_dist_ft > 0, "Distances must be positive"
+        self.ac_arrays = ac_arrays
+        self.hor_dist_m = hor_dist_m
+        self.vert_dist_ft = vert_dist_ft
+
+        lat_cell = np.degrees(hor_dist_m / EARTH_RADIUS_M)
+        max_lat = min(np.max(np.abs(ac_arrays.lat), initial=0), _MAX_LAT)
+        lon_cell = lat_cell / np.cos(np.radians(max_lat))
+        cells = np.stack(
+            [
+                np.floor(ac_arrays.lat / lat_cell),
+                np.floor(ac_arrays.lon / lon_cell),
+                np.floor(ac_arrays.altitude / vert_dist_ft),
+            ],
+            axis=1,
+        ).astype(int)
+
+        grid: Dict[Tuple[int, int, int], List[int]] = {}
+        for idx, cell in enumerate(map(tuple, cells)):
+            grid.setdefault(cell, []).append(idx)
+        self._grid = {x: np.array(y, dtype=int) for x, y in grid.items()}
+
+    def pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the indices (i, j) of the pairs of aircraft which are within the
+        distances of each other. Each pair is only returned once, with i < j
+        """
+
+        all_i = [np.array([], dtype=int)]
+        all_j = [np.array([], dtype=int)]
+        for cell, members in self._grid.items():
+            for offset in _NEIGHBOURS:
+                others = self._grid.get(tuple(x + y for x, y in zip(cell, offset)))
+                if others is None:
+                    continue
+                i, j = (x.ravel() for x in np.meshgrid(members, others, indexing="ij"))
+                keep = i < j
+                all_i.append(i[keep])
+                all_j.append(j[keep])
+        i, j = np.concatenate(all_i), np.concatenate(all_j)
+
+        ac_arrays = self.ac_arrays
+        in_range = (
+            horizontal_distance(
+                ac_arrays.lat[i], ac_arrays.lon[i], ac_arrays.lat[j], ac_arrays.lon[j]
+            )
+            <= self.hor_dist_m
+        ) & (np.abs(ac_arrays.altitude[i] - ac_arrays.altitude[j]) <= self.vert_dist_ft)
+        i, j = i[in_range], j[in_range]
+
+        order = np.lexsort((j, i))
+        return i[order], j[order]
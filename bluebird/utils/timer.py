@@ -14,7 +14,9 @@ class Timer(Thread):
     def __init__(self, method, tickrate, *args, **kwargs):
         """
         :param method: The method to call periodically
-        :param tickrate: The rate per second at which the method is called
+        :param tickrate: The rate per second at which the method is called. If None,
+        the method is called again as soon as it returns, so should block until it has
+        work to do
         :param args: Positional arguments to call the method with
         :param kwargs: Keyword arguments to call the method with
         """
@@ -24,8 +26,10 @@ class Timer(Thread):
         self._event = Event()
         self._cmd = lambda: method(*args, **kwargs)
 
-        self._check_rate(tickrate)
-        self._sleep_time = 1 / tickrate
+        self._sleep_time = 0
+        if tickrate is not None:
+            self._check_rate(tickrate)
+            self._sleep_time = 1 / tickrate
 
         self.disabled = False
         self.started = False
@@ -43,7 +47,11 @@ class Timer(Thread):
             while not self._event.is_set():
                 if not self.disabled:
                     self._cmd()
-                sleep(self._sleep_time)
+                elif not self._sleep_time:
+                    # NOTE Avoid a busy loop while disabled
+                    self._event.wait(0.1)
+                if self._sleep_time:
+                    sleep(self._sleep_time)
         except Exception:
             self._logger.error("Thread threw an exception")
             self.exc_info = sys.exc_info()
@@ -32,7 +32,28 @@ def _parse_args() -> Dict[str, Any]:
         action=_ARG_BOOL_ACTION,
         help="Resets the simulation on connection",
     )
+    parser.add_argument(
+        "--sim-pool",
+        type=str,
+        nargs="+",
+        metavar="ADDRESS",
+        help="Addresses (host or host:port) of each simulator to connect to, when "
+        "running a pool of simulators",
+    )
     parser.add_argument("--log-rate", type=float, help="Log rate in sim-seconds")
+    parser.add_argument(
+        "--stream-topics",
+        type=str,
+        nargs="+",
+        metavar="TOPIC",
+        help="The BlueSky data streams to subscribe to",
+    )
+    parser.add_argument(
+        "--async-server",
+        action=_ARG_BOOL_ACTION,
+        help="Serve the API with an async (ASGI) server instead of the Flask "
+        "development server",
+    )
     # NOTE(RKM 2019-11-21) Disabled until we re-implement the free-run mode
     # parser.add_argument(
     #     "--sim-mode",
@@ -46,6 +67,9 @@ def _parse_args() -> Dict[str, Any]:
     if args.sim_host:
         Settings.SIM_HOST = args.sim_host
 
+    if args.sim_pool:
+        Settings.SIM_POOL = args.sim_pool
+
     if args.log_rate:
         if args.log_rate < 0:
             raise ValueError("Rate must be positive")
@@ -57,6 +81,12 @@ def _parse_args() -> Dict[str, Any]:
     if args.sim_type:
         Settings.SIM_TYPE = args.sim_type
 
+    if args.stream_topics:
+        Settings.BS_STREAM_TOPICS = [x.upper() for x in args.stream_topics]
+
+    if args.async_server:
+        Settings.ASYNC_SERVER = True
+
     return vars(args)
 
 
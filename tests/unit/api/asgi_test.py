@@ -0,0 +1,202 @@
+"""
+Tests for the ASGI adapter
+"""
+import asyncio
+import json
+import time
+from http import HTTPStatus
+from unittest import mock
+
+import bluebird.api as bluebird_api
+from bluebird.api.asgi import AsgiAdapter
+from bluebird.api.asgi import set_async_body
+from bluebird.api.asgi import SHUTDOWN_KEY
+from bluebird.api.resources.utils.utils import FLASK_CONFIG_LABEL
+from tests.unit.api.resources import endpoint_path
+
+
+def _call(adapter: AsgiAdapter, method: str, path: str, body: bytes = b""):
+    """
+    Calls the adapter with a single HTTP request, and returns the start message and the
+    full response body
+    """
+
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query.encode(),
+        "http_version": "1.1",
+        "headers": [(b"content-length", str(len(body)).encode())] if body else [],
+    }
+    sent = []
+    received = []
+
+    async def receive():
+        # NOTE Like a real server, blocks after the request body has been received
+        if received:
+            await asyncio.Event().wait()
+        received.append(body)
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    async def run():
+        await adapter(scope, receive, send)
+        return sent[0], b"".join(x.get("body", b"") for x in sent[1:])
+
+    return run()
+
+
+def test_asgi_adapter_flask_app():
+    """Tests that requests are passed to the Flask app"""
+
+    app_mock = mock.Mock()
+    bluebird_api.FLASK_APP.config[FLASK_CONFIG_LABEL] = app_mock
+    provider = mock.Mock()
+    provider.__str__ = lambda _: "TestProvider"
+    provider.version.return_value = "1.2.3"
+    app_mock.sim_proxy.metrics_providers = [provider]
+
+    adapter = AsgiAdapter(bluebird_api.FLASK_APP, max_workers=2)
+    try:
+        start, body = asyncio.run(
+            _call(adapter, "GET", endpoint_path("metricproviders"))
+        )
+    finally:
+        adapter.shutdown()
+
+    assert start["status"] == HTTPStatus.OK
+    assert (b"content-type", b"application/json") in start["headers"]
+    assert json.loads(body) == {"TestProvider": "1.2.3"}
+
+
+def test_asgi_adapter_concurrent():
+    """Tests that a slow request doesn't block other requests"""
+
+    def wsgi_app(environ, start_response):
+        if environ["PATH_INFO"] == "/slow":
+            time.sleep(0.5)
+        content = environ["PATH_INFO"].encode() + environ["wsgi.input"].read()
+        start_response(
+            "200 OK",
+            [("Content-Type", "text/plain"), ("Content-Length", str(len(content)))],
+        )
+        return [content]
+
+    adapter = AsgiAdapter(wsgi_app, max_workers=2)
+    finished = []
+
+    async def request(path):
+        _, body = await _call(adapter, "POST", path, b"-data")
+        finished.append(body)
+
+    async def run():
+        await asyncio.gather(request("/slow"), request("/fast"))
+
+    try:
+        asyncio.run(run())
+    finally:
+        adapter.shutdown()
+
+    assert finished == [b"/fast-data", b"/slow-data"]
+
+
+def test_asgi_adapter_shutdown_fn():
+    """Tests that the shutdown function is passed to the app"""
+
+    def wsgi_app(environ, start_response):
+        environ[SHUTDOWN_KEY]()
+        start_response("200 OK", [("Content-Length", "0")])
+        return [b""]
+
+    shutdown_fn = mock.Mock()
+    adapter = AsgiAdapter(wsgi_app, max_workers=1, shutdown_fn=shutdown_fn)
+    try:
+        start, _ = asyncio.run(_call(adapter, "POST", "/shutdown"))
+    finally:
+        adapter.shutdown()
+
+    assert start["status"] == HTTPStatus.OK
+    shutdown_fn.assert_called_once()
+
+
+def _async_body_app(body):
+    """Creates a WSGI app which returns the given async body"""
+
+    def wsgi_app(environ, start_response):
+        assert set_async_body(environ, body)
+        start_response("200 OK", [("Content-Type", "text/event-stream")])
+        return iter(())
+
+    return wsgi_app
+
+
+def test_asgi_adapter_async_body():
+    """Tests that an async body is sent from the event loop"""
+
+    closed = []
+
+    async def body():
+        try:
+            yield "event1"
+            await asyncio.sleep(0)
+            yield b"event2"
+        finally:
+            closed.append("body")
+
+    adapter = AsgiAdapter(_async_body_app(body()), max_workers=1)
+    try:
+        start, resp_body = asyncio.run(_call(adapter, "GET", "/stream"))
+    finally:
+        adapter.shutdown()
+
+    assert start["status"] == HTTPStatus.OK
+    assert resp_body == b"event1event2"
+    assert closed == ["body"]
+
+    # Test the body is closed when the client disconnects
+
+    closed.clear()
+
+    async def endless_body():
+        try:
+            while True:
+                await asyncio.sleep(0.01)
+                yield "event"
+        finally:
+            closed.append("body")
+
+    adapter = AsgiAdapter(_async_body_app(endless_body()), max_workers=1)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "http_version": "1.1",
+    }
+    sent = []
+
+    async def receive():
+        if not sent:
+            return {"type": "http.request", "body": b""}
+        await asyncio.sleep(0.05)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    try:
+        asyncio.run(adapter(scope, receive, send))
+    finally:
+        adapter.shutdown()
+
+    assert len(sent) > 1
+    assert all(x["more_body"] for x in sent[1:])
+    assert closed == ["body"]
+
+    # Test the async body isn't set without the ASGI scope
+
+    assert not set_async_body({}, endless_body())
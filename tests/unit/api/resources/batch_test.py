@@ -0,0 +1,72 @@
+"""
+Tests for the BATCH endpoint
+"""
+from http import HTTPStatus
+
+import bluebird.api.resources.utils.utils as utils
+import bluebird.utils.types as types
+from bluebird.utils.properties import AircraftCommand
+from tests.unit.api.resources import endpoint_path
+from tests.unit.api.resources import get_app_mock
+
+
+_ENDPOINT = "batch"
+_ENDPOINT_PATH = endpoint_path(_ENDPOINT)
+
+
+def test_batch_post(test_flask_client):
+    """Tests the POST method"""
+
+    # Test arg parsing
+
+    data = {}
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+
+    data = {"commands": [{"cmd": "test", utils.CALLSIGN_LABEL: "TEST"}]}
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode().startswith("Command 0: Invalid cmd 'test'")
+
+    data = {"commands": [{"cmd": "hdg", utils.CALLSIGN_LABEL: "TEST"}]}
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == "Command 0: Missing argument 'hdg' for cmd 'hdg'"
+
+    data = {
+        "commands": [
+            {"cmd": "hdg", utils.CALLSIGN_LABEL: "TEST", "hdg": 123},
+            {"cmd": "alt", utils.CALLSIGN_LABEL: "TEST", "alt": -1},
+        ]
+    }
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode().startswith("Command 1: Invalid argument for cmd 'alt'")
+
+    # Test error from send_commands
+
+    app_mock = get_app_mock(test_flask_client)
+    app_mock.sim_proxy.aircraft.send_commands.return_value = "Sim error"
+
+    data["commands"][1]["alt"] = "FL250"
+    data["commands"][1]["vspd"] = 50
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert resp.data.decode() == "Sim error"
+    app_mock.sim_proxy.aircraft.send_commands.assert_called_once_with(
+        [
+            AircraftCommand("hdg", types.Callsign("TEST"), {"hdg": types.Heading(123)}),
+            AircraftCommand(
+                "alt",
+                types.Callsign("TEST"),
+                {"alt": types.Altitude("FL250"), "vspd": types.VerticalSpeed(50)},
+            ),
+        ]
+    )
+
+    # Test valid response
+
+    app_mock.sim_proxy.aircraft.send_commands.return_value = [None, "Error"]
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json == {"results": [None, "Error"]}
@@ -1,16 +1,20 @@
 """
-Tests for the METRIC and METRICPROVIDERS endpoints
+Tests for the METRIC, METRICBULK, and METRICPROVIDERS endpoints
 """
 from http import HTTPStatus
 from unittest import mock
 
 import bluebird.api.resources.utils.utils as utils
+from bluebird.utils.types import Callsign
 from tests.unit.api.resources import endpoint_path
 
 
 _ENDPOINT = "metric"
 _ENDPOINT_PATH = endpoint_path(_ENDPOINT)
 
+_ENDPOINT_BULK = "metricbulk"
+_ENDPOINT_BULK_PATH = endpoint_path(_ENDPOINT_BULK)
+
 _ENDPOINT_MP = "metricproviders"
 _ENDPOINT_MP_PATH = endpoint_path(_ENDPOINT_MP)
 
@@ -57,13 +61,19 @@ def test_metric_get(test_flask_client):
         # Test invalid metric name
 
         class TestProvider:
+            sim_time = None
+
             def version(self):
                 return "1.2.3"
 
+            def as_of(self, metric):
+                return self.sim_time
+
             def __str__(self):
                 return "TestProvider"
 
-        sim_proxy_mock.metrics_providers.get.return_value = TestProvider()
+        provider = TestProvider()
+        sim_proxy_mock.metrics_providers.get.return_value = provider
         sim_proxy_mock.call_metric_function.side_effect = AttributeError()
 
         resp = test_flask_client.get(f"{_ENDPOINT_PATH}?{arg_str}")
@@ -90,6 +100,14 @@ def test_metric_get(test_flask_client):
         assert resp.status_code == HTTPStatus.OK
         assert resp.json == {"TEST": 123}
 
+        # Test valid response with the time the result was calculated
+
+        provider.sim_time = 60
+
+        resp = test_flask_client.get(f"{_ENDPOINT_PATH}?{arg_str}")
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.json == {"TEST": 123, "as_of": 60}
+
 
 def test_metricproviders_get(test_flask_client):
     """Tests the GET method"""
@@ -115,3 +133,79 @@ def test_metricproviders_get(test_flask_client):
         resp = test_flask_client.get(_ENDPOINT_MP_PATH)
         assert resp.status_code == HTTPStatus.OK
         assert resp.json == {str(provider): provider.version()}
+
+
+def test_metricbulk_get(test_flask_client):
+    """Tests the GET method for the bulk metrics endpoint"""
+
+    with mock.patch("bluebird.api.resources.metrics.utils", wraps=utils) as utils_patch:
+
+        sim_proxy_mock = mock.Mock()
+        utils_patch.sim_proxy.return_value = sim_proxy_mock
+
+        # Test no providers available
+
+        sim_proxy_mock.metrics_providers = None
+
+        resp = test_flask_client.get(f"{_ENDPOINT_BULK_PATH}?name=TEST")
+        assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+        assert resp.data.decode() == "No metrics available"
+
+        # Test arg parsing
+
+        sim_proxy_mock.metrics_providers = mock.Mock()
+
+        resp = test_flask_client.get(_ENDPOINT_BULK_PATH)
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+
+        resp = test_flask_client.get(f"{_ENDPOINT_BULK_PATH}?name=TEST&callsigns=A,B")
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+        assert resp.data.decode() == "Invalid callsign 'A'"
+
+        # Test invalid provider
+
+        sim_proxy_mock.metrics_providers.get.return_value = None
+
+        resp = test_flask_client.get(f"{_ENDPOINT_BULK_PATH}?name=TEST&provider=AAA")
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+        assert resp.data.decode() == 'Provider "AAA" not found'
+
+        # Test error from call_bulk_metric_function
+
+        provider = mock.Mock()
+        sim_proxy_mock.metrics_providers.get.return_value = provider
+        sim_proxy_mock.call_bulk_metric_function.side_effect = Exception("Error")
+
+        resp = test_flask_client.get(f"{_ENDPOINT_BULK_PATH}?name=TEST")
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+        assert resp.data.decode().startswith("Metric function returned an error: Error")
+
+        # Test valid response for each aircraft
+
+        sim_proxy_mock.call_bulk_metric_function.side_effect = None
+        sim_proxy_mock.call_bulk_metric_function.return_value = {
+            Callsign("AAA"): 1,
+            Callsign("BBB"): 2,
+        }
+
+        resp = test_flask_client.get(
+            f"{_ENDPOINT_BULK_PATH}?name=TEST&callsigns=AAA,BBB"
+        )
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.json == {"TEST": {"AAA": 1, "BBB": 2}}
+        sim_proxy_mock.call_bulk_metric_function.assert_called_with(
+            provider, "TEST", False, [Callsign("AAA"), Callsign("BBB")]
+        )
+
+        # Test valid response for each pair
+
+        sim_proxy_mock.call_bulk_metric_function.return_value = [
+            (Callsign("AAA"), Callsign("BBB"), -0.5)
+        ]
+
+        resp = test_flask_client.get(f"{_ENDPOINT_BULK_PATH}?name=TEST&pairwise=true")
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.json == {"TEST": [["AAA", "BBB", -0.5]]}
+        sim_proxy_mock.call_bulk_metric_function.assert_called_with(
+            provider, "TEST", True, None
+        )
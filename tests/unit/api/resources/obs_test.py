@@ -0,0 +1,114 @@
+"""
+Tests for the OBS endpoint
+"""
+from http import HTTPStatus
+
+import msgpack
+import numpy as np
+
+import bluebird.utils.types as types
+from bluebird.api.resources.utils.responses import MSGPACK_MIMETYPE
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from bluebird.utils.npcodec import decode_ndarray
+from tests.unit.api.resources import endpoint_path
+from tests.unit.api.resources import get_app_mock
+from tests.unit.api.resources import TEST_SIM_PROPS
+
+
+_ENDPOINT = "obs"
+_ENDPOINT_PATH = endpoint_path(_ENDPOINT)
+
+
+def test_obs_get(test_flask_client):
+    """Tests the GET method"""
+
+    app_mock = get_app_mock(test_flask_client)
+
+    # Test error handling - sim properties not available
+
+    app_mock.sim_proxy.simulation.properties = "Error"
+    resp = test_flask_client.get(_ENDPOINT_PATH)
+    assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert resp.data.decode() == "Error"
+
+    app_mock.sim_proxy.simulation.properties = TEST_SIM_PROPS
+
+    # Test error handling - aircraft properties not available
+
+    app_mock.sim_proxy.aircraft.all_arrays = "Error"
+    resp = test_flask_client.get(_ENDPOINT_PATH)
+    assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert resp.data.decode() == "Couldn't get the aircraft properties: Error"
+
+    # Test valid response. Aircraft "AAA" has been removed from the simulation
+
+    app_mock.sim_proxy.aircraft.all_arrays = AircraftArrays(
+        callsigns=[types.Callsign("CCC"), types.Callsign("BBB")],
+        aircraft_type=["A380", "B747"],
+        altitude=np.array([20_000.0, 18_500.0]),
+        ground_speed=np.array([100.0, 53.0]),
+        heading=np.array([90, 74]),
+        lat=np.array([51.5, 52.5]),
+        lon=np.array([-0.1, -1.1]),
+        vertical_speed=np.array([0, 73]),
+    )
+    app_mock.sim_proxy.aircraft.stable_index.return_value = {
+        types.Callsign(x): i for i, x in enumerate(["AAA", "BBB", "CCC"])
+    }
+    app_mock.sim_proxy.aircraft.data_version = 5
+    app_mock.sim_proxy.aircraft.oldest_since = 0
+
+    resp = test_flask_client.get(_ENDPOINT_PATH)
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.mimetype == MSGPACK_MIMETYPE
+
+    data = msgpack.unpackb(resp.data, object_hook=decode_ndarray, raw=False)
+    assert data["schema_version"] == 1
+    assert data["scenario_time"] == TEST_SIM_PROPS.scenario_time
+    assert data["data_version"] == 5
+    assert data["columns"] == ["current_fl", "gs", "hdg", "lat", "lon", "vs"]
+    assert data["units"] == ["ft", "m/s", "deg", "deg", "deg", "ft/min"]
+    assert data["callsigns"] == ["AAA", "BBB", "CCC"]
+    assert data["actype"] == ["", "B747", "A380"]
+    np.testing.assert_array_equal(data["valid"], [False, True, True])
+    np.testing.assert_array_equal(
+        data["data"],
+        [
+            [np.nan] * 6,
+            [18_500.0, 53.0, 74, 52.5, -1.1, 73],
+            [20_000.0, 100.0, 90, 51.5, -0.1, 0],
+        ],
+    )
+
+    # Test delta response. "BBB" has changed and "AAA" has been removed
+
+    app_mock.sim_proxy.aircraft.changed_since.return_value = (
+        [types.Callsign("BBB")],
+        [types.Callsign("AAA")],
+    )
+
+    resp = test_flask_client.get(f"{_ENDPOINT_PATH}?since=3")
+    assert resp.status_code == HTTPStatus.OK
+    app_mock.sim_proxy.aircraft.changed_since.assert_called_with(3)
+
+    data = msgpack.unpackb(resp.data, object_hook=decode_ndarray, raw=False)
+    assert data["data_version"] == 5
+    assert data["n_rows"] == 3
+    np.testing.assert_array_equal(data["rows"], [0, 1])
+    assert data["callsigns"] == ["AAA", "BBB"]
+    assert data["actype"] == ["", "B747"]
+    np.testing.assert_array_equal(data["valid"], [False, True])
+    np.testing.assert_array_equal(
+        data["data"], [[np.nan] * 6, [18_500.0, 53.0, 74, 52.5, -1.1, 73]]
+    )
+
+    # Test delta response when nothing has changed
+
+    app_mock.sim_proxy.aircraft.changed_since.return_value = ([], [])
+
+    resp = test_flask_client.get(f"{_ENDPOINT_PATH}?since=5")
+    assert resp.status_code == HTTPStatus.OK
+
+    data = msgpack.unpackb(resp.data, object_hook=decode_ndarray, raw=False)
+    assert data["callsigns"] == []
+    assert data["data"].shape == (0, 6)
@@ -7,6 +7,7 @@ from unittest import mock
 import bluebird.api as api
 import bluebird.api.resources.utils.utils as utils
 from bluebird.api.resources.utils.responses import bad_request_resp
+from bluebird.utils.types import Callsign
 from tests.unit.api.resources import endpoint_path
 from tests.unit.api.resources import patch_utils_path
 from tests.unit.api.resources import TEST_AIRCRAFT_PROPS
@@ -115,3 +116,70 @@ def test_pos_get_all(test_flask_client):
             **utils.convert_aircraft_props(TEST_AIRCRAFT_PROPS),
             **{"scenario_time": TEST_SIM_PROPS.scenario_time},
         }
+
+
+def test_pos_get_since(test_flask_client):
+    """Tests the GET method with the since argument"""
+
+    # Test arg parsing
+
+    resp = test_flask_client.get(f"{_ENDPOINT_PATH}?since=-1")
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert "since" in resp.json["message"]
+
+    resp = test_flask_client.get(
+        f"{_ENDPOINT_PATH}?since=1&{utils.CALLSIGN_LABEL}=TEST"
+    )
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == "Can't specify both a callsign and since"
+
+    with mock.patch(patch_utils_path(_ENDPOINT), wraps=utils) as utils_patch:
+
+        utils_patch.CALLSIGN_LABEL = utils.CALLSIGN_LABEL
+        sim_proxy_mock = mock.Mock()
+        utils_patch.sim_proxy.return_value = sim_proxy_mock
+        sim_proxy_mock.simulation.properties = TEST_SIM_PROPS
+        sim_proxy_mock.aircraft.data_version = 5
+        sim_proxy_mock.aircraft.oldest_since = 0
+
+        # Test error from changes_since
+
+        sim_proxy_mock.aircraft.changed_since.return_value = "Error"
+
+        resp = test_flask_client.get(f"{_ENDPOINT_PATH}?since=3")
+        assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+        assert resp.data.decode() == "Couldn't get the changed aircraft: Error"
+
+        # Test valid response. Aircraft "NEW1" has no data yet
+
+        sim_proxy_mock.aircraft.changed_since.return_value = (
+            [TEST_AIRCRAFT_PROPS.callsign, Callsign("NEW1")],
+            [Callsign("OLD1")],
+        )
+        sim_proxy_mock.aircraft.all_properties = {
+            TEST_AIRCRAFT_PROPS.callsign: TEST_AIRCRAFT_PROPS,
+            Callsign("NEW1"): None,
+            Callsign("OTHER"): TEST_AIRCRAFT_PROPS,
+        }
+
+        resp = test_flask_client.get(f"{_ENDPOINT_PATH}?since=3")
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.json == {
+            **utils.convert_aircraft_props(TEST_AIRCRAFT_PROPS),
+            "removed": ["OLD1"],
+            "data_version": 5,
+            "scenario_time": TEST_SIM_PROPS.scenario_time,
+        }
+        sim_proxy_mock.aircraft.changed_since.assert_called_with(3)
+
+        # Test empty response when nothing has changed
+
+        sim_proxy_mock.aircraft.changed_since.return_value = ([], [])
+
+        resp = test_flask_client.get(f"{_ENDPOINT_PATH}?since=5")
+        assert resp.status_code == HTTPStatus.OK
+        assert resp.json == {
+            "removed": [],
+            "data_version": 5,
+            "scenario_time": TEST_SIM_PROPS.scenario_time,
+        }
@@ -5,6 +5,7 @@ from http import HTTPStatus
 from unittest import mock
 
 import bluebird.api.resources.utils.utils as utils
+from bluebird.api.asgi import SHUTDOWN_KEY
 from tests.unit.api.resources import endpoint_path
 from tests.unit.api.resources import patch_utils_path
 
@@ -18,23 +19,20 @@ def test_shutdown_post(test_flask_client):
 
     with mock.patch(patch_utils_path(_ENDPOINT), wraps=utils) as utils_patch:
 
-        sim_proxy_mock = mock.Mock()
-        utils_patch.sim_proxy.return_value = sim_proxy_mock
+        sim_pool_mock = mock.Mock()
+        utils_patch.sim_pool.return_value = sim_pool_mock
 
-        # Test error when no shutdown function available
-
-        sim_proxy_mock.shutdown.return_value = False
+        # Test error when no shutdown function available. The sim should not be shut
+        # down
 
         resp = test_flask_client.post(_ENDPOINT_PATH)
         assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
-        assert (
-            resp.data.decode()
-            == "No shutdown function available. (Sim shutdown ok = False)"
-        )
+        assert resp.data.decode() == "No shutdown function available"
+        sim_pool_mock.shutdown.assert_not_called()
 
         # Test exception from shutdown method
 
-        sim_proxy_mock.shutdown.return_value = True
+        sim_pool_mock.shutdown.return_value = True
 
         def throwy_mc_throwface():
             raise Exception("Error")
@@ -55,3 +53,14 @@ def test_shutdown_post(test_flask_client):
         )
         assert resp.status_code == HTTPStatus.OK
         assert resp.data.decode() == "BlueBird shutting down! (Sim shutdown ok = True)"
+        sim_pool_mock.shutdown.assert_called_with(shutdown_sim=False)
+        utils_patch.sim_proxy.assert_not_called()
+
+        # Test the shutdown function provided by the async server
+
+        shutdown_fn = mock.Mock()
+        resp = test_flask_client.post(
+            _ENDPOINT_PATH, environ_base={SHUTDOWN_KEY: shutdown_fn},
+        )
+        assert resp.status_code == HTTPStatus.OK
+        shutdown_fn.assert_called_once()
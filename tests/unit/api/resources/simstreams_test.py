@@ -0,0 +1,59 @@
+"""
+Tests for the SIMSTREAMS endpoint
+"""
+from http import HTTPStatus
+from unittest import mock
+
+import bluebird.api.resources.utils.utils as utils
+from bluebird.settings import Settings
+from bluebird.utils.properties import SimType
+from tests.unit.api.resources import endpoint_path
+from tests.unit.api.resources import patch_utils_path
+
+
+_ENDPOINT = "simstreams"
+_ENDPOINT_PATH = endpoint_path(_ENDPOINT)
+
+
+def test_simstreams_post(test_flask_client, monkeypatch):
+    """Tests the POST method"""
+
+    # Test simulator type check
+
+    monkeypatch.setattr(Settings, "SIM_TYPE", SimType.MachColl)
+
+    resp = test_flask_client.post(_ENDPOINT_PATH, json={"topics": ["ACDATA"]})
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == "Method not supported for the MachColl simulator"
+
+    monkeypatch.setattr(Settings, "SIM_TYPE", SimType.BlueSky)
+
+    # Test arg parsing
+
+    resp = test_flask_client.post(_ENDPOINT_PATH, json={})
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert "topics" in resp.json["message"]
+
+    with mock.patch(patch_utils_path(_ENDPOINT), wraps=utils) as utils_patch:
+
+        sim_proxy_mock = mock.Mock()
+        utils_patch.sim_proxy.return_value = sim_proxy_mock
+
+        # Test error from set_stream_topics
+
+        sim_proxy_mock.set_stream_topics.return_value = "Unknown stream topic(s)"
+
+        resp = test_flask_client.post(_ENDPOINT_PATH, json={"topics": ["TEST"]})
+        assert resp.status_code == HTTPStatus.BAD_REQUEST
+        assert resp.data.decode() == "Unknown stream topic(s)"
+
+        # Test valid response
+
+        sim_proxy_mock.set_stream_topics.return_value = None
+
+        data = {"topics": ["acdata", "SIMINFO", "ROUTEDATA"]}
+        resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+        assert resp.status_code == HTTPStatus.OK
+        sim_proxy_mock.set_stream_topics.assert_called_with(
+            ["ACDATA", "SIMINFO", "ROUTEDATA"]
+        )
@@ -0,0 +1,160 @@
+"""
+Tests for the STREAM endpoint
+"""
+import asyncio
+import json
+from http import HTTPStatus
+from unittest import mock
+
+import numpy as np
+
+import bluebird.utils.types as types
+from bluebird.api.resources.stream import _FrameEvents
+from bluebird.sim_proxy.frame_broadcaster import _aircraft_data
+from bluebird.sim_proxy.frame_broadcaster import Frame
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from tests.unit.api.resources import endpoint_path
+from tests.unit.api.resources import get_app_mock
+
+
+_ENDPOINT = "stream"
+_ENDPOINT_PATH = endpoint_path(_ENDPOINT)
+
+
+def _test_frame(seq: int, lats: dict) -> Frame:
+    ac_arrays = AircraftArrays(
+        callsigns=[types.Callsign(x) for x in lats],
+        aircraft_type=["B747"] * len(lats),
+        altitude=np.full(len(lats), 18_500.0),
+        ground_speed=np.full(len(lats), 53.0),
+        heading=np.full(len(lats), 74),
+        lat=np.array(list(lats.values()), dtype=float),
+        lon=np.full(len(lats), -0.1),
+        vertical_speed=np.zeros(len(lats), dtype=int),
+    )
+    return Frame(seq, float(seq), ac_arrays, _aircraft_data(ac_arrays))
+
+
+def _parse_event(event: str) -> dict:
+    lines = event.strip().split("\n")
+    assert lines[1] == "event: frame"
+    data = json.loads(lines[2].split(": ", 1)[1])
+    assert lines[0] == f"id: {data['seq']}"
+    return data
+
+
+def test_stream_get(test_flask_client):
+    """Tests the GET method"""
+
+    app_mock = get_app_mock(test_flask_client)
+
+    # Test arg parsing
+
+    resp = test_flask_client.get(f"{_ENDPOINT_PATH}?bbox=1,2,3")
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode().startswith("Invalid bbox")
+
+    resp = test_flask_client.get(f"{_ENDPOINT_PATH}?bbox=3,2,1,4")
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+
+    resp = test_flask_client.get(f"{_ENDPOINT_PATH}?callsigns=AAA,A")
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == "Invalid callsign 'A'"
+
+    # Test valid response. NOTE Only the first event is read since the stream never
+    # ends
+
+    app_mock.sim_proxy.frames = mock.MagicMock()
+    app_mock.sim_proxy.frames.wait_for_frame.return_value = None
+    with mock.patch(
+        "bluebird.api.resources.stream._FrameEvents", wraps=_FrameEvents
+    ) as events_mock:
+        resp = test_flask_client.get(
+            f"{_ENDPOINT_PATH}?delta=true&callsigns=aaa&bbox=50,-1,52,1",
+            buffered=False,
+        )
+    events_mock.assert_called_once_with(mock.ANY, True, ["AAA"], (50, -1, 52, 1))
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.mimetype == "text/event-stream"
+    assert next(resp.response) == b": keepalive\n\n"
+    resp.close()
+    app_mock.sim_proxy.frames.subscribe.return_value.__exit__.assert_called_once()
+
+
+def test_frame_events():
+    """Tests the events generated for a subscriber"""
+
+    frames = mock.MagicMock()
+    frame_list = [
+        _test_frame(1, {"AAA": 51.0, "BBB": 51.5, "CCC": 60.0}),
+        None,
+        _test_frame(2, {"AAA": 51.0, "BBB": 51.6}),
+        _test_frame(3, {"AAA": 51.0, "BBB": 55.0}),
+    ]
+    frames.wait_for_frame.side_effect = frame_list
+
+    # Test full frames with a bbox filter
+
+    events = iter(_FrameEvents(frames, False, None, (50, -1, 52, 1)))
+    data = _parse_event(next(events))
+    assert data["seq"] == 1
+    assert data["scenario_time"] == 1.0
+    assert sorted(data["aircraft"]) == ["AAA", "BBB"]
+    assert "removed" not in data
+    frames.wait_for_frame.assert_called_with(None, mock.ANY)
+    frames.subscribe.return_value.__enter__.assert_called_once()
+
+    assert next(events) == ": keepalive\n\n"
+
+    data = _parse_event(next(events))
+    assert sorted(data["aircraft"]) == ["AAA", "BBB"]
+    frames.wait_for_frame.assert_called_with(1, mock.ANY)
+
+    events.close()
+    frames.subscribe.return_value.__exit__.assert_called_once()
+
+    # Test delta frames with a callsign and bbox filter
+
+    frames.wait_for_frame.side_effect = frame_list
+    events = iter(_FrameEvents(frames, True, ["BBB", "CCC"], (50, -1, 52, 1)))
+
+    data = _parse_event(next(events))
+    assert list(data["aircraft"]) == ["BBB"]
+    assert data["removed"] == []
+
+    assert next(events) == ": keepalive\n\n"
+
+    data = _parse_event(next(events))
+    assert data["aircraft"]["BBB"]["lat"] == 51.6
+    assert data["removed"] == []
+
+    data = _parse_event(next(events))
+    assert data["aircraft"] == {}
+    assert data["removed"] == ["BBB"]
+
+
+def test_frame_events_async():
+    """Tests the events generated for an async subscriber"""
+
+    frames = mock.MagicMock()
+    frame_iter = iter([_test_frame(1, {"AAA": 51.0}), None])
+    wait_calls = []
+
+    async def _wait_for_frame_async(last_seq, timeout):
+        wait_calls.append(last_seq)
+        return next(frame_iter)
+
+    frames.wait_for_frame_async = _wait_for_frame_async
+
+    async def run():
+        events = _FrameEvents(frames, False, ["AAA"], None).__aiter__()
+        try:
+            return [await events.__anext__(), await events.__anext__()]
+        finally:
+            await events.aclose()
+
+    first, second = asyncio.run(run())
+    assert list(_parse_event(first)["aircraft"]) == ["AAA"]
+    assert second == ": keepalive\n\n"
+    assert wait_calls == [None, 1]
+    frames.subscribe.return_value.__exit__.assert_called_once()
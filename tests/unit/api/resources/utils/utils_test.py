@@ -4,15 +4,18 @@ Tests functionality of the bluebird.api.resources.utils package
 from http import HTTPStatus
 from unittest import mock
 
+import pytest
 from flask import Response
 from flask_restful import reqparse
 from flask_restful import Resource
+from werkzeug.exceptions import HTTPException
 
 import bluebird.api as api
 import bluebird.api.resources.utils.utils as utils
 import bluebird.utils.properties as props
 import bluebird.utils.types as types
 from tests.unit.api.resources import endpoint_path
+from tests.unit.api.resources import get_app_mock
 
 
 def test_parse_args_from_query_string(test_flask_client):
@@ -102,6 +105,89 @@ def test_check_exists():
     assert not resp
 
 
+def test_changes_since():
+    """Tests for changes_since"""
+
+    sim_proxy_mock = mock.Mock()
+    sim_proxy_mock.aircraft.data_version = 5
+    sim_proxy_mock.aircraft.oldest_since = 2
+
+    # Test version check
+
+    with api.FLASK_APP.test_request_context():
+        resp = utils.changes_since(sim_proxy_mock, 6)
+    assert isinstance(resp, Response)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == (
+        "Invalid since (6). Must not be greater than the current data_version (5)"
+    )
+
+    with api.FLASK_APP.test_request_context():
+        resp = utils.changes_since(sim_proxy_mock, 1)
+    assert isinstance(resp, Response)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == (
+        "Invalid since (1). The changes are only available since data_version 2. "
+        "Request the full state instead"
+    )
+    sim_proxy_mock.aircraft.changed_since.assert_not_called()
+
+    # Test error handling
+
+    sim_proxy_mock.aircraft.changed_since.return_value = "Error"
+    with api.FLASK_APP.test_request_context():
+        resp = utils.changes_since(sim_proxy_mock, 3)
+    assert isinstance(resp, Response)
+    assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert resp.data.decode() == "Couldn't get the changed aircraft: Error"
+
+    # Test valid changes
+
+    changed, removed = [types.Callsign("AAA")], [types.Callsign("BBB")]
+    sim_proxy_mock.aircraft.changed_since.return_value = (changed, removed)
+    with api.FLASK_APP.test_request_context():
+        assert utils.changes_since(sim_proxy_mock, 3) == (5, changed, removed)
+    sim_proxy_mock.aircraft.changed_since.assert_called_with(3)
+
+
+def test_sim_proxy(test_flask_client):
+    """Tests that sim_proxy selects the environment given in the request header"""
+
+    app_mock = get_app_mock(test_flask_client)
+    env_sim_proxy = mock.Mock()
+    app_mock.sim_pool.get.side_effect = {"1": env_sim_proxy}.get
+
+    # Test default environment
+
+    with api.FLASK_APP.test_request_context():
+        assert utils.sim_proxy() is app_mock.sim_proxy
+
+    # Test selected environment
+
+    headers = {utils.ENV_ID_HEADER: "1"}
+    with api.FLASK_APP.test_request_context(headers=headers):
+        assert utils.sim_proxy() is env_sim_proxy
+
+    # Test unknown environment
+
+    headers = {utils.ENV_ID_HEADER: "2"}
+    with api.FLASK_APP.test_request_context(headers=headers):
+        with pytest.raises(HTTPException) as exc_info:
+            utils.sim_proxy()
+    assert exc_info.value.response.status_code == HTTPStatus.BAD_REQUEST
+
+    resp = test_flask_client.post(endpoint_path("reset"), headers=headers)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == 'Unknown environment "2"'
+
+    headers = {utils.ENV_ID_HEADER: "1"}
+    env_sim_proxy.simulation.reset.return_value = None
+    resp = test_flask_client.post(endpoint_path("reset"), headers=headers)
+    assert resp.status_code == HTTPStatus.OK
+    env_sim_proxy.simulation.reset.assert_called_once()
+    app_mock.sim_proxy.simulation.reset.assert_not_called()
+
+
 def test_convert_aircraft_props():
     """Tests for convert_aircraft_props"""
 
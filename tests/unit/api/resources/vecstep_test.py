@@ -0,0 +1,162 @@
+"""
+Tests for the VECSTEP endpoint
+"""
+import threading
+from http import HTTPStatus
+from unittest import mock
+
+import numpy as np
+
+import bluebird.api.resources.utils.utils as utils
+import bluebird.utils.types as types
+from bluebird.settings import Settings
+from bluebird.sim_proxy.sim_pool import SimPool
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from bluebird.utils.properties import AircraftCommand
+from bluebird.utils.properties import SimMode
+from tests.unit.api.resources import endpoint_path
+from tests.unit.api.resources import get_app_mock
+from tests.unit.api.resources import TEST_SIM_PROPS
+
+
+_ENDPOINT = "vecstep"
+_ENDPOINT_PATH = endpoint_path(_ENDPOINT)
+
+
+def _test_arrays(callsign: str) -> AircraftArrays:
+    return AircraftArrays(
+        callsigns=[types.Callsign(callsign)],
+        aircraft_type=["B747"],
+        altitude=np.array([18_500.0]),
+        ground_speed=np.array([53.0]),
+        heading=np.array([74]),
+        lat=np.array([51.5]),
+        lon=np.array([-0.1]),
+        vertical_speed=np.array([0]),
+    )
+
+
+def _sim_proxy_mock(callsign: str) -> mock.Mock:
+    sim_proxy_mock = mock.Mock()
+    sim_proxy_mock.simulation.step.return_value = None
+    sim_proxy_mock.simulation.properties = TEST_SIM_PROPS
+    sim_proxy_mock.aircraft.all_arrays = _test_arrays(callsign)
+    sim_proxy_mock.aircraft.send_commands.return_value = [None]
+    sim_proxy_mock.call_metric_function.return_value = 1.5
+    return sim_proxy_mock
+
+
+def test_vecstep_post(test_flask_client, monkeypatch):
+    """Tests the POST method"""
+
+    # Test agent mode check
+
+    monkeypatch.setattr(Settings, "SIM_MODE", SimMode.Sandbox)
+
+    resp = test_flask_client.post(_ENDPOINT_PATH, json={"envs": []})
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == "Must be in agent mode to use vecstep"
+
+    monkeypatch.setattr(Settings, "SIM_MODE", SimMode.Agent)
+
+    app_mock = get_app_mock(test_flask_client)
+    sim_proxies = {"0": _sim_proxy_mock("TEST0"), "1": _sim_proxy_mock("TEST1")}
+    app_mock.sim_pool = SimPool(sim_proxies)
+
+    # Test arg parsing
+
+    resp = test_flask_client.post(_ENDPOINT_PATH, json={})
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+
+    data = {"envs": [{"env_id": "2"}]}
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == 'Env 0: Unknown environment "2"'
+
+    data = {"envs": [{"env_id": "0"}, {"env_id": "0"}]}
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == 'Env 1: Environment "0" specified more than once'
+
+    commands = [{"cmd": "hdg", utils.CALLSIGN_LABEL: "TEST1"}]
+    data = {"envs": [{"env_id": "0"}, {"env_id": "1", "commands": commands}]}
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode().startswith("Env 1: Command 0: Missing argument")
+
+    data = {"envs": [{"env_id": "0"}], "metrics": [{"args": []}]}
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.data.decode() == "Metric 0: Metric name must be specified"
+
+    for sim_proxy_mock in sim_proxies.values():
+        sim_proxy_mock.simulation.step.assert_not_called()
+
+    # Test valid request, and that the environments are stepped concurrently
+
+    barrier = threading.Barrier(2, timeout=5)
+    for sim_proxy_mock in sim_proxies.values():
+        sim_proxy_mock.simulation.step.side_effect = lambda: barrier.wait() and None
+
+    data = {
+        "envs": [
+            {
+                "env_id": "1",
+                "commands": [{"cmd": "hdg", utils.CALLSIGN_LABEL: "TEST1", "hdg": 90}],
+            },
+            {"env_id": "0"},
+        ],
+        "metrics": [
+            {"name": "test_metric", "args": ["a"]},
+            {"name": "test_metric", "args": ["b"]},
+        ],
+    }
+    sim_proxies["0"].call_metric_function.side_effect = [1.5, 2.5]
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.OK
+
+    envs = resp.json["envs"]
+    assert [x["env_id"] for x in envs] == ["1", "0"]
+    assert all(x["error"] is None for x in envs)
+    assert envs[0]["results"] == [None]
+    assert "results" not in envs[1]
+    assert envs[1]["aircraft"] == {
+        utils.CALLSIGN_LABEL: ["TEST0"],
+        "actype": ["B747"],
+        "current_fl": [18_500.0],
+        "gs": [53.0],
+        "hdg": [74],
+        "lat": [51.5],
+        "lon": [-0.1],
+        "vs": [0],
+    }
+    assert envs[0]["scenario_time"] == TEST_SIM_PROPS.scenario_time
+    assert envs[0]["metrics"] == [1.5, 1.5]
+    assert envs[1]["metrics"] == [1.5, 2.5]
+
+    sim_proxies["1"].aircraft.send_commands.assert_called_once_with(
+        [AircraftCommand("hdg", types.Callsign("TEST1"), {"hdg": types.Heading(90)})]
+    )
+    sim_proxies["0"].aircraft.send_commands.assert_not_called()
+    sim_proxies["0"].metrics_providers.get.assert_called_with("BlueBird")
+    provider = sim_proxies["0"].metrics_providers.get.return_value
+    assert sim_proxies["0"].call_metric_function.call_args_list == [
+        mock.call(provider, "test_metric", ["a"]),
+        mock.call(provider, "test_metric", ["b"]),
+    ]
+
+    # Test errors are returned for each environment
+
+    sim_proxies["0"].simulation.step.side_effect = None
+    sim_proxies["1"].simulation.step.side_effect = None
+    sim_proxies["1"].simulation.step.return_value = "Sim error"
+
+    data = {"envs": [{"env_id": "0"}, {"env_id": "1"}]}
+    resp = test_flask_client.post(_ENDPOINT_PATH, json=data)
+    assert resp.status_code == HTTPStatus.OK
+    envs = resp.json["envs"]
+    assert envs[0]["error"] is None
+    assert envs[1]["error"] == "Could not step the simulation: Sim error"
+    assert "aircraft" not in envs[1]
+
+    app_mock.sim_pool.shutdown()
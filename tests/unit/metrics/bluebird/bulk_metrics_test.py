@@ -0,0 +1,124 @@
+"""
+Tests for the vectorised BlueBird metrics
+"""
+import itertools
+from unittest import mock
+
+import aviary.metrics as aviary_metrics
+import numpy as np
+import pytest
+
+import bluebird.metrics.bluebird.bulk_metrics as bulk_metrics
+import bluebird.utils.types as types
+from bluebird.metrics.bluebird.provider import Provider
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from bluebird.utils.spatial_index import SpatialIndex
+
+
+def _test_arrays(n: int, seed: int = 123) -> AircraftArrays:
+    """Creates a random set of aircraft, some of which are within separation limits"""
+    rng = np.random.default_rng(seed)
+    return AircraftArrays(
+        callsigns=[types.Callsign(f"TEST{i}") for i in range(n)],
+        aircraft_type=["B744"] * n,
+        altitude=rng.choice([20_000, 21_000, 24_000], size=n).astype(float),
+        ground_speed=np.full(n, 200.0),
+        heading=np.zeros(n, dtype=int),
+        lat=rng.uniform(51.0, 52.0, size=n),
+        lon=rng.uniform(-1.0, 0.5, size=n),
+        vertical_speed=np.zeros(n, dtype=int),
+    )
+
+
+def test_pairwise_separation_metric():
+    """
+    Tests that the bulk pairwise_separation_metric matches the result of evaluating the
+    Aviary metric for every pair
+    """
+
+    ac_arrays = _test_arrays(40)
+    mock_aircraft_controls = mock.Mock()
+    mock_aircraft_controls.spatial_index.side_effect = lambda *args: SpatialIndex(
+        ac_arrays, *args
+    )
+
+    # Test unknown callsign
+
+    with pytest.raises(ValueError, match="Could not get properties for MISSING"):
+        bulk_metrics.pairwise_separation_metric(
+            [types.Callsign("MISSING")], aircraft_controls=mock_aircraft_controls
+        )
+
+    # Test result matches the Aviary metric. Put two aircraft in the same position to
+    # ensure there is at least one result
+
+    ac_arrays.lat[1] = ac_arrays.lat[0]
+    ac_arrays.lon[1] = ac_arrays.lon[0]
+    ac_arrays.altitude[1] = ac_arrays.altitude[0]
+
+    expected = {}
+    for i, j in itertools.combinations(range(len(ac_arrays)), 2):
+        expected[(ac_arrays.callsigns[i], ac_arrays.callsigns[j])] = (
+            aviary_metrics.pairwise_separation_metric(
+                lon1=ac_arrays.lon[i],
+                lat1=ac_arrays.lat[i],
+                alt1=types.Altitude(ac_arrays.altitude[i]).meters,
+                lon2=ac_arrays.lon[j],
+                lat2=ac_arrays.lat[j],
+                alt2=types.Altitude(ac_arrays.altitude[j]).meters,
+            )
+        )
+
+    results = bulk_metrics.pairwise_separation_metric(
+        ac_arrays.callsigns, aircraft_controls=mock_aircraft_controls
+    )
+    assert any(expected.values())
+    assert all(x[2] for x in results)
+    # NOTE The horizontal distances here are spherical rather than geodesic, so the
+    # scores can differ slightly
+    results_dict = {x[:2]: x[2] for x in results}
+    assert {x: results_dict.get(x, 0) for x in expected} == pytest.approx(
+        expected, abs=0.01
+    )
+
+    # Test all aircraft used by default, and that results are filtered by callsign
+
+    assert (
+        bulk_metrics.pairwise_separation_metric(
+            None, aircraft_controls=mock_aircraft_controls
+        )
+        == results
+    )
+    assert bulk_metrics.pairwise_separation_metric(
+        ac_arrays.callsigns[:2], aircraft_controls=mock_aircraft_controls
+    ) == [x for x in results if x[:2] == tuple(ac_arrays.callsigns[:2])]
+
+
+def test_provider_bulk():
+    """Tests that the provider uses the bulk implementation where available"""
+
+    provider = Provider()
+    callsigns = [types.Callsign("TEST1"), types.Callsign("TEST2")]
+
+    with mock.patch.dict(
+        bulk_metrics.PAIRWISE_METRICS, {"pairwise_separation_metric": mock.Mock()}
+    ):
+        provider.bulk("pairwise_separation_metric", callsigns, True, test=1)
+        bulk_metrics.PAIRWISE_METRICS[
+            "pairwise_separation_metric"
+        ].assert_called_once_with(callsigns, test=1)
+
+    # Test the default implementation for metrics of single aircraft
+
+    with mock.patch.object(Provider, "__call__", return_value=-0.5) as mock_call:
+        assert provider.bulk("fuel_efficiency_metric", callsigns, False) == {
+            callsigns[0]: -0.5,
+            callsigns[1]: -0.5,
+        }
+        mock_call.assert_called_with("fuel_efficiency_metric", "TEST2")
+
+    # Test the default implementation for pairwise metrics
+
+    with mock.patch.object(Provider, "__call__", return_value=0) as mock_call:
+        assert provider.bulk("test_metric", callsigns, True) == []
+        mock_call.assert_called_once_with("test_metric", "TEST1", "TEST2")
@@ -76,6 +76,25 @@ def test_pairwise_separation_metric():
     assert res == -1, "Expected -1 since we passed the same properties twice!"
 
 
+def test_all_conflicts_metric():
+    """
+    Tests the all_conflicts_metric function
+    """
+
+    with pytest.raises(AssertionError, match="Expected no arguments"):
+        metrics.all_conflicts_metric("TEST1", aircraft_controls=None)
+
+    with mock.patch.object(
+        metrics.bulk_metrics, "pairwise_separation_metric"
+    ) as mock_bulk_metric:
+        mock_bulk_metric.return_value = [
+            (types.Callsign("TEST1"), types.Callsign("TEST2"), -0.5)
+        ]
+        res = metrics.all_conflicts_metric(aircraft_controls=None)
+        assert res == [["TEST1", "TEST2", -0.5]]
+        mock_bulk_metric.assert_called_once_with(None, aircraft_controls=None)
+
+
 def test_sector_exit_metric():
     """
     Tests the sector_exit_metric function
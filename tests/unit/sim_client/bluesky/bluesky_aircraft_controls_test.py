@@ -3,6 +3,10 @@ Tests for BlueSkyAircraftControls
 """
 from unittest import mock
 
+import numpy as np
+
+import bluebird.utils.properties as props
+import bluebird.utils.types as types
 from bluebird.sim_client.bluesky.bluesky_aircraft_controls import (
     BlueSkyAircraftControls,
 )
@@ -19,3 +23,86 @@ def test_abstract_class_implemented():
     assert AbstractAircraftControls.__abstractmethods__ == {
         x for x in dir(BlueSkyAircraftControls) if not x.startswith("_")
     }
+
+
+def test_all_properties():
+    """Tests that the ACDATA stream is converted into AircraftProperties"""
+
+    mock_client = mock.Mock()
+    mock_client.aircraft_stream_seq = 1
+    valid_data = {
+        "id": ["TEST1", "TEST2"],
+        "actype": ["B744", "A320"],
+        "alt": np.array([3048.0, 6096.0]),
+        "gs": np.array([120.5, 200.0]),
+        "trk": np.array([90.7, 359.9]),
+        "lat": np.array([51.5, -10.0]),
+        "lon": np.array([-0.1, 20.0]),
+        "vs": np.array([0.0, -5.08]),
+    }
+    mock_client.aircraft_stream_data = valid_data
+    aircraft_controls = BlueSkyAircraftControls(mock_client)
+
+    callsigns = aircraft_controls.callsigns
+    assert callsigns == [types.Callsign("TEST1"), types.Callsign("TEST2")]
+    assert aircraft_controls.exists(types.Callsign("TEST2")) is True
+    assert aircraft_controls.exists(types.Callsign("TEST3")) is False
+
+    all_props = aircraft_controls.all_properties
+    assert isinstance(all_props, dict)
+    assert list(all_props) == callsigns
+    assert all_props[types.Callsign("TEST2")] == props.AircraftProperties(
+        aircraft_type="A320",
+        altitude=types.Altitude(20_000),
+        callsign=types.Callsign("TEST2"),
+        cleared_flight_level=None,
+        ground_speed=types.GroundSpeed(200),
+        heading=types.Heading(359),
+        initial_flight_level=None,
+        position=types.LatLon(-10.0, 20.0),
+        requested_flight_level=None,
+        route_name=None,
+        vertical_speed=types.VerticalSpeed(-1000),
+    )
+    assert aircraft_controls.properties(types.Callsign("TEST1")) == all_props[
+        types.Callsign("TEST1")
+    ]
+
+    # Test the data is only converted once per frame
+
+    with mock.patch.object(
+        BlueSkyAircraftControls, "_convert_to_arrays"
+    ) as mock_convert:
+        assert aircraft_controls.callsigns == callsigns
+        mock_convert.assert_not_called()
+
+    # Test invalid stream data
+
+    mock_client.aircraft_stream_seq = 2
+    mock_client.aircraft_stream_data = {}
+    err = aircraft_controls.all_properties
+    assert isinstance(err, str)
+    assert err.startswith("Error parsing ac data from stream")
+
+    # Test invalid values are reported when the data is converted, rather than when the
+    # properties are accessed
+
+    mock_client.aircraft_stream_seq = 3
+    mock_client.aircraft_stream_data = {
+        **valid_data,
+        "alt": np.array([3048.0, -1.0]),
+    }
+    err = aircraft_controls.all_arrays
+    assert isinstance(err, str)
+    assert "Altitude must be positive" in err
+
+    # Test error when the stream data can't be decoded
+
+    mock_client.aircraft_stream_seq = 4
+    type(mock_client).aircraft_stream_data = mock.PropertyMock(
+        side_effect=ValueError("Bad msgpack data")
+    )
+    err = aircraft_controls.all_arrays
+    assert isinstance(err, str)
+    assert err.startswith("Error parsing ac data from stream")
+    assert "Bad msgpack data" in err
@@ -1,3 +1,333 @@
 """
 Tests for BlueSkyClient
 """
+import threading
+import time
+
+import msgpack
+import numpy as np
+import pytest
+import zmq
+
+from bluebird.settings import Settings
+from bluebird.sim_client.bluesky.bluesky_client import _conflate
+from bluebird.sim_client.bluesky.bluesky_client import BlueSkyClient
+
+
+_TEST_SIMINFO = [1.0, 0.05, 1234, "2020-01-02 12:34:56", 4, 2, "test-scenario"]
+
+
+def test_stream():
+    """Tests that stream data is stored as read-only snapshots"""
+
+    client = BlueSkyClient()
+    assert client.aircraft_stream_seq == 0
+    assert not client.aircraft_stream_data
+    assert not client.sim_info_stream_data
+
+    client.stream(b"ACDATA", {"id": ["TEST1"], "alt": np.array([123.0])}, None)
+    client.stream(b"SIMINFO", list(_TEST_SIMINFO), None)
+
+    data = client.aircraft_stream_data
+    assert client.aircraft_stream_seq == 1
+    assert data["id"] == ("TEST1",)
+    assert client.aircraft_stream_data is data
+    assert client.sim_info_stream_data == tuple(_TEST_SIMINFO)
+
+    with pytest.raises(TypeError):
+        data["id"] = ["TEST2"]
+    with pytest.raises(ValueError):
+        data["alt"][0] = 456
+
+    client.stream(b"ACDATA", {"id": ["TEST2"]}, None)
+    assert client.aircraft_stream_seq == 3
+    assert data["id"] == ("TEST1",)
+
+
+def test_step(monkeypatch):
+    """Tests that step returns as soon as the STEP event or new SIMINFO is received"""
+
+    client = BlueSkyClient()
+    client.stream(b"SIMINFO", list(_TEST_SIMINFO), None)
+
+    # Test timeout when no response is received
+
+    monkeypatch.setattr(Settings, "BS_STEP_TIMEOUT", 0.1)
+    client.send_event = lambda *args, **kwargs: None
+    err = client.step()
+    assert err == "Error: Step command failed (step_flag=False init_t=1234 new_t=1234)"
+
+    # Test step confirmed by a new SIMINFO frame
+
+    monkeypatch.setattr(Settings, "BS_STEP_TIMEOUT", 5)
+    new_siminfo = list(_TEST_SIMINFO)
+    new_siminfo[2] += 1
+
+    def _send_siminfo(*args, **kwargs):
+        threading.Thread(
+            target=client.stream, args=(b"SIMINFO", new_siminfo, None)
+        ).start()
+
+    client.send_event = _send_siminfo
+    start = time.time()
+    err = client.step()
+    assert not err
+    assert time.time() - start < 1
+
+
+def test_send_stack_cmd(monkeypatch):
+    """Tests that send_stack_cmd returns once the command is acknowledged"""
+
+    client = BlueSkyClient()
+
+    def _echo_response(*texts):
+        def _send_event(name, data, target):
+            ack = data.split(";ECHO ")[-1]
+
+            def _receive():
+                for text in [*texts, ack]:
+                    client._handle_echo(text)
+
+            threading.Thread(target=_receive).start()
+
+        return _send_event
+
+    # Test command with no output
+
+    monkeypatch.setattr(Settings, "BS_CMD_TIMEOUT", 5)
+    client.send_event = _echo_response()
+    start = time.time()
+    err = client.send_stack_cmd("HOLD")
+    assert not err
+    assert time.time() - start < 1
+
+    # Test error response
+
+    client.send_event = _echo_response("Unknown command: TEST")
+    err = client.send_stack_cmd("TEST")
+    assert err == "Error(s): Unknown command: TEST"
+
+    # Test expected response
+
+    client.send_event = _echo_response("Speed set to 1.5")
+    resp = client.send_stack_cmd("DTMULT 1.5", response_expected=True)
+    assert resp == ["Speed set to 1.5"]
+
+    # Test no acknowledgement received
+
+    monkeypatch.setattr(Settings, "BS_CMD_TIMEOUT", 0.1)
+    client.send_event = lambda *args, **kwargs: None
+    resp = client.send_stack_cmd("SEED 1", response_expected=True)
+    assert resp == "Error: no response received"
+
+
+def test_send_stack_cmds(monkeypatch):
+    """Tests that send_stack_cmds sends all commands in one message"""
+
+    client = BlueSkyClient()
+    sent = []
+
+    def _send_event(name, data, target):
+        sent.append(data)
+        cmds = data.split(";")
+
+        def _receive():
+            for cmd in cmds:
+                if cmd.startswith("ECHO "):
+                    client._handle_echo(cmd[5:])
+                elif cmd.startswith("TEST"):
+                    client._handle_echo(f"Unknown command: {cmd}")
+
+        threading.Thread(target=_receive).start()
+
+    monkeypatch.setattr(Settings, "BS_CMD_TIMEOUT", 5)
+    client.send_event = _send_event
+    results = client.send_stack_cmds(["HDG AAA 123", "TEST1", "ALT AAA FL123"])
+    assert len(sent) == 1
+    assert results == [None, "Error(s): Unknown command: TEST1", None]
+
+
+def test_reset_sim(monkeypatch):
+    """Tests that reset_sim returns as soon as the RESET event is received"""
+
+    client = BlueSkyClient()
+    client.send_stack_cmd = lambda *args, **kwargs: None
+
+    # Test timeout when no RESET event is received
+
+    monkeypatch.setattr(Settings, "BS_LOAD_TIMEOUT", 0.1)
+    err = client.reset_sim()
+    assert err == "Did not receive reset confirmation in time"
+
+    # Test reset confirmed by the RESET event
+
+    monkeypatch.setattr(Settings, "BS_LOAD_TIMEOUT", 5)
+
+    def _send_reset(*args, **kwargs):
+        threading.Thread(target=client._handle_reset).start()
+
+    client.send_stack_cmd = _send_reset
+    start = time.time()
+    err = client.reset_sim()
+    assert not err
+    assert time.time() - start < 1
+
+    # Test the same for loading a scenario
+
+    start = time.time()
+    err = client.load_scenario("test.scn")
+    assert not err
+    assert time.time() - start < 1
+
+
+def test_upload_new_scenario(monkeypatch):
+    """Tests that upload_new_scenario returns as soon as the response is received"""
+
+    client = BlueSkyClient()
+
+    # Test timeout when no response is received
+
+    monkeypatch.setattr(Settings, "BS_LOAD_TIMEOUT", 0.1)
+    client.send_event = lambda *args, **kwargs: None
+    err = client.upload_new_scenario("test.scn", ["00:00:00.00>HOLD"])
+    assert err == "No response received"
+
+    # Test error and valid responses
+
+    monkeypatch.setattr(Settings, "BS_LOAD_TIMEOUT", 5)
+
+    def _scenario_response(resp):
+        def _send_event(*args, **kwargs):
+            threading.Thread(target=client._handle_scenario, args=(resp,)).start()
+
+        return _send_event
+
+    client.send_event = _scenario_response("Error: invalid scenario")
+    err = client.upload_new_scenario("test.scn", ["00:00:00.00>HOLD"])
+    assert err == "Error: invalid scenario"
+
+    client.send_event = _scenario_response("Ok")
+    start = time.time()
+    err = client.upload_new_scenario("test.scn", ["00:00:00.00>HOLD"])
+    assert not err
+    assert time.time() - start < 1
+
+
+def test_receive():
+    """Tests that receive handles all the messages which are waiting"""
+
+    client = BlueSkyClient()
+    ctx = zmq.Context.instance()
+    senders = []
+    for idx, name in enumerate(["event_io", "stream_in"]):
+        addr = f"inproc://test-receive-{idx}"
+        sock = ctx.socket(zmq.PAIR)
+        sock.bind(addr)
+        setattr(client, name, sock)
+        client.poller.register(sock, zmq.POLLIN)
+        sender = ctx.socket(zmq.PAIR)
+        sender.connect(addr)
+        senders.append(sender)
+
+    echoes = []
+    client._handle_echo = echoes.append
+    for idx in range(3):
+        data = msgpack.packb({"text": f"Test {idx}"}, use_bin_type=True)
+        senders[0].send_multipart([b"node", b"ECHO", data])
+    for idx in range(1, 4):
+        siminfo = list(_TEST_SIMINFO)
+        siminfo[2] = idx
+        data = msgpack.packb(siminfo, use_bin_type=True)
+        senders[1].send_multipart([b"SIMINFO" + b"12345", data])
+
+    assert client.receive(timeout=1000)
+    assert client._have_connection
+
+    # The stream data should only be decoded once it is read
+    assert client._sim_info_stream._raw is not None
+    assert echoes == ["Test 0", "Test 1", "Test 2"]
+    assert client.sim_info_stream_data[2] == 3
+
+    # Only the latest of the queued SIMINFO frames should have been handled
+    assert client._sim_info_stream.seq == 1
+
+    # Test that receive returns after the timeout when there is no data
+
+    start = time.time()
+    assert client.receive(timeout=100)
+    assert time.time() - start < 1
+
+    for sock in [*senders, client.event_io, client.stream_in]:
+        sock.close(linger=0)
+
+
+def test_conflate():
+    """Tests that only the latest ACDATA and SIMINFO frames are kept"""
+
+    msgs = [
+        [b"ACDATA" + b"12345", b"1"],
+        [b"SIMINFO" + b"12345", b"2"],
+        [b"ROUTEDATA" + b"12345", b"3"],
+        [b"ACDATA" + b"12345", b"4"],
+        [b"ROUTEDATA" + b"12345", b"5"],
+    ]
+    assert _conflate(iter(msgs)) == [
+        (b"SIMINFO", b"12345", b"2"),
+        (b"ROUTEDATA", b"12345", b"3"),
+        (b"ACDATA", b"12345", b"4"),
+        (b"ROUTEDATA", b"12345", b"5"),
+    ]
+
+
+def test_set_stream_topics():
+    """Tests that the stream subscriptions are changed by the receive thread"""
+
+    client = BlueSkyClient()
+    assert client.acttopics == [b"ACDATA", b"SIMINFO"]
+
+    err = client.set_stream_topics(["ACDATA", "TEST"])
+    assert err == "Unknown stream topic(s): ['TEST']"
+
+    err = client.set_stream_topics(["ACDATA", "ROUTEDATA"])
+    assert err == "Stream topic(s) ['SIMINFO'] are required"
+
+    changes = []
+    client.subscribe = lambda name, node_id: changes.append(("sub", name, node_id))
+    client.unsubscribe = lambda name, node_id: changes.append(("unsub", name, node_id))
+    client.act = b"node"
+
+    err = client.set_stream_topics(["SIMINFO", "ACDATA", "ROUTEDATA"])
+    assert not err
+    assert not changes
+
+    assert client.receive()
+    assert changes == [("sub", b"ROUTEDATA", b"node")]
+    assert client.acttopics == [b"SIMINFO", b"ACDATA", b"ROUTEDATA"]
+
+    changes.clear()
+    err = client.set_stream_topics(["ACDATA", "SIMINFO"])
+    assert not err
+    assert client.receive()
+    assert changes == [("unsub", b"ROUTEDATA", b"node")]
+    assert client.acttopics == [b"ACDATA", b"SIMINFO"]
+
+
+def test_set_socket_options(monkeypatch):
+    """Tests that the ZMQ socket settings are applied"""
+
+    client = BlueSkyClient()
+    default_hwm = client.stream_in.getsockopt(zmq.RCVHWM)
+    client._set_socket_options()
+    assert client.stream_in.getsockopt(zmq.RCVHWM) == default_hwm
+
+    monkeypatch.setattr(Settings, "BS_ZMQ_HWM", 10)
+    monkeypatch.setattr(Settings, "BS_ZMQ_RCVBUF", 65536)
+    monkeypatch.setattr(Settings, "BS_TCP_KEEPALIVE", True)
+    monkeypatch.setattr(Settings, "BS_KEEPALIVE_IDLE", 30)
+    client._set_socket_options()
+    for sock in (client.event_io, client.stream_in):
+        assert sock.getsockopt(zmq.SNDHWM) == 10
+        assert sock.getsockopt(zmq.RCVHWM) == 10
+        assert sock.getsockopt(zmq.RCVBUF) == 65536
+        assert sock.getsockopt(zmq.TCP_KEEPALIVE) == 1
+        assert sock.getsockopt(zmq.TCP_KEEPALIVE_IDLE) == 30
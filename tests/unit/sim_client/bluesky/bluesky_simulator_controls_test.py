@@ -127,6 +127,42 @@ def test_load_scenario():
     bs_client_mock.load_scenario.return_value = None
     err = bs_sim_controls.load_scenario(_TEST_SCENARIO)
     assert not err
+    file_name = bs_client_mock.load_scenario.call_args[0][0]
+    assert file_name.startswith("test-scenario-") and file_name.endswith(".scn")
+    bs_client_mock.upload_new_scenario.assert_called_with(file_name, mock.ANY)
+
+    # Test a repeated load only loads the uploaded file
+
+    bs_client_mock.reset_mock()
+    with mock.patch(
+        "bluebird.sim_client.bluesky.bluesky_simulator_controls.BlueskyParser"
+    ) as parser_mock:
+        err = bs_sim_controls.load_scenario(_TEST_SCENARIO)
+        assert not err
+        parser_mock.assert_not_called()
+    bs_client_mock.upload_new_scenario.assert_not_called()
+    bs_client_mock.load_scenario.assert_called_once_with(file_name)
+
+    # Test the scenario is uploaded again if the cached file can't be loaded
+
+    bs_client_mock.reset_mock()
+    bs_client_mock.load_scenario.side_effect = ["Error 3", None]
+    err = bs_sim_controls.load_scenario(_TEST_SCENARIO)
+    assert not err
+    bs_client_mock.upload_new_scenario.assert_called_once_with(file_name, mock.ANY)
+    assert bs_client_mock.load_scenario.call_count == 2
+
+    # Test a different scenario is uploaded with a different name
+
+    bs_client_mock.reset_mock()
+    bs_client_mock.load_scenario.side_effect = None
+    other_scenario = props.Scenario(
+        name="test-scenario", content={**TEST_SCENARIO, "startTime": "01:00:00"}
+    )
+    err = bs_sim_controls.load_scenario(other_scenario)
+    assert not err
+    bs_client_mock.upload_new_scenario.assert_called_once()
+    assert bs_client_mock.load_scenario.call_args[0][0] != file_name
 
 
 def test_start():
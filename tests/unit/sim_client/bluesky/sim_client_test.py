@@ -14,4 +14,4 @@ def test_sim_client_module_import():
 
 def test_sim_client_instantiation():
     """Tests that the SimClient can be instantiated"""
-    sim_client_instantiation(_MODULE_NAME)
+    sim_client_instantiation(_MODULE_NAME, extra_methods={"set_stream_topics"})
@@ -1,6 +1,7 @@
 """
 Tests for MachCollAircraftControls
 """
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
@@ -24,3 +25,50 @@ def test_abstract_class_implemented():
         for x in dir(mc_aircraft_controls.MachCollAircraftControls)
         if not x.startswith("_")
     }
+
+
+def _flight_props(callsign: str, lat: float):
+    return {
+        "flight-data": {"callsign": callsign, "type": "B747"},
+        "pos": {"afl": 200, "speed": 250, "lat": lat, "long": -0.1},
+    }
+
+
+def test_all_properties():
+    """Tests that all_properties fetches each aircraft, in parallel if possible"""
+
+    sim_client = mock.Mock()
+    sim_client.fetch_executor = ThreadPoolExecutor(max_workers=2)
+    mc_client = sim_client.mc_client
+    aircraft_controls = mc_aircraft_controls.MachCollAircraftControls(sim_client)
+
+    flights = {"AAA": _flight_props("AAA", 51.0), "BBB": _flight_props("BBB", 52.0)}
+    mc_client.get_active_callsigns.return_value = ["AAA", "BBB"]
+    mc_client.get_active_flight_by_callsign.side_effect = lambda x, _: flights[x]
+
+    all_props = aircraft_controls.all_properties
+    assert [str(x) for x in all_props] == ["AAA", "BBB"]
+    assert list(all_props.values())[1].aircraft_type == "B747"
+    assert list(all_props.values())[1].position.lat_degrees == 52.0
+    assert sorted(
+        x[0][0] for x in mc_client.get_active_flight_by_callsign.call_args_list
+    ) == ["AAA", "BBB"]
+
+    sim_client.fetch_executor.shutdown()
+
+    # Test the aircraft are fetched sequentially without the fetch threads
+
+    sim_client.fetch_executor = None
+    mc_client.reset_mock()
+
+    all_props = aircraft_controls.all_properties
+    assert [str(x) for x in all_props] == ["AAA", "BBB"]
+    assert mc_client.get_active_flight_by_callsign.call_count == 2
+
+    # Test no aircraft are fetched if get_active_callsigns returns None
+
+    mc_client.reset_mock()
+    mc_client.get_active_callsigns.return_value = None
+
+    assert aircraft_controls.all_properties == {}
+    mc_client.get_active_flight_by_callsign.assert_not_called()
@@ -1,8 +1,11 @@
 """
 Tests for MachCollSimulatorControls
 """
+from unittest import mock
+
 import pytest
 
+import bluebird.utils.properties as props
 from bluebird.utils.abstract_simulator_controls import AbstractSimulatorControls
 
 mc_simulator_controls = pytest.importorskip(
@@ -10,23 +13,152 @@ mc_simulator_controls = pytest.importorskip(
 )
 
 
-def test_abstract_class_implemented():
-    """Tests that MachCollAircraftControls implements the abstract base class"""
+class FakeProvider:
+    def __str__(self):
+        return "MachColl"
+
+    @property
+    def metrics(self):
+        return []
 
-    class FakeProvider:
-        def __str__(self):
-            return "MachColl"
 
-        @property
-        def metrics(self):
-            return []
+def test_abstract_class_implemented():
+    """Tests that MachCollAircraftControls implements the abstract base class"""
 
     # Test basic instantiation
     mc_simulator_controls.MachCollSimulatorControls(None, None, FakeProvider())
 
     # Test ABC exactly implemented
-    assert AbstractSimulatorControls.__abstractmethods__ == {
+    assert AbstractSimulatorControls.__abstractmethods__ | {"refresh_properties"} == {
         x
         for x in dir(mc_simulator_controls.MachCollSimulatorControls)
         if not x.startswith("_")
     }
+
+
+def test_cached_properties():
+    """Tests that the sim properties are cached"""
+
+    sim_client = mock.Mock()
+    mc_client = sim_client.mc_client
+    mc_client.get_state.return_value = "RUNNING"
+    mc_client.get_speed.return_value = 1.0
+    mc_client.get_time.return_value = 60
+    success = {"code": {"Short Description": "Success"}}
+    mc_client.sim_pause.return_value = success
+    mc_client.set_increment.return_value = success
+    sim_controls = mc_simulator_controls.MachCollSimulatorControls(
+        sim_client, mock.Mock(), FakeProvider()
+    )
+
+    # Test the properties are only requested once
+
+    for _ in range(2):
+        sim_props = sim_controls.properties
+        assert sim_props.state == props.SimState.RUN
+        assert sim_props.speed == 1.0
+        assert sim_props.scenario_time == 60
+    for method in ("get_state", "get_speed", "get_time"):
+        getattr(mc_client, method).assert_called_once()
+
+    # Test the cached state is updated by a command, and used by the state checks
+
+    assert not sim_controls.pause()
+    assert not sim_controls.pause()
+    mc_client.sim_pause.assert_called_once()
+    assert sim_controls.properties.state == props.SimState.HOLD
+    mc_client.get_state.assert_called_once()
+
+    # Test the state and time are cached after a step, from requests made with the
+    # metrics client
+
+    mc_client.reset_mock()
+    metrics_client = sim_client.metrics_client
+    metrics_client.get_state.return_value = "PAUSED"
+    metrics_client.get_time.return_value = 65
+    assert not sim_controls.step()
+    sim_props = sim_controls.properties
+    assert sim_props.state == props.SimState.HOLD
+    assert sim_props.scenario_time == 65
+    for method in ("get_state", "get_speed", "get_time"):
+        getattr(mc_client, method).assert_not_called()
+    metrics_client.get_state.assert_called_once()
+    metrics_client.get_time.assert_called_once()
+
+    # Test the state and time are requested if they couldn't be got after the step
+
+    metrics_client.get_time.side_effect = ConnectionError
+    mc_client.get_time.return_value = 70
+    assert not sim_controls.step()
+    assert sim_controls.properties.scenario_time == 70
+    mc_client.get_state.assert_not_called()
+    mc_client.get_time.assert_called_once()
+    metrics_client.get_time.side_effect = None
+
+    # Test the cache is updated by a background refresh
+
+    mc_client.get_speed.return_value = 2.0
+    sim_controls.refresh_properties(mc_client)
+    assert sim_controls.properties.speed == 2.0
+
+    # Test the cache is cleared if the refresh fails
+
+    mc_client.reset_mock()
+    mc_client.get_speed.side_effect = ConnectionError
+    sim_controls.refresh_properties(mc_client)
+    mc_client.get_speed.side_effect = None
+    assert sim_controls.properties.speed == 2.0
+    assert mc_client.get_state.call_count == 2
+
+
+def test_step_metrics(monkeypatch, caplog):
+    """Tests that the metric results are collected after each step"""
+
+    sim_client = mock.Mock()
+    mc_client = sim_client.mc_client
+    mc_client.set_increment.return_value = {"code": {"Short Description": "Success"}}
+    metrics_client = sim_client.metrics_client
+    metrics_client.get_time.return_value = 60
+    metrics_client.get_metrics_result.side_effect = lambda x: {"m1": 1.0, "m2": 2.0}[x]
+    provider = mock.MagicMock()
+    provider.__str__.return_value = "MachColl"
+    provider.metrics = {"m1": None, "m2": None}
+    sim_controls = mc_simulator_controls.MachCollSimulatorControls(
+        sim_client, mock.Mock(), provider
+    )
+
+    # Test the results are published before the step returns, and are collected with
+    # the metrics client
+
+    assert not sim_controls.step()
+    metrics_client.queue_metrics_query.assert_called_once_with("m1", "m2")
+    provider.update.assert_has_calls(
+        [mock.call("m1", 1.0, 60), mock.call("m2", 2.0, 60)]
+    )
+    mc_client.queue_metrics_query.assert_not_called()
+    mc_client.get_metrics_result.assert_not_called()
+    mc_client.get_time.assert_not_called()
+
+    # Test the sim time is cached from the metrics collection
+
+    assert sim_controls._sim_time == 60
+
+    # Test the step can return before the results are collected
+
+    provider.reset_mock()
+    metrics_client.get_time.return_value = 65
+    with monkeypatch.context() as patch:
+        patch.setattr(mc_simulator_controls.Settings, "MC_METRICS_WAIT", False)
+        assert not sim_controls.step()
+        sim_controls._wait_for_metrics()
+    provider.update.assert_has_calls(
+        [mock.call("m1", 1.0, 65), mock.call("m2", 2.0, 65)]
+    )
+
+    # Test metric errors are logged, and don't fail the step
+
+    metrics_client.get_metrics_result.side_effect = AssertionError("No data")
+    assert not sim_controls.step()
+    assert "Error collecting metrics" in caplog.text
+    assert "No data" in caplog.text
+    assert not sim_controls._metrics_thread
@@ -1,9 +1,13 @@
 """
 Tests for the MachColl sim client module
 """
+import time
+from unittest import mock
+
 import pytest
 
 from bluebird.metrics import MetricsProviders
+from bluebird.settings import Settings
 from tests.unit.sim_client.common.imports_test import sim_client_instantiation
 
 
@@ -15,17 +19,57 @@ mc_aircraft_controls = pytest.importorskip(
 )
 
 
-def test_sim_client_instantiation():
-    """Tests that the SimClient can be instantiated"""
+class FakeProvider:
+    def __str__(self):
+        return "MachColl"
+
+    @property
+    def metrics(self):
+        return []
 
-    class FakeProvider:
-        def __str__(self):
-            return "MachColl"
+    def set_version(self, version):
+        pass
 
-        @property
-        def metrics(self):
-            return []
+
+def test_sim_client_instantiation():
+    """Tests that the SimClient can be instantiated"""
 
     sim_client_instantiation(
-        _MODULE_NAME, MetricsProviders([FakeProvider()]), extra_methods={"mc_client"}
+        _MODULE_NAME,
+        MetricsProviders([FakeProvider()]),
+        extra_methods={"mc_client", "metrics_client", "fetch_executor"},
     )
+
+
+def test_start_timers(monkeypatch):
+    """Tests that the sim properties are refreshed with their own client"""
+
+    sim_client_module = pytest.importorskip("bluebird.sim_client.machcoll.sim_client")
+    clients = []
+
+    def _new_client(**kwargs):
+        client = mock.Mock()
+        client.get_server_version.return_value = "1.0.0"
+        client.get_state.return_value = "RUNNING"
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(sim_client_module, "MCClientMetrics", _new_client)
+    monkeypatch.setenv("MQ_URL", "test")
+    monkeypatch.setattr(Settings, "MC_POLL_RATE", 100)
+    monkeypatch.setattr(Settings, "MC_FETCH_WORKERS", 1)
+
+    sim_client = sim_client_module.SimClient(MetricsProviders([FakeProvider()]))
+    sim_client.connect()
+    (timer,) = sim_client.start_timers()
+    poll_client = clients[2]
+    timeout = time.time() + 5
+    while not poll_client.get_time.called and time.time() < timeout:
+        time.sleep(0.01)
+    timer.stop()
+    sim_client.shutdown()
+
+    poll_client.get_time.assert_called()
+    for client in clients[:2]:
+        client.get_speed.assert_not_called()
+        client.get_time.assert_not_called()
@@ -0,0 +1,45 @@
+"""
+Tests for the DataCache class
+"""
+import os
+from pathlib import Path
+from unittest import mock
+
+from bluebird.sim_proxy.data_cache import DataCache
+
+
+def test_data_cache(tmpdir):
+    """Tests that DataCache only re-loads modified files"""
+
+    test_file = Path(tmpdir) / "test.json"
+    test_file.write_text("{}")
+    data_cache = DataCache()
+
+    # Test errors are not cached
+
+    loader = mock.Mock(return_value="Error")
+    assert data_cache.get(test_file, loader) == "Error"
+    assert data_cache.get(test_file, loader) == "Error"
+    assert loader.call_count == 2
+
+    # Test data is cached
+
+    loader = mock.Mock(return_value={"test": 1})
+    data = data_cache.get(test_file, loader)
+    assert data == {"test": 1}
+    assert data_cache.get(test_file, loader) is data
+    loader.assert_called_once_with(test_file)
+
+    # Test modified files are re-loaded
+
+    stat = test_file.stat()
+    os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    loader.return_value = {"test": 2}
+    assert data_cache.get(test_file, loader) == {"test": 2}
+    assert loader.call_count == 2
+
+    # Test clear
+
+    data_cache.clear()
+    assert data_cache.get(test_file, loader) == {"test": 2}
+    assert loader.call_count == 3
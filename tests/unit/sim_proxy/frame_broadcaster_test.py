@@ -0,0 +1,116 @@
+"""
+Tests for the FrameBroadcaster class
+"""
+import asyncio
+import threading
+from unittest import mock
+
+import numpy as np
+
+import bluebird.utils.types as types
+from bluebird.sim_proxy.frame_broadcaster import FrameBroadcaster
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from tests.unit.api.resources import TEST_SIM_PROPS
+
+
+def _test_arrays(lat: float) -> AircraftArrays:
+    return AircraftArrays(
+        callsigns=[types.Callsign("TEST1")],
+        aircraft_type=["B747"],
+        altitude=np.array([18_500.0]),
+        ground_speed=np.array([53.0]),
+        heading=np.array([74]),
+        lat=np.array([lat]),
+        lon=np.array([-0.1]),
+        vertical_speed=np.array([0]),
+    )
+
+
+def test_frame_broadcaster():
+    """Tests that FrameBroadcaster only publishes new frames to subscribers"""
+
+    aircraft_controls = mock.Mock()
+    simulator_controls = mock.Mock()
+    simulator_controls.properties = TEST_SIM_PROPS
+    aircraft_controls.all_arrays = _test_arrays(51.5)
+    aircraft_controls.data_version = 1
+    frames = FrameBroadcaster(aircraft_controls, simulator_controls)
+
+    # Test the proxy isn't read when there are no subscribers
+
+    all_arrays_mock = mock.PropertyMock(return_value=_test_arrays(51.5))
+    type(aircraft_controls).all_arrays = all_arrays_mock
+    frames._publish()
+    all_arrays_mock.assert_not_called()
+    assert not frames.wait_for_frame(None, timeout=0)
+
+    with frames.subscribe():
+
+        # Test a frame is published
+
+        frames._publish()
+        frame = frames.wait_for_frame(None, timeout=0)
+        assert frame.seq == 1
+        assert frame.scenario_time == TEST_SIM_PROPS.scenario_time
+        assert frame.aircraft == {
+            "TEST1": {
+                "actype": "B747",
+                "current_fl": 18_500.0,
+                "gs": 53.0,
+                "hdg": 74,
+                "lat": 51.5,
+                "lon": -0.1,
+                "vs": 0,
+            }
+        }
+
+        # Test a new frame isn't created if the data hasn't changed
+
+        frames._publish()
+        assert frames.wait_for_frame(None, timeout=0) is frame
+        assert not frames.wait_for_frame(1, timeout=0)
+
+        # Test waiting subscribers are woken by a new frame
+
+        all_arrays_mock.return_value = _test_arrays(52.5)
+        aircraft_controls.data_version = 2
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(frames.wait_for_frame(1, timeout=5))
+        )
+        waiter.start()
+        frames._publish()
+        waiter.join()
+        assert results[0].seq == 2
+        assert results[0].aircraft["TEST1"]["lat"] == 52.5
+
+    assert not frames._subscribers
+
+
+def test_frame_broadcaster_async():
+    """Tests that async subscribers are woken by a new frame"""
+
+    aircraft_controls = mock.Mock()
+    simulator_controls = mock.Mock()
+    simulator_controls.properties = TEST_SIM_PROPS
+    aircraft_controls.all_arrays = _test_arrays(51.5)
+    aircraft_controls.data_version = 1
+    frames = FrameBroadcaster(aircraft_controls, simulator_controls)
+
+    async def run():
+        with frames.subscribe():
+
+            # Test the timeout when there is no frame
+
+            assert not await frames.wait_for_frame_async(None, timeout=0.01)
+
+            # Test a new frame is returned once published from another thread
+
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, threading.Thread(target=frames._publish).start)
+            frame = await frames.wait_for_frame_async(None, timeout=5)
+            assert frame.seq == 1
+            assert await frames.wait_for_frame_async(None, timeout=0) is frame
+
+    asyncio.run(run())
+    assert not frames._async_waiters
@@ -2,14 +2,18 @@
 Tests for the ProxyAircraftControls class
 """
 import copy
+import dataclasses
 from unittest import mock
 
+import numpy as np
 import pytest
 from aviary.sector.sector_element import SectorElement
 
 import bluebird.utils.properties as props
 import bluebird.utils.types as types
+from bluebird.settings import Settings
 from bluebird.sim_proxy.proxy_aircraft_controls import ProxyAircraftControls
+from bluebird.utils.aircraft_arrays import AircraftArrays
 from bluebird.utils.sector_validation import validate_geojson_sector
 from tests.data import TEST_SCENARIO
 from tests.data import TEST_SECTOR
@@ -34,6 +38,9 @@ def scenario_test_data():
             for x in routes
             if routes[x].fix_names() == [x["fixName"] for x in aircraft_data["route"]]
         )
+        aircraft_props.ground_speed = types.GroundSpeed(150)
+        aircraft_props.heading = types.Heading(90)
+        aircraft_props.vertical_speed = types.VerticalSpeed(0)
         full_data[callsign] = copy.deepcopy(aircraft_props)
         # Delete the stuff which isn't set by the simulators
         aircraft_props.cleared_flight_level = None
@@ -43,6 +50,13 @@ def scenario_test_data():
     return full_data, sim_data
 
 
+def _sim_arrays(sim_data):
+    """Converts the test data to the AircraftArrays returned by the simulator"""
+    if isinstance(sim_data, str):
+        return sim_data
+    return AircraftArrays.from_properties(sim_data)
+
+
 def test_abstract_class_implemented():
     """Tests that ProxyAircraftControls implements the abstract base class"""
     ProxyAircraftControls(mock.Mock())
@@ -52,14 +66,15 @@ def test_all_properties(scenario_test_data):
     """Tests that ProxyAircraftControls implements all_properties"""
 
     mock_aircraft_controls = mock.Mock()
+    mock_aircraft_controls.data_version = 1
     proxy_aircraft_controls = ProxyAircraftControls(mock_aircraft_controls)
 
     proxy_aircraft_controls.set_initial_properties(_TEST_SECTOR_ELEMENT, TEST_SCENARIO)
 
     # Test error handling from all_properties
 
-    all_properties_mock = mock.PropertyMock(return_value="Sim error")
-    type(mock_aircraft_controls).all_properties = all_properties_mock
+    all_arrays_mock = mock.PropertyMock(return_value="Sim error")
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
     err = proxy_aircraft_controls.all_properties
     assert err == "Sim error"
 
@@ -67,16 +82,251 @@ def test_all_properties(scenario_test_data):
 
     full_data, sim_data = scenario_test_data
 
-    all_properties_mock.return_value = sim_data
+    all_arrays_mock.return_value = _sim_arrays(sim_data)
     properties = proxy_aircraft_controls.all_properties
     assert properties == full_data
 
     # Test existing data reused
 
-    all_properties_mock.reset_mock()
+    all_arrays_mock.reset_mock()
+    properties = proxy_aircraft_controls.all_properties
+    assert properties == full_data
+    all_arrays_mock.assert_not_called()
+    version = proxy_aircraft_controls.data_version
+
+    # Test data refreshed when the simulator has newer data
+
+    mock_aircraft_controls.data_version = 2
     properties = proxy_aircraft_controls.all_properties
     assert properties == full_data
-    all_properties_mock.assert_not_called()
+    all_arrays_mock.assert_called_once()
+    assert proxy_aircraft_controls.data_version == version + 1
+
+    # Test the returned properties are a read-only snapshot of one data_version
+
+    test_callsign = list(sim_data)[0]
+    new_data = copy.deepcopy(sim_data)
+    new_data[test_callsign].altitude = types.Altitude(12_345)
+    del new_data[list(sim_data)[1]]
+    all_arrays_mock.return_value = _sim_arrays(new_data)
+    mock_aircraft_controls.data_version = 3
+    new_properties = proxy_aircraft_controls.all_properties
+    assert new_properties is not properties
+    assert new_properties[test_callsign].altitude == types.Altitude(12_345)
+    assert len(new_properties) == len(sim_data) - 1
+    assert properties == full_data
+    with pytest.raises(TypeError):
+        properties[test_callsign] = None
+    all_arrays_mock.return_value = _sim_arrays(sim_data)
+
+    # Test data only refreshed after invalidation if the version is unknown
+
+    mock_aircraft_controls.data_version = None
+    proxy_aircraft_controls.all_properties
+    all_arrays_mock.reset_mock()
+    proxy_aircraft_controls.all_properties
+    all_arrays_mock.assert_not_called()
+    proxy_aircraft_controls.invalidate_data()
+    proxy_aircraft_controls.all_properties
+    all_arrays_mock.assert_called_once()
+
+
+def test_changed_since(scenario_test_data):
+    """Tests that changed_since returns the aircraft which have been updated"""
+
+    mock_aircraft_controls = mock.Mock()
+    mock_aircraft_controls.data_version = None
+    proxy_aircraft_controls = ProxyAircraftControls(mock_aircraft_controls)
+
+    proxy_aircraft_controls.set_initial_properties(_TEST_SECTOR_ELEMENT, TEST_SCENARIO)
+
+    full_data, sim_data = scenario_test_data
+    callsigns = list(sim_data)
+    all_arrays_mock = mock.PropertyMock(return_value=_sim_arrays(sim_data))
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
+
+    # Test all aircraft changed after the scenario is loaded
+
+    assert proxy_aircraft_controls.changed_since(0) == (callsigns, [])
+    version = proxy_aircraft_controls.data_version
+    assert proxy_aircraft_controls.changed_since(version) == ([], [])
+
+    # Test only the updated aircraft are returned, and that the previous properties
+    # are not modified
+
+    proxy_aircraft_controls.store_current_props()
+    prev_props = proxy_aircraft_controls.prev_ac_props()
+    new_data = copy.deepcopy(sim_data)
+    new_data[callsigns[0]].altitude = types.Altitude(12_345)
+    del new_data[callsigns[1]]
+    all_arrays_mock.return_value = _sim_arrays(new_data)
+    proxy_aircraft_controls.invalidate_data()
+
+    assert proxy_aircraft_controls.changed_since(version) == (
+        [callsigns[0]],
+        [callsigns[1]],
+    )
+    assert prev_props[callsigns[0]] == full_data[callsigns[0]]
+    assert proxy_aircraft_controls.properties(callsigns[0]).altitude == types.Altitude(
+        12_345
+    )
+
+
+def test_changed_since_pruned(scenario_test_data, monkeypatch):
+    """Tests that only the most recently removed aircraft are remembered"""
+
+    monkeypatch.setattr(Settings, "REMOVED_HISTORY", 1)
+
+    mock_aircraft_controls = mock.Mock()
+    mock_aircraft_controls.data_version = None
+    proxy_aircraft_controls = ProxyAircraftControls(mock_aircraft_controls)
+
+    proxy_aircraft_controls.set_initial_properties(_TEST_SECTOR_ELEMENT, TEST_SCENARIO)
+
+    _, sim_data = scenario_test_data
+    callsigns = list(sim_data)
+    all_arrays_mock = mock.PropertyMock(return_value=_sim_arrays(sim_data))
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
+    assert proxy_aircraft_controls.changed_since(0) == (callsigns, [])
+    assert proxy_aircraft_controls.oldest_since == 0
+
+    # Remove the aircraft one at a time
+
+    versions = []
+    for idx in range(1, len(callsigns) + 1):
+        versions.append(proxy_aircraft_controls.data_version)
+        all_arrays_mock.return_value = _sim_arrays(
+            {x: sim_data[x] for x in callsigns[idx:]}
+        )
+        proxy_aircraft_controls.invalidate_data()
+        proxy_aircraft_controls.all_properties
+
+    # Test only the last removal is stored, and that older versions are rejected
+
+    assert proxy_aircraft_controls._removed == {
+        callsigns[-1]: proxy_aircraft_controls.data_version
+    }
+    assert proxy_aircraft_controls.oldest_since == versions[-1]
+    assert proxy_aircraft_controls.changed_since(versions[-1]) == (
+        [],
+        [callsigns[-1]],
+    )
+    err = proxy_aircraft_controls.changed_since(versions[-1] - 1)
+    assert err == (
+        f"Invalid version ({versions[-1] - 1}). The removed aircraft are only stored "
+        f"since data_version {versions[-1]}"
+    )
+
+
+def test_prev_ac_props(scenario_test_data):
+    """Tests that prev_ac_props returns the properties from previous steps"""
+
+    mock_aircraft_controls = mock.Mock()
+    mock_aircraft_controls.data_version = None
+    proxy_aircraft_controls = ProxyAircraftControls(mock_aircraft_controls)
+
+    proxy_aircraft_controls.set_initial_properties(_TEST_SECTOR_ELEMENT, TEST_SCENARIO)
+
+    _, sim_data = scenario_test_data
+    test_callsign = list(sim_data)[0]
+    all_arrays_mock = mock.PropertyMock(return_value=_sim_arrays(sim_data))
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
+
+    # Test empty before any steps
+
+    assert not proxy_aircraft_controls.prev_ac_props()
+
+    # Test the history is limited to Settings.STATE_HISTORY steps
+
+    for alt in range(Settings.STATE_HISTORY + 1):
+        new_data = copy.deepcopy(sim_data)
+        new_data[test_callsign].altitude = types.Altitude(alt)
+        all_arrays_mock.return_value = _sim_arrays(new_data)
+        proxy_aircraft_controls.invalidate_data()
+        proxy_aircraft_controls.all_properties
+        proxy_aircraft_controls.store_current_props()
+
+    prev_props = proxy_aircraft_controls.prev_ac_props()
+    assert prev_props[test_callsign].altitude == types.Altitude(Settings.STATE_HISTORY)
+    assert prev_props is proxy_aircraft_controls.prev_ac_props()
+    assert proxy_aircraft_controls.prev_ac_props(Settings.STATE_HISTORY)[
+        test_callsign
+    ].altitude == types.Altitude(1)
+    assert not proxy_aircraft_controls.prev_ac_props(Settings.STATE_HISTORY + 1)
+
+    with pytest.raises(TypeError):
+        prev_props[test_callsign] = None
+
+    # Test the history is cleared on reset
+
+    proxy_aircraft_controls.invalidate_data(clear=True)
+    assert not proxy_aircraft_controls.prev_ac_props()
+
+
+def test_all_arrays(scenario_test_data):
+    """
+    Tests that all_arrays returns the simulator data for the known aircraft, without
+    creating any AircraftProperties
+    """
+
+    mock_aircraft_controls = mock.Mock()
+    mock_aircraft_controls.data_version = None
+    proxy_aircraft_controls = ProxyAircraftControls(mock_aircraft_controls)
+
+    proxy_aircraft_controls.set_initial_properties(_TEST_SECTOR_ELEMENT, TEST_SCENARIO)
+
+    _, sim_data = scenario_test_data
+    sim_arrays = _sim_arrays(sim_data)
+    type(mock_aircraft_controls).all_arrays = mock.PropertyMock(return_value=sim_arrays)
+    sim_all_properties_mock = mock.PropertyMock()
+    type(mock_aircraft_controls).all_properties = sim_all_properties_mock
+
+    with mock.patch.object(AircraftArrays, "properties") as properties_mock:
+        ac_arrays = proxy_aircraft_controls.all_arrays
+        assert ac_arrays is sim_arrays
+        assert proxy_aircraft_controls.all_arrays is ac_arrays
+    properties_mock.assert_not_called()
+    sim_all_properties_mock.assert_not_called()
+
+    # Test only the known aircraft are returned
+
+    new_data = {**sim_data, types.Callsign("NEW"): list(sim_data.values())[0]}
+    type(mock_aircraft_controls).all_arrays = mock.PropertyMock(
+        return_value=_sim_arrays(new_data)
+    )
+    proxy_aircraft_controls.invalidate_data()
+    ac_arrays = proxy_aircraft_controls.all_arrays
+    assert ac_arrays.callsigns == list(sim_data)
+    assert ac_arrays.all_properties() == {
+        x: dataclasses.replace(y, initial_flight_level=None)
+        for x, y in sim_data.items()
+    }
+
+
+def test_stable_index():
+    """Tests that stable_index keeps the index of each aircraft until a reset"""
+
+    proxy_aircraft_controls = ProxyAircraftControls(mock.Mock())
+
+    def _arrays(*callsigns):
+        zeros = np.zeros(len(callsigns))
+        return AircraftArrays(
+            [types.Callsign(x) for x in callsigns],
+            ["B747"] * len(callsigns),
+            *([zeros] * 6),
+        )
+
+    def _str_keys(index):
+        return {str(x): y for x, y in index.items()}
+
+    index = proxy_aircraft_controls.stable_index(_arrays("AAA", "BBB"))
+    assert _str_keys(index) == {"AAA": 0, "BBB": 1}
+    index = proxy_aircraft_controls.stable_index(_arrays("CCC", "BBB"))
+    assert _str_keys(index) == {"AAA": 0, "BBB": 1, "CCC": 2}
+
+    proxy_aircraft_controls.invalidate_data(clear=True)
+    index = proxy_aircraft_controls.stable_index(_arrays("CCC"))
+    assert _str_keys(index) == {"CCC": 0}
 
 
 def test_callsigns(scenario_test_data):
@@ -89,15 +339,15 @@ def test_callsigns(scenario_test_data):
 
     # Test error handling
 
-    all_properties_mock = mock.PropertyMock(return_value="Sim error")
-    type(mock_aircraft_controls).all_properties = all_properties_mock
+    all_arrays_mock = mock.PropertyMock(return_value="Sim error")
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
     err = proxy_aircraft_controls.callsigns
     assert err == "Sim error"
 
     # Test valid response
 
     _, sim_data = scenario_test_data
-    all_properties_mock.return_value = sim_data
+    all_arrays_mock.return_value = _sim_arrays(sim_data)
     callsings = proxy_aircraft_controls.callsigns
     assert callsings == list(sim_data.keys())
 
@@ -128,8 +378,8 @@ def test_set_cleared_fl(scenario_test_data):
 
     # Assert stored cfl updated
 
-    all_properties_mock = mock.PropertyMock(return_value=sim_data)
-    type(mock_aircraft_controls).all_properties = all_properties_mock
+    all_arrays_mock = mock.PropertyMock(return_value=_sim_arrays(sim_data))
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
     assert (
         proxy_aircraft_controls.all_properties[test_callsign].cleared_flight_level
         == test_alt
@@ -202,8 +452,8 @@ def test_direct_to_waypoint(scenario_test_data):
     # Test error for missing aircraft
 
     _, sim_data = scenario_test_data
-    all_properties_mock = mock.PropertyMock(return_value=sim_data)
-    type(mock_aircraft_controls).all_properties = all_properties_mock
+    all_arrays_mock = mock.PropertyMock(return_value=_sim_arrays(sim_data))
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
 
     err = proxy_aircraft_controls.direct_to_waypoint("INVALID", "")
     assert err == "Unknown callsign INVALID"
@@ -253,6 +503,8 @@ def test_create(scenario_test_data):
     test_callsign = list(sim_data)[0]
 
     proxy_aircraft_controls.set_initial_properties(_TEST_SECTOR_ELEMENT, TEST_SCENARIO)
+    all_arrays_mock = mock.PropertyMock(return_value=_sim_arrays(sim_data))
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
 
     err = proxy_aircraft_controls.create(test_callsign, None, None, None, None, None)
     assert err == "Aircraft already exists"
@@ -268,29 +520,28 @@ def test_create(scenario_test_data):
 
     # Test error when checking for sim data for new aircraft
 
-    all_properties_mock = mock.PropertyMock(return_value="Sim error (all_properties)")
-    type(mock_aircraft_controls).all_properties = all_properties_mock
+    all_arrays_mock.return_value = "Sim error (all_arrays)"
     mock_create.return_value = None
 
     err = proxy_aircraft_controls.create(new_callsign, None, None, None, None, None)
-    assert err == "Sim error (all_properties)"
+    assert err == "Sim error (all_arrays)"
 
     # Test error when no sim data received for newly created aircraft
 
     new_callsign = types.Callsign("NEW2")
-    all_properties_mock.return_value = sim_data
+    all_arrays_mock.return_value = _sim_arrays(sim_data)
     err = proxy_aircraft_controls.create(new_callsign, None, None, None, None, None)
     assert err == "New callsign missing from sim data"
 
     # Test valid response
 
-    all_properties_mock.return_value = {
-        **sim_data,
-        new_callsign: sim_data[test_callsign],
-    }
+    all_arrays_mock.return_value = _sim_arrays(
+        {**sim_data, new_callsign: sim_data[test_callsign]}
+    )
 
     err = proxy_aircraft_controls.create(new_callsign, None, None, None, None, None)
     assert not err
+    assert proxy_aircraft_controls.properties(new_callsign).callsign == new_callsign
 
 
 def test_properties(scenario_test_data):
@@ -301,8 +552,8 @@ def test_properties(scenario_test_data):
 
     # Test error from all_properties
 
-    all_properties_mock = mock.PropertyMock(return_value="Sim error")
-    type(mock_aircraft_controls).all_properties = all_properties_mock
+    all_arrays_mock = mock.PropertyMock(return_value="Sim error")
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
 
     err = proxy_aircraft_controls.properties(None)
     assert err == "Sim error"
@@ -312,7 +563,7 @@ def test_properties(scenario_test_data):
     proxy_aircraft_controls.set_initial_properties(_TEST_SECTOR_ELEMENT, TEST_SCENARIO)
 
     full_data, sim_data = scenario_test_data
-    all_properties_mock.return_value = sim_data
+    all_arrays_mock.return_value = _sim_arrays(sim_data)
 
     err = proxy_aircraft_controls.properties(types.Callsign("MISS"))
     assert err == "Unknown callsign MISS"
@@ -320,9 +571,19 @@ def test_properties(scenario_test_data):
     # Test valid response
 
     test_callsign = list(full_data)[0]
-    aircraft_props = proxy_aircraft_controls.properties(test_callsign)
+    with mock.patch.object(
+        AircraftArrays,
+        "properties",
+        autospec=True,
+        side_effect=AircraftArrays.properties,
+    ) as properties_mock:
+        aircraft_props = proxy_aircraft_controls.properties(test_callsign)
     assert aircraft_props == full_data[test_callsign]
 
+    # Test the properties are only created for the requested aircraft
+
+    properties_mock.assert_called_once_with(mock.ANY, test_callsign)
+
 
 def test_route(scenario_test_data):
     """Tests that ProxyAircraftControls implements route"""
@@ -332,8 +593,8 @@ def test_route(scenario_test_data):
 
     # Test error error from properties
 
-    all_properties_mock = mock.PropertyMock(return_value="Sim error")
-    type(mock_aircraft_controls).all_properties = all_properties_mock
+    all_arrays_mock = mock.PropertyMock(return_value="Sim error")
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
 
     err = proxy_aircraft_controls.route(None)
     assert err == "Sim error"
@@ -346,7 +607,7 @@ def test_route(scenario_test_data):
 
     full_data, sim_data = scenario_test_data
     test_callsign = list(full_data)[0]
-    all_properties_mock.return_value = sim_data
+    all_arrays_mock.return_value = _sim_arrays(sim_data)
 
     err = proxy_aircraft_controls.route(test_callsign)
     assert err == "Aircraft has no route"
@@ -368,8 +629,8 @@ def test_exists(scenario_test_data):
 
     # Test error error from callsigns property
 
-    all_properties_mock = mock.PropertyMock(return_value="Sim error")
-    type(mock_aircraft_controls).all_properties = all_properties_mock
+    all_arrays_mock = mock.PropertyMock(return_value="Sim error")
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
 
     err = proxy_aircraft_controls.exists(None)
     assert err == "Sim error"
@@ -377,7 +638,7 @@ def test_exists(scenario_test_data):
     # Test False for unknown callsign
 
     full_data, sim_data = scenario_test_data
-    all_properties_mock.return_value = sim_data
+    all_arrays_mock.return_value = _sim_arrays(sim_data)
 
     exists = proxy_aircraft_controls.exists(types.Callsign("MISS"))
     assert exists is False
@@ -399,23 +660,69 @@ def test_invalidate_data(scenario_test_data):
 
     proxy_aircraft_controls.set_initial_properties(_TEST_SECTOR_ELEMENT, TEST_SCENARIO)
     _, sim_data = scenario_test_data
-    all_properties_mock = mock.PropertyMock(return_value=sim_data)
-    type(mock_aircraft_controls).all_properties = all_properties_mock
+    all_arrays_mock = mock.PropertyMock(return_value=_sim_arrays(sim_data))
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
 
     all_properties = proxy_aircraft_controls.all_properties
-    assert isinstance(all_properties, dict)
+    assert not isinstance(all_properties, str)
 
     # Test data is invalidated
 
-    all_properties_mock.reset_mock()
+    all_arrays_mock.reset_mock()
     proxy_aircraft_controls.invalidate_data()
     all_properties = proxy_aircraft_controls.all_properties
-    assert isinstance(all_properties, dict)
-    all_properties_mock.assert_called_once()
+    assert not isinstance(all_properties, str)
+    all_arrays_mock.assert_called_once()
 
     # Test data is cleared
 
     proxy_aircraft_controls.invalidate_data(clear=True)
-    all_properties_mock.return_value = {}
+    all_arrays_mock.return_value = _sim_arrays({})
     all_properties = proxy_aircraft_controls.all_properties
     assert all_properties == {}
+
+
+def test_send_commands(scenario_test_data):
+    """Tests that ProxyAircraftControls implements send_commands"""
+
+    mock_aircraft_controls = mock.Mock()
+    proxy_aircraft_controls = ProxyAircraftControls(mock_aircraft_controls)
+
+    # Test error from all_properties
+
+    all_arrays_mock = mock.PropertyMock(return_value="Sim error")
+    type(mock_aircraft_controls).all_arrays = all_arrays_mock
+
+    err = proxy_aircraft_controls.send_commands([])
+    assert err == "Sim error"
+
+    # Test commands which fail validation are not sent
+
+    proxy_aircraft_controls.set_initial_properties(_TEST_SECTOR_ELEMENT, TEST_SCENARIO)
+    _, sim_data = scenario_test_data
+    all_arrays_mock.return_value = _sim_arrays(sim_data)
+    test_callsign = list(sim_data)[0]
+    test_alt = types.Altitude(12_345)
+
+    commands = [
+        props.AircraftCommand("hdg", types.Callsign("MISS"), {"hdg": None}),
+        props.AircraftCommand("direct", test_callsign, {"waypoint": "TEST"}),
+        props.AircraftCommand("alt", test_callsign, {"alt": test_alt}),
+    ]
+
+    mock_aircraft_controls.send_commands.return_value = [None]
+    results = proxy_aircraft_controls.send_commands(commands)
+    assert results == [
+        'Aircraft "MISS" does not exist',
+        'Waypoint "TEST" is not in the route '
+        "['FIYRE', 'EARTH', 'WATER', 'AIR', 'SPIRT']",
+        None,
+    ]
+    mock_aircraft_controls.send_commands.assert_called_once_with(commands[2:])
+
+    # Assert stored cfl updated
+
+    assert (
+        proxy_aircraft_controls.all_properties[test_callsign].cleared_flight_level
+        == test_alt
+    )
@@ -0,0 +1,72 @@
+"""
+Tests for the SimPool class
+"""
+from unittest import mock
+
+import pytest
+
+from bluebird.sim_proxy.sim_pool import SimPool
+
+
+def test_sim_pool():
+    """Tests the basic SimPool functionality"""
+
+    with pytest.raises(AssertionError, match="Expected at least one SimProxy"):
+        SimPool({})
+
+    sim_proxies = {"0": mock.Mock(), "1": mock.Mock()}
+    sim_pool = SimPool(sim_proxies)
+
+    assert len(sim_pool) == 2
+    assert sim_pool.env_ids == ["0", "1"]
+    assert sim_pool.default is sim_proxies["0"]
+    assert sim_pool.get("1") is sim_proxies["1"]
+    assert sim_pool.get("2") is None
+    assert list(sim_pool) == list(sim_proxies.values())
+
+
+def test_map():
+    """Tests that SimPool.map calls the function for each environment"""
+
+    sim_proxies = {"0": mock.Mock(), "1": mock.Mock(), "2": mock.Mock()}
+    sim_pool = SimPool(sim_proxies)
+
+    results = sim_pool.map(lambda env_id, x: (env_id, x), ["2", "0"])
+    assert results == {"2": ("2", sim_proxies["2"]), "0": ("0", sim_proxies["0"])}
+
+    def _raise(env_id, sim_proxy):
+        raise ValueError(env_id)
+
+    with pytest.raises(ValueError, match="1"):
+        sim_pool.map(_raise, ["1"])
+
+
+def test_start_timers():
+    """Tests that SimPool starts the timers for each simulator"""
+
+    sim_proxies = {"0": mock.Mock(), "1": mock.Mock()}
+    sim_proxies["0"].start_timers.return_value = ["timer0"]
+    sim_proxies["1"].start_timers.return_value = ["timer1", "timer2"]
+    sim_pool = SimPool(sim_proxies)
+
+    assert sim_pool.start_timers() == ["timer0", "timer1", "timer2"]
+
+
+def test_shutdown():
+    """Tests that SimPool shuts down each simulator"""
+
+    sim_proxies = {"0": mock.Mock(), "1": mock.Mock()}
+    sim_proxies["0"].shutdown.return_value = True
+    sim_proxies["1"].shutdown.return_value = True
+    sim_pool = SimPool(sim_proxies)
+
+    assert sim_pool.shutdown()
+    for sim_proxy in sim_proxies.values():
+        sim_proxy.shutdown.assert_called_once_with(False)
+
+    # Test all clients are shut down even if one fails
+
+    sim_proxies["0"].shutdown.side_effect = Exception("Error")
+    sim_proxies["1"].shutdown.reset_mock()
+    assert not sim_pool.shutdown(shutdown_sim=True)
+    sim_proxies["1"].shutdown.assert_called_once_with(True)
@@ -0,0 +1,64 @@
+"""
+Tests for the AircraftArrays class
+"""
+import numpy as np
+import pytest
+
+import bluebird.utils.types as types
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from bluebird.utils.properties import AircraftProperties
+
+
+def _props(callsign: str, alt: int) -> AircraftProperties:
+    return AircraftProperties(
+        aircraft_type="B744",
+        altitude=types.Altitude(alt),
+        callsign=types.Callsign(callsign),
+        cleared_flight_level=None,
+        ground_speed=types.GroundSpeed(150),
+        heading=types.Heading(45),
+        initial_flight_level=None,
+        position=types.LatLon(51.5, -0.1),
+        requested_flight_level=None,
+        route_name=None,
+        vertical_speed=types.VerticalSpeed(500),
+    )
+
+
+def test_aircraft_arrays():
+    """Tests the AircraftArrays conversion to and from AircraftProperties"""
+
+    all_props = {x.callsign: x for x in (_props("TEST1", 1000), _props("TEST2", 2000))}
+    ac_arrays = AircraftArrays.from_properties(all_props)
+
+    assert len(ac_arrays) == 2
+    assert types.Callsign("TEST2") in ac_arrays
+    assert ac_arrays.index[types.Callsign("TEST2")] == 1
+    assert np.array_equal(ac_arrays.altitude, [1000, 2000])
+    assert ac_arrays.all_properties() == all_props
+
+    with pytest.raises(AssertionError, match="same length"):
+        AircraftArrays(
+            callsigns=[types.Callsign("TEST1")],
+            aircraft_type=["B744"],
+            altitude=np.array([]),
+            ground_speed=np.array([0.0]),
+            heading=np.array([0]),
+            lat=np.array([0.0]),
+            lon=np.array([0.0]),
+            vertical_speed=np.array([0]),
+        )
+
+    # Test the values are checked when the arrays are created
+
+    with pytest.raises(AssertionError, match="Latitude"):
+        AircraftArrays(
+            callsigns=[types.Callsign("TEST1")],
+            aircraft_type=["B744"],
+            altitude=np.array([0.0]),
+            ground_speed=np.array([0.0]),
+            heading=np.array([0]),
+            lat=np.array([np.nan]),
+            lon=np.array([0.0]),
+            vertical_speed=np.array([0]),
+        )
@@ -0,0 +1,29 @@
+"""
+Tests for the npcodec module
+"""
+import msgpack
+import numpy as np
+
+from bluebird.utils.npcodec import decode_ndarray
+from bluebird.utils.npcodec import encode_ndarray
+
+
+def test_npcodec():
+    """Tests that numpy arrays can be encoded and decoded with msgpack"""
+
+    data = {
+        "floats": np.array([[1.5, np.nan], [-3.0, 4.25]]),
+        "ints": np.array([1, 2, 3], dtype=np.int32),
+        "bools": np.array([True, False]),
+        "scalar": np.float64(1.5),
+        "other": ["a", 1],
+    }
+
+    packed = msgpack.packb(data, default=encode_ndarray, use_bin_type=True)
+    unpacked = msgpack.unpackb(packed, object_hook=decode_ndarray, raw=False)
+
+    for name in ("floats", "ints", "bools"):
+        assert unpacked[name].dtype == data[name].dtype
+        np.testing.assert_array_equal(unpacked[name], data[name])
+    assert unpacked["scalar"] == 1.5
+    assert unpacked["other"] == ["a", 1]
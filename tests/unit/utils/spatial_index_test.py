@@ -0,0 +1,70 @@
+"""
+Tests for the SpatialIndex class
+"""
+import itertools
+
+import numpy as np
+import pytest
+
+import bluebird.utils.types as types
+from bluebird.utils.aircraft_arrays import AircraftArrays
+from bluebird.utils.spatial_index import horizontal_distance
+from bluebird.utils.spatial_index import SpatialIndex
+
+
+def _test_arrays(lat, lon, alt) -> AircraftArrays:
+    n = len(lat)
+    return AircraftArrays(
+        callsigns=[types.Callsign(f"TEST{i}") for i in range(n)],
+        aircraft_type=["B744"] * n,
+        altitude=np.asarray(alt, dtype=float),
+        ground_speed=np.zeros(n),
+        heading=np.zeros(n, dtype=int),
+        lat=np.asarray(lat, dtype=float),
+        lon=np.asarray(lon, dtype=float),
+        vertical_speed=np.zeros(n, dtype=int),
+    )
+
+
+def test_horizontal_distance():
+    """Tests the great-circle distance calculation"""
+
+    # 1 minute of latitude is approx. 1 nautical mile
+    dist = horizontal_distance(51.0, 0.0, 51 + 1 / 60, 0.0)
+    assert dist == pytest.approx(1852, rel=0.01)
+
+
+def test_spatial_index():
+    """Tests that SpatialIndex finds the same pairs as comparing every aircraft"""
+
+    with pytest.raises(AssertionError, match="Distances must be positive"):
+        SpatialIndex(_test_arrays([], [], []), 0, 1000)
+
+    # Test no aircraft
+
+    index = SpatialIndex(_test_arrays([], [], []), 10_000, 1000)
+    assert [x.tolist() for x in index.pairs()] == [[], []]
+
+    # Test pairs match the brute-force result
+
+    rng = np.random.default_rng(123)
+    n = 300
+    ac_arrays = _test_arrays(
+        rng.uniform(50, 54, n), rng.uniform(-3, 2, n), rng.uniform(10_000, 30_000, n)
+    )
+    hor_dist_m, vert_dist_ft = 20_000, 2_000
+
+    expected = [
+        (i, j)
+        for i, j in itertools.combinations(range(n), 2)
+        if horizontal_distance(
+            ac_arrays.lat[i], ac_arrays.lon[i], ac_arrays.lat[j], ac_arrays.lon[j]
+        )
+        <= hor_dist_m
+        and abs(ac_arrays.altitude[i] - ac_arrays.altitude[j]) <= vert_dist_ft
+    ]
+
+    index = SpatialIndex(ac_arrays, hor_dist_m, vert_dist_ft)
+    i, j = index.pairs()
+    assert expected
+    assert list(zip(i.tolist(), j.tolist())) == expected